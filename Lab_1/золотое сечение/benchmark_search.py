@@ -0,0 +1,37 @@
+"""Число вычислений функции в методах одномерного поиска.
+
+Для F из main.py на [0.1, 1] и разных eps: итерации и вычисления функции
+у золотого сечения, Фибоначчи и Брента, а также сколько вычислений делала
+прежняя схема золотого сечения (F(x1) и F(x2) заново на каждой итерации).
+
+Запуск:  python benchmark_search.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.one_dim import brent, fibonacci_search, golden_section_search  # noqa: E402
+from decision_theory.trajectory import NullSink  # noqa: E402
+from main import F  # noqa: E402
+
+METHODS = (("золотое сечение", golden_section_search), ("Фибоначчи", fibonacci_search), ("Брент", brent))
+
+
+def main(a=0.1, b=1.0, tolerances=(1e-3, 1e-6, 1e-9, 1e-12)):
+    print(f"{'eps':>7} | {'метод':>16} | {'итер.':>5} | {'вычислений':>10} | {'прежняя схема':>13} | "
+          f"{'время, мс':>9} | {'x*':>18}")
+    print("-" * 96)
+    for eps in tolerances:
+        for title, method in METHODS:
+            start = time.perf_counter()
+            x_min, _, iterations, _, evaluations = method(F, a, b, eps, trajectory=NullSink())
+            elapsed = 1000 * (time.perf_counter() - start)
+            before = f"{2 * iterations + 1:13d}" if method is golden_section_search else f"{'':13}"
+            print(f"{eps:7.0e} | {title:>16} | {iterations:5d} | {evaluations:10d} | {before} | "
+                  f"{elapsed:9.3f} | {x_min:18.15f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
+import sys
+from pathlib import Path
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Пакет decision_theory из корня репозитория
+from decision_theory.one_dim import brent, fibonacci_search, golden_section_search, newton_method, tangent_method  # noqa: E402
 
 
 # Определяем целевую функцию F(x)
@@ -17,79 +22,10 @@ def F_2derivative(x):
     return np.exp(x) + 2 / (x ** 3)
 
 
-# Метод золотого сечения
-def golden_section_search(a, b, eps=1e-6):
-    phi = 1.618
-    iter_count = 0
-    x_values = []
-
-    x1 = b - (b - a) / phi
-    x2 = a + (b - a) / phi
-
-    while abs(b - a) > eps:
-        if F(x1) < F(x2):
-            b = x2
-            x2 = x1
-            x1 = b - (b - a) / phi
-        else:
-            a = x1
-            x1 = x2
-            x2 = a + (b - a) / phi
-
-        x_values.append((a + b) / 2)
-        iter_count += 1
-
-    x_min = (a + b) / 2
-    return x_min, F(x_min), iter_count, x_values
-
-
-# Метод касательных
-def tangent_method(a, b, eps=1e-6):
-    i = 0
-    xm = 0
-    x_values = []
-
-    while abs(b - a) > eps:
-        xm = (a * F_derivative(a) - b * F_derivative(b) - F(a) + F(b)) / (F_derivative(a) - F_derivative(b))
-        x_values.append(xm)
-
-        if F_derivative(xm) > 0:
-            b = xm
-        else:
-            a = xm
-        i += 1
-
-    return xm, F(xm), i, x_values
-
-
-# Метод Ньютона
-def newton(x0, eps=1e-6):
-    xk = x0
-    iter = 0
-    x_values = [xk]
-
-    while True:
-        iter += 1
-        df1 = F_derivative(xk)
-        d2f1 = F_2derivative(xk)
-
-        if d2f1 == 0:
-            print("Вторая производная равна нулю, метод Ньютона не может быть применен.")
-            return None, None, iter, x_values
-
-        xk_1 = xk - (df1 / d2f1)
-        x_values.append(xk_1)
-
-        if abs(xk_1 - xk) < eps:
-            break
-
-        xk = xk_1
-
-    return xk_1, F(xk_1), iter, x_values
-
-
 # Функция для построения графиков
 def plot_results(a, b, golden_result, tangent_result, newton_result):
+    import matplotlib.pyplot as plt  # Только для графиков — сами методы его не загружают
+
     x = np.linspace(0.1, 1.5, 500)
     y = F(x)
 
@@ -103,10 +39,13 @@ def plot_results(a, b, golden_result, tangent_result, newton_result):
     plt.plot(tangent_result[0], tangent_result[1], 'go', label="Минимум (метод касательных)")
     plt.plot(newton_result[0], newton_result[1], 'bo', label="Минимум (метод Ньютона)")
 
-    # Итерации
-    plt.plot(golden_result[3], [F(x) for x in golden_result[3]], 'r--', label="Итерации (метод золотого сечения)")
-    plt.plot(tangent_result[3], [F(x) for x in tangent_result[3]], 'g--', label="Итерации (метод касательных)")
-    plt.plot(newton_result[3], [F(x) for x in newton_result[3]], 'b--', label="Итерации (метод Ньютона)")
+    # Итерации (траектория — приёмник или массив точек; пустая, если запись выключена)
+    for result, style, title in ((golden_result, 'r--', "метод золотого сечения"),
+                                 (tangent_result, 'g--', "метод касательных"),
+                                 (newton_result, 'b--', "метод Ньютона")):
+        points = np.asarray(result[3], dtype=float)
+        if len(points):
+            plt.plot(points, F(points), style, label=f"Итерации ({title})")
 
     plt.xlabel("x")
     plt.ylabel("F(x)")
@@ -123,19 +62,26 @@ if __name__ == "__main__":
     initial_x = 0.5
 
     print("Метод золотого сечения:")
-    x_min_gs, y_min_gs, iter_gs, x_vals_gs = golden_section_search(a, b)
+    x_min_gs, y_min_gs, iter_gs, x_vals_gs, evals_gs = golden_section_search(F, a, b)
     print('X min (golden section): ', x_min_gs)
     print('Y min (golden section): ', y_min_gs)
     print('Количество итераций (golden section): ', iter_gs)
+    print('Вычислений функции (golden section): ', evals_gs)
+
+    for title, method in (("Фибоначчи", fibonacci_search), ("Брента", brent)):
+        x_min, y_min, iterations, _, evaluations = method(F, a, b)
+        print(f"\nМетод {title}: x = {x_min}, F(x) = {y_min}, итераций {iterations}, вычислений функции {evaluations}")
 
     print("\nМетод касательных:")
-    x_min_sec, y_min_sec, iter_sec, x_vals_sec = tangent_method(a, b)
+    x_min_sec, y_min_sec, iter_sec, x_vals_sec = tangent_method(F, F_derivative, a, b)
     print('X min (tangent method): ', x_min_sec)
     print('Y min (tangent method): ', y_min_sec)
     print('Количество итераций (tangent method): ', iter_sec)
 
     print("\nМетод Ньютона:")
-    x_min_newton, y_min_newton, iter_newton, x_vals_newton = newton(initial_x)
+    x_min_newton, y_min_newton, iter_newton, x_vals_newton = newton_method(F_derivative, F_2derivative, initial_x, func=F)
+    if x_min_newton is None:
+        print("Вторая производная равна нулю, метод Ньютона не может быть применен.")
     print('X min (Newton method): ', x_min_newton)
     print('Y min (Newton method): ', y_min_newton)
     print('Количество итераций (Newton method): ', iter_newton)
@@ -1,5 +1,10 @@
+import sys
+from pathlib import Path
+
 import numpy as np
-import matplotlib.pyplot as plt
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Пакет decision_theory из корня репозитория
+from decision_theory.one_dim import CachedFunction, safeguarded_newton  # noqa: E402
 
 # Определяем функцию, её первую и вторую производные
 def f(x):
@@ -11,60 +16,45 @@ def f_prime(x):
 def f_double_prime(x):
     return np.exp(x) + 2 / (x**3)
 
-# Основная функция поиска экстремума методом касательных
-def tangent_method(x0, epsilon=1e-6):
-    iter_count = 0
-    x_values = [x0]
-
-    x_prev = x0
-
-    while True:
-        f_prime_x = f_prime(x_prev)
-        f_double_prime_x = f_double_prime(x_prev)
-
-        # Проверяем, что вторая производная положительна
-        if f_double_prime_x <= 0:
-            raise ValueError("Вторая производная должна быть положительной для выпуклой функции!")
+# Основная функция поиска экстремума методом касательных (Ньютона) для f'(x) = 0.
+# Решение — decision_theory.one_dim.safeguarded_newton: f, f', f'' в каждой точке вычисляются
+# один раз, а если f'' <= 0 или шаг выходит за отрезок bracket, выполняется
+# деление отрезка пополам вместо ошибки.
+# Возвращает (x, f(x), итерации, траектория, вычислений f, f', f'' всего)
+def tangent_method(x0, epsilon=1e-6, trajectory=None, bracket=(0.1, 2.0)):
+    fn = CachedFunction(f, f_prime, f_double_prime)
+    return safeguarded_newton(fn, *bracket, x0=x0, eps=epsilon, trajectory=trajectory)
 
-        # Обновляем значение x по методу Ньютона (касательных)
-        x_next = x_prev - f_prime_x / f_double_prime_x
+# Построим график функции и покажем точки итераций
+def plot_iterations(x_values):
+    import matplotlib.pyplot as plt  # Только для графика — сам метод его не загружает
 
-        # Линейная аппроксимация p_{k-1}(x)
-        p_current = f(x_prev) + f_prime_x * (x_next - x_prev)
+    x_vals = np.linspace(0.1, 2, 400)
+    f_vals = f(x_vals)
 
-        # Условие остановки
-        if abs(f(x_next) - p_current) < epsilon:
-            break
+    plt.plot(x_vals, f_vals, label='f(x) = e^x + 1/x', color='blue')
 
-        # Обновляем значения для следующей итерации
-        x_values.append(x_next)
-        x_prev = x_next
-        iter_count += 1
+    # Отметим точки, полученные на итерациях
+    points = np.asarray(x_values, dtype=float)
+    plt.scatter(points, f(points), color='red', zorder=5)
+    for i, x_val in enumerate(points):
+        plt.text(x_val, f(x_val), f'x_{i}', fontsize=12)
 
-    return x_next, f(x_next), iter_count, x_values
+    plt.xlabel('x')
+    plt.ylabel('f(x)')
+    plt.legend()
+    plt.title('График функции и точки итераций метода касательных')
+    plt.grid(True)
+    plt.show()
 
 # Пример использования метода
-x0 = 0.5  # Начальная точка
-extremum_x, extremum_f, iter_count, x_values = tangent_method(x0)
-
-print(f"Экстремум находится в точке x = {extremum_x}")
-print(f"Значение функции в экстремуме: f(x) = {extremum_f}")
-print(f"Количество итераций: {iter_count}")
-
-# Построим график функции и покажем точки итераций
-x_vals = np.linspace(0.1, 2, 400)
-f_vals = f(x_vals)
-
-plt.plot(x_vals, f_vals, label='f(x) = e^x + 1/x', color='blue')
+if __name__ == "__main__":
+    x0 = 0.5  # Начальная точка
+    extremum_x, extremum_f, iter_count, x_values, evaluations = tangent_method(x0)
 
-# Отметим точки, полученные на итерациях
-for i, x_val in enumerate(x_values):
-    plt.scatter(x_val, f(x_val), color='red', zorder=5)
-    plt.text(x_val, f(x_val), f'x_{i}', fontsize=12)
+    print(f"Экстремум находится в точке x = {extremum_x}")
+    print(f"Значение функции в экстремуме: f(x) = {extremum_f}")
+    print(f"Количество итераций: {iter_count}")
+    print(f"Вычислений f, f', f'' всего: {evaluations}")
 
-plt.xlabel('x')
-plt.ylabel('f(x)')
-plt.legend()
-plt.title('График функции и точки итераций метода касательных')
-plt.grid(True)
-plt.show()
+    plot_iterations(x_values)
@@ -0,0 +1,70 @@
+"""Сходимость методов Lab_2: прямой поиск, градиентные методы и L-BFGS.
+
+Задачи: функция f из main.py (n = 2) и расширенная функция Розенброка
+при n = 2, 10, 100, 1000 из точки (-1.2, 1, ...). Для каждого метода —
+итерации, вычисления функции и градиента, время, достигнутое значение
+и норма градиента. Медленные методы ограничены по числу итераций.
+
+Запуск:  python benchmark_convergence.py [n ...]
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.multidim.direct import gradient_const, hook_jiws  # noqa: E402
+from decision_theory.multidim.functions import rosenbrock_objective, rosenbrock_start  # noqa: E402
+from decision_theory.multidim.gradient_methods import conjugate_gradient, lbfgs, steepest_descent  # noqa: E402
+from decision_theory.multidim.objective import Objective  # noqa: E402
+from decision_theory.trajectory import NullSink  # noqa: E402
+from main import f, f_batch, value_and_grad_f  # noqa: E402
+
+EPSILON = 1e-6
+MAX_ITER = 10000
+HOOKE_JEEVES_MAX_N = 100  # Исследующий поиск в n = 1000 требует ~2000 вычислений на шаг
+
+# Траектории не записываются (NullSink): замеряется только сам метод
+METHODS = [
+    ("Хук-Дживс", lambda x0, objective, sink: hook_jiws(x0, 0.5, EPSILON, objective=objective,
+                                                        max_iter=MAX_ITER, trajectory=sink)),
+    ("пост. шаг", lambda x0, objective, sink: gradient_const(x0, 0.5, EPSILON, objective=objective,
+                                                             max_iter=MAX_ITER, trajectory=sink)),
+    ("спуск+Армихо", lambda x0, objective, sink: steepest_descent(x0, EPSILON, objective, max_iter=MAX_ITER,
+                                                                  trajectory=sink)),
+    ("спуск+Вольфе", lambda x0, objective, sink: steepest_descent(x0, EPSILON, objective, "wolfe",
+                                                                  max_iter=MAX_ITER, trajectory=sink)),
+    ("сопр. град.", lambda x0, objective, sink: conjugate_gradient(x0, EPSILON, objective, max_iter=MAX_ITER,
+                                                                   trajectory=sink)),
+    ("L-BFGS", lambda x0, objective, sink: lbfgs(x0, EPSILON, objective, max_iter=MAX_ITER, trajectory=sink)),
+]
+
+
+def problems(dimensions):
+    yield "lab2", 2, np.array([1.0, 2.0]), lambda: Objective(f, value_and_grad=value_and_grad_f, batch_func=f_batch)
+    for n in dimensions:
+        yield "rosenbrock", n, rosenbrock_start(n), rosenbrock_objective
+
+
+def main(dimensions=(2, 10, 100, 1000)):
+    print(f"{'задача':>10} | {'n':>5} | {'метод':>12} | {'итер.':>6} | {'значений':>8} | {'градиентов':>10} | "
+          f"{'время, с':>9} | {'f':>10} | {'||g||':>9}")
+    print("-" * 106)
+    for name, n, x0, make in problems(dimensions):
+        for title, method in METHODS:
+            if title == "Хук-Дживс" and n > HOOKE_JEEVES_MAX_N:
+                continue
+            objective = make()
+            start = time.perf_counter()
+            x, value, iterations, _, _ = method(x0, objective, NullSink())
+            elapsed = time.perf_counter() - start
+            evaluations, gradients = objective.evaluations, objective.gradient_evaluations
+            grad_norm = np.linalg.norm(objective.grad(x))
+            print(f"{name:>10} | {n:5d} | {title:>12} | {iterations:6d} | {evaluations:8d} | {gradients:10d} | "
+                  f"{elapsed:9.3f} | {value:10.3e} | {grad_norm:9.2e}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or (2, 10, 100, 1000))
@@ -0,0 +1,50 @@
+"""Число вычислений функции в методе Хука-Дживса при росте размерности.
+
+Целевая функция — плохо обусловленная квадратичная sum (i + 1) * (x_i - 1)^2.
+Для каждой размерности n: итерации, запрошенные значения, реальные
+вычисления с LRU-кэшем и без него, а также сколько вычислений сделала бы
+прежняя схема, перебиравшая все 3^n - 1 соседних точек решётки на итерации.
+
+Запуск:  python benchmark_hooke_jeeves.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.multidim.direct import hook_jiws  # noqa: E402
+from decision_theory.multidim.objective import CachedObjective  # noqa: E402
+
+
+def quadratic(x):
+    x = np.asarray(x, dtype=float)
+    return float(np.sum(np.arange(1, x.size + 1) * (x - 1) ** 2))
+
+
+def quadratic_batch(points):
+    points = np.asarray(points, dtype=float)
+    return np.sum(np.arange(1, points.shape[1] + 1) * (points - 1) ** 2, axis=1)
+
+
+def main(dimensions=(2, 4, 8, 16, 32, 64)):
+    print(f"{'n':>4} | {'итер.':>6} | {'запрошено':>10} | {'вычислено':>10} | {'без кэша':>10} | "
+          f"{'3^n схема':>12} | {'время, с':>9} | {'f*':>10}")
+    print("-" * 94)
+    for n in dimensions:
+        x0 = np.random.default_rng(n).uniform(-2.0, 2.0, n)
+        cached = CachedObjective(quadratic, quadratic_batch)
+        start = time.perf_counter()
+        x, value, iterations, _, evaluations = hook_jiws(x0, 0.5, 1e-6, objective=cached)
+        elapsed = time.perf_counter() - start
+        uncached = CachedObjective(quadratic, quadratic_batch, maxsize=0)
+        hook_jiws(x0, 0.5, 1e-6, objective=uncached)
+        lattice = f"{iterations * 3 ** n:12d}" if n <= 16 else f"{float(iterations) * 3.0 ** n:12.2e}"
+        print(f"{n:4d} | {iterations:6d} | {cached.calls:10d} | {evaluations:10d} | {uncached.evaluations:10d} | "
+              f"{lattice} | {elapsed:9.4f} | {value:10.2e}")
+
+
+if __name__ == "__main__":
+    main()
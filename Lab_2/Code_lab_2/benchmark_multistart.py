@@ -0,0 +1,45 @@
+"""Мультистарт: время и число запусков в зависимости от числа процессов.
+
+Задачи: функция Химмельблау (4 минимума), Растригина в 4 измерениях
+(решётка локальных минимумов, останов по patience) и Розенброка в 100
+измерениях (дорогие запуски, на которых виден выигрыш от пула).
+
+Запуск:  python benchmark_multistart.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.multidim.functions import himmelblau_objective, rastrigin_objective, rosenbrock_objective  # noqa: E402
+from decision_theory.multidim.multistart import Multistart  # noqa: E402
+
+CASES = [
+    ("himmelblau", himmelblau_objective, "lbfgs", [-5.0] * 2, [5.0] * 2, 256, {}),
+    ("rastrigin-4", rastrigin_objective, "lbfgs", [-5.12] * 4, [5.12] * 4, 512, {"patience": 200, "radius": 0.3}),
+    ("rosenbrock-100", rosenbrock_objective, "lbfgs", [-2.0] * 100, [2.0] * 100, 32, {}),
+]
+
+
+def main():
+    workers = sorted({1, 2, os.cpu_count() or 1})
+    print(f"Ядер: {os.cpu_count()}")
+    print(f"{'задача':>15} | {'проц.':>5} | {'стартов':>7} | {'отсечено':>8} | {'бассейнов':>9} | "
+          f"{'время, с':>9} | {'стартов/с':>9} | {'лучшее f':>10}")
+    print("-" * 94)
+    for name, factory, minimizer, lower, upper, count, options in CASES:
+        for max_workers in workers:
+            driver = Multistart(factory, minimizer, lower, upper, count=count, **options)
+            start = time.perf_counter()
+            results = list(driver.run(max_workers=max_workers))
+            elapsed = time.perf_counter() - start
+            pruned = sum(result.pruned for result in results)
+            stop = " (останов)" if driver.stopped_early else ""
+            print(f"{name:>15} | {max_workers:5d} | {len(results):7d} | {pruned:8d} | {len(driver.basins):9d} | "
+                  f"{elapsed:9.3f} | {len(results) / elapsed:9.1f} | {driver.best.fun:10.3e}{stop}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Сравнение методов Lab_2 по числу вычислений, а не только итераций.
+
+Для функции f из main.py: метод Хука-Дживса и градиентный спуск с разными
+источниками градиента — аналитическим совместным value_and_grad,
+центральными и прямыми разностями, дуальными числами.
+
+Запуск:  python benchmark_objective.py
+"""
+import time
+
+from main import gradient_const, hook_jiws, make_objective
+
+X0 = [1, 2]
+LAMB = 0.5
+EPSILON = 1e-6
+
+
+def main():
+    print(f"{'метод':>18} | {'градиент':>9} | {'итер.':>6} | {'значений':>8} | {'из кэша':>7} | "
+          f"{'градиентов':>10} | {'время, с':>9} | {'f*':>12}")
+    print("-" * 100)
+    runs = [("Хук-Дживс", hook_jiws, None)]
+    runs += [("градиентный спуск", gradient_const, gradient) for gradient in (None, "central", "forward", "dual")]
+    for title, method, gradient in runs:
+        objective = make_objective(gradient)
+        start = time.perf_counter()
+        _, value, iterations, _, _ = method(X0, LAMB, EPSILON, objective=objective)
+        elapsed = time.perf_counter() - start
+        source = "—" if method is hook_jiws else gradient or "analytic"
+        print(f"{title:>18} | {source:>9} | {iterations:6d} | {objective.evaluations:8d} | {objective.hits:7d} | "
+              f"{objective.gradient_evaluations:10d} | {elapsed:9.4f} | {value:12.8f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,108 +1,77 @@
 import math as m
-import matplotlib.pyplot as plt
+import sys
+from pathlib import Path
+
 import numpy as np
-# Целевая функция
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.multidim.direct import gradient_const, hook_jiws  # noqa: E402
+from decision_theory.multidim.gradient_methods import conjugate_gradient, lbfgs, steepest_descent  # noqa: E402
+from decision_theory.multidim.objective import Objective  # noqa: E402
+from decision_theory.multidim.surface import CACHE_DIR, cached_surface  # noqa: E402
+EXP_CAP = 230.0  # exp(230) ~ 1e100 — ограничение показателя экспоненты от переполнения
+# Целевая функция. Записана через numpy, поэтому принимает точку, массив точек
+# по столбцам (x[0], x[1] — векторы) и дуальные числа для автоматического дифференцирования
 def f(x):
-    try:
-        exp_part = m.exp(x[0] ** 2 + x[1] ** 2)
-    except OverflowError:
-        exp_part = float('inf')  # Обработка переполнения
-    exp_part = min(exp_part, 1e100)  # Ограничение значения экспоненты
-    return exp_part + m.log(4 + x[1] ** 2)
-# Градиент целевой функции
-def grad_f(x):
-    try:
-        exp_part = m.exp(x[0] ** 2 + x[1] ** 2)
-    except OverflowError:
-        exp_part = float('inf')  # Обработка переполнения
-    exp_part = min(exp_part, 1e100)  # Ограничение значения экспоненты
+    exp_part = np.exp(np.minimum(x[0] ** 2 + x[1] ** 2, EXP_CAP))
+    return exp_part + np.log(4 + x[1] ** 2)
+# Значение и градиент с общей экспонентой
+def value_and_grad_f(x):
+    exp_part = m.exp(min(x[0] ** 2 + x[1] ** 2, EXP_CAP))
+    value = exp_part + m.log(4 + x[1] ** 2)
     x1 = 2 * x[0] * exp_part
     x2 = 2 * x[1] * exp_part + (2 * x[1]) / (4 + x[1] ** 2)
-    # Нормализация градиента
-    norm = m.sqrt(x1 ** 2 + x2 ** 2)
-    if norm > 1e-10:  # Предотвращение деления на ноль
-        x1 /= norm
-        x2 /= norm
-    return [x1, x2]
-# Метод Хука-Дживса
-def hook_jiws(x0, lamb, epsilon, alpha=1):
-    xk = x0.copy()
-    lamb0 = lamb
-    iterations = 0
-    traj = [xk.copy()]  # Траектория точек
-    while lamb >= epsilon:
-        iterations += 1
-        p = 0
-        elems = [xk]
-        for i in range(len(xk)):
-            temp_elems = []
-            for elem in elems:
-                x1 = elem.copy()
-                x1[i] -= lamb
-                x2 = elem.copy()
-                x3 = elem.copy()
-                x3[i] += lamb
-                temp_elems.append(x1)
-                temp_elems.append(x2)
-                temp_elems.append(x3)
-            elems = elems + temp_elems
-            temp_elems.clear()
-        elems = [list(t) for t in set(tuple(e) for e in elems)]
-        elems.remove(xk)
-        func_values = [f(elem) for elem in elems]
-        min_f = min(func_values)
-        min_x = elems[func_values.index(min_f)]
-        f_x = f(xk)
-        if round(min_f, 6) >= round(f_x, 6):
-            p += 1
-            lamb = lamb - (lamb0 / m.exp(p))
-        else:
-            xk = xk
-            for i in range(len(min_x)):
-                min_x[i] -= xk[i]
-                min_x[i] *= alpha
-                xk[i] += min_x[i]
-            traj.append(xk.copy())
-            p = 0
-    return xk, f(xk), iterations, traj
-# Градиентный спуск
-def gradient_const(x0, lamb, epsilon):
-    xk = x0.copy()
-    xk_1 = xk.copy()
-    iterations = 1
-    traj = [xk.copy()]  # Траектория точек
-    g = grad_f(xk)
-    for i in range(len(xk)):
-        xk_1[i] = xk[i] - g[i] * lamb
-    while abs(f(xk_1) - f(xk)) >= epsilon:
-        iterations += 1
-        xk = xk_1.copy()
-        g = grad_f(xk)
-        for i in range(len(xk)):
-            xk_1[i] = xk[i] - g[i] * lamb
-        if f(xk_1) >= f(xk):
-            lamb /= 2
-        traj.append(xk.copy())
-    return xk_1, f(xk_1), iterations, traj
+    return value, np.array([x1, x2])
+# Градиент целевой функции (без нормализации)
+def grad_f(x):
+    return value_and_grad_f(x)[1]
+# Векторная версия f для массива точек (k, 2)
+def f_batch(points):
+    return f(np.asarray(points, dtype=float).T)
+# Целевая функция со счётчиками вычислений; gradient — запасной способ, если
+# не использовать аналитический value_and_grad_f
+def make_objective(gradient=None):
+    if gradient is None:
+        return Objective(f, value_and_grad=value_and_grad_f, batch_func=f_batch)
+    return Objective(f, batch_func=f_batch, gradient=gradient)
 # Построение графиков
-def plot_trajectories(hook_traj, grad_traj, func_range=10):
-    x = np.linspace(-func_range, func_range, 400)
-    y = np.linspace(-func_range, func_range, 400)
-    X, Y = np.meshgrid(x, y)
-    Z = np.array([[f([i, j]) for i, j in zip(x_row, y_row)] for x_row, y_row in zip(X, Y)])
-    plt.contourf(X, Y, Z, levels=50, cmap='viridis')
-    plt.colorbar(label="Уровень функции f(x)")
-    hook_traj = np.array(hook_traj)
-    grad_traj = np.array(grad_traj)
-    plt.plot(hook_traj[:, 0], hook_traj[:, 1], 'ro-', label="Хук-Дживс")
-    plt.plot(grad_traj[:, 0], grad_traj[:, 1], 'bo-', label="Градиентный спуск")
-    plt.scatter(hook_traj[0, 0], hook_traj[0, 1], color='k', label="Начальная точка")
-    plt.xlabel("x₁")
-    plt.ylabel("x₂")
-    plt.title("Траектории методов оптимизации")
-    plt.legend()
-    plt.grid()
-    plt.show()
+# Линии уровня f и траектории методов. Сетка resolution x resolution считается
+# векторно и кэшируется на диске (surface.py, cache_dir=None — без кэша).
+# filename — сохранить рисунок в файл через Agg без окна, иначе plt.show().
+# matplotlib импортируется только здесь — решение задач его не загружает
+def plot_trajectories(hook_traj, grad_traj, func_range=10, resolution=400, filename=None, cache_dir=CACHE_DIR):
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    x = np.linspace(-func_range, func_range, resolution)
+    y = np.linspace(-func_range, func_range, resolution)
+    Z = cached_surface(f, x, y, cache_dir)
+    if filename is None:
+        import matplotlib.pyplot as plt
+        fig = plt.figure()
+    else:
+        fig = Figure()
+        FigureCanvasAgg(fig)
+    ax = fig.gca()
+    contour = ax.contourf(x, y, Z, levels=50, cmap='viridis')
+    fig.colorbar(contour, ax=ax, label="Уровень функции f(x)")
+    # Траектории — приёмники из trajectory.py (или списки точек); пустые не рисуются
+    hook_traj = np.asarray(hook_traj)
+    grad_traj = np.asarray(grad_traj)
+    if len(hook_traj):
+        ax.plot(hook_traj[:, 0], hook_traj[:, 1], 'ro-', label="Хук-Дживс")
+        ax.scatter(hook_traj[0, 0], hook_traj[0, 1], color='k', label="Начальная точка")
+    if len(grad_traj):
+        ax.plot(grad_traj[:, 0], grad_traj[:, 1], 'bo-', label="Градиентный спуск")
+    ax.set_xlabel("x₁")
+    ax.set_ylabel("x₂")
+    ax.set_title("Траектории методов оптимизации")
+    ax.legend()
+    ax.grid()
+    if filename is None:
+        plt.show()
+    else:
+        fig.savefig(filename)
 # Основной код
 if __name__ == "__main__":
     x0 = [1, 2]  # Начальная точка
@@ -110,12 +79,24 @@ if __name__ == "__main__":
     epsilon = 1e-6  # Точность
     print(f"Начальная точка: {x0}")
     print(f"Начальное значение функции: {f(x0)}")
-    hook_res = hook_jiws(x0, lamb0, epsilon)
-    grad_res = gradient_const(x0, lamb0, epsilon)
+    hook_objective = make_objective()
+    grad_objective = make_objective()
+    hook_res = hook_jiws(x0, lamb0, epsilon, objective=hook_objective)
+    grad_res = gradient_const(x0, lamb0, epsilon, objective=grad_objective)
     print(
-        f"Метод Хука-Дживса: точка минимума = {hook_res[0]}, значение функции = {hook_res[1]}, итерации = {hook_res[2]}")
+        f"Метод Хука-Дживса: точка минимума = {hook_res[0]}, значение функции = {hook_res[1]}, "
+        f"итерации = {hook_res[2]}, вычислений функции = {hook_objective.evaluations}")
     print(
-        f"Градиентный спуск: точка минимума = {grad_res[0]}, значение функции = {grad_res[1]}, итерации = {grad_res[2]}")
-    plot_trajectories(hook_res[3], grad_res[3], func_range=2)
+        f"Градиентный спуск: точка минимума = {grad_res[0]}, значение функции = {grad_res[1]}, "
+        f"итерации = {grad_res[2]}, вычислений функции = {grad_objective.evaluations}, "
+        f"градиента = {grad_objective.gradient_evaluations}")
+    for title, method in (("Наискорейший спуск (Армихо)", steepest_descent),
+                          ("Сопряжённые градиенты", conjugate_gradient), ("L-BFGS", lbfgs)):
+        objective = make_objective()
+        res = method(x0, epsilon, objective)
+        print(f"{title}: точка минимума = {res[0]}, значение функции = {res[1]}, итерации = {res[2]}, "
+              f"вычислений функции = {objective.evaluations}")
+    # python main.py [рисунок.png] — сохранить график в файл вместо окна
+    plot_trajectories(hook_res[3], grad_res[3], func_range=2, filename=sys.argv[1] if len(sys.argv) > 1 else None)
 
 
@@ -0,0 +1,84 @@
+"""Методы штрафов: внешний штраф, логарифмический барьер, модифицированная функция Лагранжа.
+
+Две задачи:
+    min (x1 - 3)^2 + (x2 - 2)^2 при x1^2 + x2^2 <= 5, x1 + 2 x2 <= 4 — минимум (2, 1), f = 2;
+    min (x1 - 2)^4 + (x1 - 2 x2)^2 при x1^2 - x2 = 0 — минимум ~ (0.9456, 0.8941), f ~ 1.9462.
+Для каждого метода и внутреннего минимизатора печатается решение и число
+вычислений с тёплым стартом уровней (warm) и без него (cold).
+
+Запуск:  python main.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.constrained import Constraints, minimize_constrained  # noqa: E402
+from decision_theory.multidim.objective import Objective  # noqa: E402
+
+
+def f1(x):
+    return (x[0] - 3) ** 2 + (x[1] - 2) ** 2
+
+
+def f1_value_and_grad(x):
+    return f1(x), np.array([2 * (x[0] - 3), 2 * (x[1] - 2)])
+
+
+def g1(x):
+    # Оба неравенства одним вызовом; x — точка или точки по столбцам
+    return np.array([x[0] ** 2 + x[1] ** 2 - 5, x[0] + 2 * x[1] - 4])
+
+
+def g1_jac(x):
+    return np.array([[2 * x[0], 2 * x[1]], [1.0, 2.0]])
+
+
+def f2(x):
+    return (x[0] - 2) ** 4 + (x[0] - 2 * x[1]) ** 2
+
+
+def f2_value_and_grad(x):
+    return f2(x), np.array([4 * (x[0] - 2) ** 3 + 2 * (x[0] - 2 * x[1]), -4 * (x[0] - 2 * x[1])])
+
+
+def h2(x):
+    return np.array([x[0] ** 2 - x[1]])
+
+
+def h2_jac(x):
+    return np.array([[2 * x[0], -1.0]])
+
+
+PROBLEMS = (
+    ("неравенства", lambda: Objective(f1, value_and_grad=f1_value_and_grad),
+     lambda: Constraints(ineq=g1, ineq_jac=g1_jac, vectorized=True), [0.0, 0.0]),
+    ("равенство", lambda: Objective(f2, value_and_grad=f2_value_and_grad),
+     lambda: Constraints(eq=h2, eq_jac=h2_jac, vectorized=True), [2.0, 1.0]),
+)
+METHODS = (("внешний штраф", "exterior"), ("барьер", "barrier"), ("мод. Лагранжа", "augmented_lagrangian"))
+INNER = ("hook_jiws", "lbfgs")
+
+
+def main():
+    print(f"{'задача':>12} | {'метод':>13} | {'внутр.':>9} | {'старт':>5} | {'уровней':>7} | {'итераций':>8} | "
+          f"{'выч. f':>6} | {'время, мс':>9} | {'нарушение':>9} | {'f(x*)':>9} | x*")
+    print("-" * 125)
+    for problem, objective, constraints, x0 in PROBLEMS:
+        for title, method in METHODS:
+            for inner in INNER:
+                for warm in (True, False):
+                    start = time.perf_counter()
+                    result = minimize_constrained(x0, objective(), constraints(), method=method, inner=inner,
+                                                  warm_start=warm)
+                    elapsed = 1000 * (time.perf_counter() - start)
+                    print(f"{problem:>12} | {title:>13} | {inner:>9} | {'warm' if warm else 'cold':>5} | "
+                          f"{result.outer_iterations:7d} | {result.inner_iterations:8d} | {result.evaluations:6d} | "
+                          f"{elapsed:9.1f} | {result.violation:9.1e} | {result.fun:9.6f} | {np.round(result.x, 5)}")
+
+
+if __name__ == "__main__":
+    main()
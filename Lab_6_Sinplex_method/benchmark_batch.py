@@ -0,0 +1,40 @@
+"""Пропускная способность пакетного решения сценариев (batch.py) в зависимости от числа процессов.
+
+Сценарии — возмущения правых частей и коэффициентов цели одной плохо
+обусловленной задачи из benchmark_simplex.py.
+
+Запуск:  python benchmark_batch.py [число сценариев]
+"""
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Пакет decision_theory из корня репозитория
+
+from benchmark_simplex import ill_conditioned_lp  # noqa: E402
+from decision_theory.lp.batch import solve_batch  # noqa: E402
+
+
+def main(count=200, seed=2):
+    rng = np.random.default_rng(seed)
+    c, A_ub, b_ub, A_eq, b_eq, bounds = ill_conditioned_lp(100, 160, 20)
+    C = c * (1 + 0.02 * rng.normal(size=(count, c.size)))
+    B_ub = b_ub * (1 + 0.02 * rng.normal(size=(count, b_ub.size)))
+
+    cores = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, 8, cores} & set(range(1, cores + 1)))
+    print(f"Сценариев: {count}, ядер: {cores}")
+    print(f"{'процессов':>9} | {'время, с':>9} | {'сцен./с':>9} | {'ускорение':>9} | {'оптимальных':>11}")
+    print("-" * 59)
+    base = None
+    for max_workers in workers:
+        result = solve_batch(C, A_ub, B_ub, A_eq, b_eq, bounds, max_workers=max_workers)
+        base = base or result.scenarios_per_second
+        print(f"{max_workers:9d} | {result.time:9.3f} | {result.scenarios_per_second:9.1f} | "
+              f"{result.scenarios_per_second / base:9.2f} | {int((result.status == 0).sum()):11d}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
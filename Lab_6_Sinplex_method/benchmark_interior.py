@@ -0,0 +1,70 @@
+"""Метод внутренней точки против модифицированного симплекс-метода.
+
+Случайные задачи  max c^T x  при  A x <= b,  x >= 0  (A, b, c > 0, в каждом
+столбце A есть ненулевой элемент — решение ограничено) разного размера и
+плотности. Для каждой: время и итерации revised_simplex, метода внутренней
+точки (разложение нормальных уравнений "auto") и его же с crossover
+(итерации симплекс-метода после перехода к базису). |Δf| — расхождение
+значений цели с симплекс-методом; на самых больших задачах (m n больше
+SIMPLEX_LIMIT) симплекс-метод пропускается, и сравнение идёт с crossover.
+
+Запуск:  python benchmark_interior.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.lp.interior_point import linprog_interior  # noqa: E402
+from decision_theory.lp.revised_simplex import linprog_revised  # noqa: E402
+
+SIMPLEX_LIMIT = 2_000_000  # Наибольшее m * n для симплекс-метода
+
+CASES = [(50, 80, 1.0), (100, 150, 1.0), (200, 300, 1.0), (400, 600, 1.0),
+         (500, 800, 0.02), (1000, 1500, 0.005), (2000, 3000, 0.001), (5000, 8000, 0.0003)]
+
+
+def random_lp(m, n, density=1.0, seed=0):
+    rng = np.random.default_rng(seed)
+    if density < 1.0:
+        A = sp.random(m, n, density=density, random_state=seed, format="csr")
+        A = A + sp.csr_matrix((np.ones(n), (rng.integers(0, m, n), np.arange(n))), shape=(m, n))
+        A.data = rng.uniform(0.1, 1.0, A.nnz)
+    else:
+        A = rng.uniform(0.1, 1.0, (m, n))
+    return -rng.uniform(0.1, 1.0, n), A, rng.uniform(1.0, 10.0, m)
+
+
+def timed(solver, *args, **options):
+    start = time.perf_counter()
+    result = solver(*args, **options)
+    return time.perf_counter() - start, result
+
+
+def main(cases=CASES):
+    print(f"{'m x n':>12} | {'плотн.':>6} | {'симплекс, с':>11} | {'итер.':>6} | {'IPM, с':>8} | {'итер.':>5} | "
+          f"{'+crossover, с':>13} | {'пивотов':>7} | {'ускорение':>9} | {'|Δf|':>8}")
+    print("-" * 117)
+    for m, n, density in cases:
+        c, A, b = random_lp(m, n, density)
+        t_ipm, ipm = timed(linprog_interior, c, A, b)
+        t_cross, cross = timed(linprog_interior, c, A, b, crossover=True)
+        if m * n <= SIMPLEX_LIMIT:
+            t_rev, rev = timed(linprog_revised, c, A, b)
+            simplex = f"{t_rev:11.3f} | {rev.nit:6d}"
+            speedup = f"{t_rev / t_ipm:9.1f}"
+            diff = f"{abs(ipm.fun - rev.fun):8.1e}"
+        else:
+            simplex = f"{'—':>11} | {'—':>6}"
+            speedup = f"{'—':>9}"
+            diff = f"{abs(ipm.fun - cross.fun):8.1e}"
+        print(f"{m:>5} x {n:<5} | {density:6.4f} | {simplex} | {t_ipm:8.3f} | {ipm.nit:5d} | "
+              f"{t_cross:13.3f} | {cross.nit_crossover:7d} | {speedup} | {diff}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Чтение и запись задач ЛП в свободном формате MPS: время и пиковая память.
+
+Для случайных разреженных задач max c^T x, A x <= b, x >= 0 (m строк,
+n столбцов, nnz ненулевых — как generators.random_lp, но без плотного
+выбора позиций) замеряются write_mps и read_mps: время (без трассировки)
+и пик памяти (tracemalloc, отдельным запуском), размер файла. Прочитанная
+задача сверяется с исходной — наибольшее расхождение |Δ| по c, A и b.
+
+Запуск:  python benchmark_mps.py [m n nnz]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.lp.mps import read_mps, write_mps  # noqa: E402
+
+CASES = [(1000, 2000, 20_000), (5000, 10000, 100_000), (20000, 50000, 1_000_000)]
+
+
+def sparse_lp(m, n, nnz, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = np.concatenate([rng.integers(0, m, n), rng.integers(0, m, nnz - n)])
+    cols = np.concatenate([np.arange(n), rng.integers(0, n, nnz - n)])  # В каждом столбце есть элемент
+    A = sp.csr_matrix((rng.uniform(0.1, 1.0, nnz), (rows, cols)), shape=(m, n))
+    return dict(c=-rng.uniform(0.1, 1.0, n), A_ub=A, b_ub=rng.uniform(1.0, 10.0, m))
+
+
+def measure(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(cases=CASES):
+    print(f"{'m x n':>13} | {'ненулевых':>9} | {'файл, МБ':>8} | {'запись, с':>9} | {'пик, МБ':>8} | "
+          f"{'чтение, с':>9} | {'пик, МБ':>8} | |Δ|")
+    print("-" * 100)
+    for m, n, nnz in cases:
+        problem = sparse_lp(m, n, nnz)
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "problem.mps"
+            _, write_time, write_peak = measure(write_mps, path, **problem)
+            loaded, read_time, read_peak = measure(read_mps, path)
+            size = path.stat().st_size / 2 ** 20
+        gap = max(np.abs(loaded.c - problem["c"]).max(), np.abs(loaded.b_ub - problem["b_ub"]).max(),
+                  abs(loaded.A_ub - problem["A_ub"]).max())
+        print(f"{m:>6} x {n:<6}| {problem['A_ub'].nnz:9d} | {size:8.1f} | {write_time:9.3f} | "
+              f"{write_peak / 2 ** 20:8.2f} | {read_time:9.3f} | {read_peak / 2 ** 20:8.2f} | {gap:.1e}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        main([(int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3]))])
+    else:
+        main()
@@ -0,0 +1,113 @@
+"""Упрощение задачи ЛП (presolve) перед решением.
+
+Случайные задачи min c^T x с ядром core (доля строк и столбцов) и
+«обвесом», какой дают генераторы моделей: пустые строки, фиксированные
+переменные, строки-синглтоны (границы и фиксация переменных), избыточные
+неравенства по ограниченным переменным и доминируемые столбцы.
+Для каждой задачи: размер до и после presolve, число удалений по видам,
+время решения без presolve и с ним (вместе с presolve и postsolve) для
+модифицированного симплекс-метода и метода внутренней точки, выигрыш
+по времени и расхождение значений цели |Δf|.
+
+Запуск:  python benchmark_presolve.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.lp.interior_point import linprog_interior  # noqa: E402
+from decision_theory.lp.presolve import Presolve, linprog_presolved  # noqa: E402
+from decision_theory.lp.revised_simplex import linprog_revised  # noqa: E402
+
+CASES = [(200, 300, 0.5), (400, 600, 0.3), (1000, 1500, 0.2), (2000, 3000, 0.1)]
+SOLVERS = (("симплекс", linprog_revised), ("IPM", linprog_interior))
+
+
+def reducible_lp(m, n, core=0.2, seed=0):
+    rng = np.random.default_rng(seed)
+    n_core, m_core = max(2, int(core * n)), max(2, int(core * m))
+    n_fixed = n_dominated = (n - n_core) // 3
+    n_pinned = n - n_core - n_fixed - n_dominated  # Фиксируются строками-синглтонами x_j = v
+    m_eq = m_core // 10
+    m_empty = m_singleton = m_redundant = (m - m_core) // 4
+    m_bound = m - m_core - m_empty - m_singleton - m_redundant  # Границы x_j <= u строками-синглтонами
+
+    core_cols = np.arange(n_core)
+    fixed_cols = n_core + np.arange(n_fixed)
+    dominated_cols = n_core + n_fixed + np.arange(n_dominated)
+    pinned_cols = np.arange(n - n_pinned, n)
+
+    x0 = np.zeros(n)  # Допустимая точка
+    x0[core_cols] = rng.uniform(0.0, 1.0, n_core)
+    x0[fixed_cols] = rng.uniform(0.0, 1.0, n_fixed)
+    x0[pinned_cols] = rng.uniform(0.0, 1.0, n_pinned)
+    lb, ub = np.zeros(n), np.full(n, np.inf)
+    lb[fixed_cols] = ub[fixed_cols] = x0[fixed_cols]
+    # Вне ядра цены положительны: переменные без строк не делают задачу неограниченной
+    c = rng.uniform(0.1, 1.0, n)
+    c[core_cols] = -rng.uniform(0.1, 1.0, n_core)
+    c[fixed_cols] = rng.uniform(-1.0, 1.0, n_fixed)
+
+    # Ядро: неравенства с положительными коэффициентами (в каждом столбце ядра есть элемент)
+    density = min(1.0, 10.0 / n_core)
+    A_core = sp.random(m_core - m_eq, n, density=density, random_state=seed, format="csr")
+    A_core = A_core + sp.csr_matrix((np.ones(n_core), (rng.integers(0, m_core - m_eq, n_core), core_cols)),
+                                    shape=A_core.shape)
+    A_core.data = rng.uniform(0.1, 1.0, A_core.nnz)
+    b_core = A_core @ x0 + rng.uniform(0.5, 2.0, A_core.shape[0])
+    E = sp.random(m_eq, n, density=density, random_state=seed + 1, format="csr")
+    E = E[:, :n_core].tocsr()
+    E.data = rng.uniform(-1.0, 1.0, E.nnz)
+    E = sp.hstack([E, sp.csr_matrix((m_eq, n - n_core))]).tocsr()
+
+    rows = np.arange(m_bound)
+    bounded = rng.choice(core_cols, m_bound)
+    B = sp.csr_matrix((rng.uniform(0.5, 2.0, m_bound), (rows, bounded)), shape=(m_bound, n))
+    b_bound = B @ x0 + B.data * rng.uniform(0.0, 1.0, m_bound)
+    pinned = rng.choice(pinned_cols, m_singleton) if n_pinned else np.zeros(m_singleton, dtype=int)
+    P = sp.csr_matrix((rng.uniform(0.5, 2.0, m_singleton), (np.arange(m_singleton), pinned)),
+                      shape=(m_singleton, n))
+    # Избыточные строки: неотрицательные коэффициенты при переменных с границами из строк B
+    R = sp.random(m_redundant, n, density=min(1.0, 5.0 / max(m_bound, 1)), random_state=seed + 2, format="csr")
+    R = (R @ sp.diags(np.isin(np.arange(n), bounded).astype(float))).tocsr()
+    R.data = rng.uniform(0.1, 1.0, R.data.size)
+    upper = np.where(np.isin(np.arange(n), bounded), x0 + 1.0, 0.0)
+    b_redundant = R @ upper + 1.0
+
+    A_ub = sp.vstack([A_core, B, R, sp.csr_matrix((m_empty, n))]).tocsr()
+    b_ub = np.concatenate([b_core, b_bound, b_redundant, rng.uniform(0.0, 1.0, m_empty)])
+    A_eq = sp.vstack([E, P]).tocsr()
+    b_eq = A_eq @ x0
+    bounds = [(lo, None if np.isinf(hi) else hi) for lo, hi in zip(lb, ub)]
+    return dict(c=c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds)
+
+
+def timed(function, problem, **options):
+    start = time.perf_counter()
+    result = function(**problem, **options)
+    return time.perf_counter() - start, result
+
+
+def main(cases=CASES):
+    for m, n, core in cases:
+        problem = reducible_lp(m, n, core)
+        stats = Presolve(**problem).stats
+        (m0, n0, nnz0), (m1, n1, nnz1) = stats.original, stats.reduced
+        print(f"\nЗадача {m} x {n}, ядро {core:.0%}: строк {m0} -> {m1}, столбцов {n0} -> {n1}, "
+              f"ненулевых {nnz0} -> {nnz1}; presolve {1000 * stats.time:.1f} мс")
+        print("  удалено: " + ", ".join(f"{kind} {count}" for kind, count in sorted(stats.removed.items())))
+        for title, solver in SOLVERS:
+            t_plain, plain = timed(solver, problem)
+            t_pre, pre = timed(linprog_presolved, problem, solver=solver)
+            print(f"  {title:>8}: без presolve {t_plain:7.3f} с ({plain.nit:4d} итер.), "
+                  f"с presolve {t_pre:7.3f} с ({pre.nit:4d} итер.), выигрыш {t_plain - t_pre:7.3f} с "
+                  f"(x{t_plain / t_pre:.1f}), |Δf| = {abs(plain.fun - pre.fun):.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Сравнение табличного симплекс-метода (tableau.py) и модифицированного (revised_simplex.py).
+
+1. Случайные задачи  max c^T x  при  A x <= b,  x >= 0  с A, b, c > 0:
+   допустимый базис из дополнительных переменных, решение ограничено.
+2. Плохо обусловленные задачи с равенствами и двусторонними границами:
+   режимы big_m и two_phase (с масштабированием и без) по числу итераций,
+   размеру стандартной формы и времени.
+3. Повторное решение после малых изменений b или c: холодный старт
+   против тёплого (resolve от базиса предыдущего решения).
+
+Запуск:  python benchmark_simplex.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.lp.revised_simplex import RevisedSimplex  # noqa: E402
+from decision_theory.lp.tableau import simplex_method  # noqa: E402
+
+TABLE_LIMIT = 120  # Табличный метод на больших задачах работает слишком долго
+
+
+def random_lp(m, n, density=1.0, seed=0):
+    rng = np.random.default_rng(seed)
+    if density < 1.0:
+        A = sp.random(m, n, density=density, random_state=seed, format="csr")
+        A.data = rng.uniform(0.1, 1.0, A.nnz)
+    else:
+        A = rng.uniform(0.1, 1.0, (m, n))
+    b = rng.uniform(1.0, 10.0, m)
+    c = rng.uniform(0.1, 1.0, n)
+    return c, A, b
+
+
+def ill_conditioned_lp(m, n, m_eq, seed=0):
+    # Строки и столбцы масштабированы множителями 10^[-4, 4] и 10^[-3, 3]
+    rng = np.random.default_rng(seed)
+    A = sp.random(m + m_eq, n, density=min(1.0, 8 / n), random_state=seed, format="csr")
+    A.data = rng.uniform(-1.0, 1.0, A.nnz)
+    row_scale = 10.0 ** rng.uniform(-4, 4, m + m_eq)
+    col_scale = 10.0 ** rng.uniform(-3, 3, n)
+    A = (sp.diags(row_scale) @ A @ sp.diags(col_scale)).tocsr()
+    x0 = rng.uniform(0.0, 1.0, n) / col_scale  # Заведомо допустимая точка
+    lhs = A @ x0
+    b_ub = lhs[:m] + rng.uniform(0.0, 1.0, m) * row_scale[:m]
+    b_eq = lhs[m:]
+    c = rng.normal(size=n) * col_scale
+    bounds = list(zip(np.zeros(n), 2.0 / col_scale))
+    return c, A[:m], b_ub, A[m:], b_eq, bounds
+
+
+def build_table(c, A, b):
+    # Строка 0 — оценки (-c), далее строки ограничений [b_i | A_i | e_i]
+    A = A.toarray() if sp.issparse(A) else A
+    m, n = A.shape
+    table = [[0.0] + list(-c) + [0.0] * m]
+    for i in range(m):
+        slack = [0.0] * m
+        slack[i] = 1.0
+        table.append([b[i]] + list(A[i]) + slack)
+    return table
+
+
+def run_table(c, A, b):
+    start = time.perf_counter()
+    table, indexes = simplex_method(build_table(c, A, b), verbose=False)
+    return time.perf_counter() - start, len(indexes), table[0][0]
+
+
+def run_revised(c, A, b):
+    start = time.perf_counter()
+    result = RevisedSimplex(-c, A, b).solve()
+    return time.perf_counter() - start, result.nit, -result.fun
+
+
+def compare_modes():
+    modes = [("big_m", False), ("two_phase", False), ("two_phase", True)]
+    print(f"\n{'m x n (+ равенств)':>20} | {'режим':>9} | {'масшт.':>6} | {'стд. форма':>11} | "
+          f"{'итер.':>6} | {'I этап':>6} | {'время, с':>9} | {'f':>14}")
+    print("-" * 101)
+    for m, n, m_eq in [(50, 80, 10), (100, 160, 20), (200, 300, 40)]:
+        problem = ill_conditioned_lp(m, n, m_eq)
+        for method, scale in modes:
+            result = RevisedSimplex(*problem, method=method, scale=scale).solve()
+            shape = f"{result.shape[0]} x {result.shape[1]}"
+            print(f"{m:>5} x {n:<5} (+{m_eq:<3}) | {method:>9} | {str(scale):>6} | {shape:>11} | "
+                  f"{result.nit:6d} | {result.nit_phase1:6d} | {result.time:9.4f} | {result.fun:14.6f}")
+
+
+def compare_warm_start(repeats=5, seed=1):
+    rng = np.random.default_rng(seed)
+    print(f"\n{'m x n':>12} | {'изменение':>9} | {'холодный, с':>11} | {'итер.':>6} | "
+          f"{'тёплый, с':>10} | {'итер.':>6} | {'двойств.':>8} | {'доля':>6}")
+    print("-" * 90)
+    for m, n, m_eq in [(100, 160, 20), (200, 300, 40)]:
+        c, A_ub, b_ub, A_eq, b_eq, bounds = ill_conditioned_lp(m, n, m_eq)
+        solver = RevisedSimplex(c, A_ub, b_ub, A_eq, b_eq, bounds)
+        solver.solve()
+        for change in ("b", "c"):
+            cold_time = warm_time = 0.0
+            cold_nit = warm_nit = dual_nit = 0
+            for _ in range(repeats):
+                if change == "b":
+                    new = {"b_ub": b_ub * (1 + 0.01 * rng.normal(size=m))}
+                else:
+                    new = {"c": c * (1 + 0.01 * rng.normal(size=n))}
+                problem = dict(c=c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=bounds)
+                problem.update(new)
+                cold = RevisedSimplex(**problem).solve()
+                warm = solver.resolve(**new)
+                assert abs(cold.fun - warm.fun) <= 1e-6 * max(1.0, abs(cold.fun)), (cold.fun, warm.fun)
+                cold_time += cold.time
+                cold_nit += cold.nit
+                warm_time += warm.time
+                warm_nit += warm.nit
+                dual_nit += warm.nit_dual
+            solver.resolve(b_ub=b_ub, c=c)  # Возврат к исходной задаче
+            print(f"{m:>5} x {n:<5} | {change:>9} | {cold_time / repeats:11.4f} | {cold_nit // repeats:6d} | "
+                  f"{warm_time / repeats:10.4f} | {warm_nit // repeats:6d} | {dual_nit // repeats:8d} | "
+                  f"{warm_time / cold_time:6.1%}")
+
+
+def main():
+    print(f"{'m x n':>12} | {'плотн.':>6} | {'таблица, с':>11} | {'итер.':>6} | "
+          f"{'revised, с':>11} | {'итер.':>6} | {'ускорение':>9}")
+    print("-" * 82)
+    cases = [(10, 10, 1.0), (20, 30, 1.0), (40, 60, 1.0), (80, 120, 1.0), (120, 160, 1.0),
+             (500, 800, 1.0), (2000, 3000, 0.003), (3000, 5000, 0.002)]
+    for m, n, density in cases:
+        c, A, b = random_lp(m, n, density)
+        t_rev, it_rev, f_rev = run_revised(c, A, b)
+        if m <= TABLE_LIMIT:
+            t_tab, it_tab, f_tab = run_table(c, A, b)
+            assert abs(f_tab - f_rev) <= 1e-6 * max(1.0, abs(f_rev)), (f_tab, f_rev)
+            table_cols = f"{t_tab:11.4f} | {it_tab:6d}"
+            speedup = f"{t_tab / t_rev:9.1f}"
+        else:
+            table_cols = f"{'—':>11} | {'—':>6}"
+            speedup = f"{'—':>9}"
+        print(f"{m:>5} x {n:<5} | {density:6.3f} | {table_cols} | {t_rev:11.4f} | {it_rev:6d} | {speedup}")
+
+
+if __name__ == "__main__":
+    main()
+    compare_modes()
+    compare_warm_start()
@@ -0,0 +1,96 @@
+"""Загрузка крупных транспортных задач из файлов: время и пиковая память.
+
+Для каждой задачи m x n (доля существующих маршрутов density, остальные
+ячейки CSV пустые) во временной папке пишутся costs.csv и costs.npy, затем
+замеряются время и пик памяти (tracemalloc, отдельным запуском) для:
+    npy, mmap   — read_costs: отображение только для чтения, без копии;
+    npy         — np.load целиком (для сравнения);
+    csv         — read_costs: плотная матрица, заполняемая построчно;
+    csv, sparse — read_costs(sparse=True): построчно в буферы CSR;
+    csv -> npy  — csv_to_npy построчно через open_memmap;
+    план -> npz — write_allocation разреженного плана.
+Пик памяти сравнивается с размером плотной матрицы (m * n * 8 байт).
+
+Запуск:  python benchmark_loaders.py [m n [density]]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.transport.loaders import csv_to_npy, read_costs, write_allocation  # noqa: E402
+
+CASES = [(500, 2000, 0.3), (2500, 4000, 0.3)]  # Последняя — 10^7 ячеек
+
+
+def write_files(folder, m, n, density, seed=0):
+    # CSV пишется блоками строк, чтобы генератор сам не занял m * n памяти
+    rng = np.random.default_rng(seed)
+    npy = np.lib.format.open_memmap(str(folder / "costs.npy"), mode="w+", dtype=float, shape=(m, n))
+    with open(folder / "costs.csv", "w", encoding="utf-8") as file:
+        for start in range(0, m, 100):
+            block = rng.integers(1, 100, (min(100, m - start), n)).astype(float)
+            block[rng.random(block.shape) >= density] = np.inf
+            npy[start:start + block.shape[0]] = block
+            for row in block:
+                file.write(",".join("" if np.isinf(v) else str(int(v)) for v in row.tolist()) + "\n")
+    npy.flush()
+    del npy
+
+
+def measure(func, *args):
+    # Время — без трассировки, пик памяти — отдельным запуском под tracemalloc
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(cases=CASES):
+    print(f"{'m x n':>11} | {'операция':>12} | {'время, с':>9} | {'пик, МБ':>9} | {'пик / матрица':>13} | результат")
+    print("-" * 90)
+    for m, n, density in cases:
+        dense_size = m * n * 8
+        with tempfile.TemporaryDirectory() as folder:
+            folder = Path(folder)
+            write_files(folder, m, n, density)
+            csv, npy = folder / "costs.csv", folder / "costs.npy"
+            lanes = None
+            steps = [("npy, mmap", read_costs, npy), ("npy", np.load, npy), ("csv", read_costs, csv),
+                     ("csv, sparse", lambda path: read_costs(path, sparse=True), csv),
+                     ("csv -> npy", lambda path: csv_to_npy(path, folder / "copy.npy"), csv)]
+            for label, func, path in steps:
+                result, elapsed, peak = measure(func, path)
+                if sp.issparse(result):
+                    lanes = result
+                    info = f"CSR, {result.nnz} маршрутов"
+                elif isinstance(result, np.ndarray):
+                    info = f"{type(result).__name__}, {np.isfinite(result[0]).sum()} маршрутов в 1-й строке"
+                else:
+                    info = f"{result[0]} x {result[1]}"
+                del result
+                print(f"{m:>5} x {n:<5}| {label:>12} | {elapsed:9.3f} | {peak / 2 ** 20:9.2f} | "
+                      f"{peak / dense_size:13.3f} | {info}")
+            plan = sp.csr_matrix((np.ones(lanes.nnz), lanes.indices, lanes.indptr), shape=lanes.shape)
+            _, elapsed, peak = measure(write_allocation, folder / "plan.npz", plan)
+            print(f"{m:>5} x {n:<5}| {'план -> npz':>12} | {elapsed:9.3f} | {peak / 2 ** 20:9.2f} | "
+                  f"{peak / dense_size:13.3f} | {(folder / 'plan.npz').stat().st_size / 2 ** 20:.1f} МБ на диске")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3:
+        main([(int(sys.argv[1]), int(sys.argv[2]), float(sys.argv[3]) if len(sys.argv) > 3 else 0.3)])
+    else:
+        main()
@@ -0,0 +1,86 @@
+"""Сравнение методов начального опорного плана транспортной задачи.
+
+Для каждого метода на случайных сбалансированных задачах m x n измеряются:
+стоимость начального плана, время его построения, число итераций метода
+потенциалов до оптимума и полное время решения.
+
+С ключом --sparse решаются разреженные задачи (существует лишь доля маршрутов)
+сетевым симплекс-методом из network_simplex.py.
+
+Запуск:  python benchmark_transport.py [m [n]]
+         python benchmark_transport.py --sparse
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse as sp
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Пакет decision_theory из корня репозитория
+
+from decision_theory.transport.network_simplex import sparse_transport  # noqa: E402
+from decision_theory.transport.potentials import INITIAL_METHODS, potential_method  # noqa: E402
+
+
+def random_transport(m, n, seed=0, max_cost=100):
+    rng = np.random.default_rng(seed)
+    supply = rng.uniform(1.0, 100.0, m)
+    demand = rng.uniform(1.0, 100.0, n)
+    demand *= supply.sum() / demand.sum()
+    costs = rng.integers(1, max_cost, (m, n)).astype(float)
+    return costs, supply, demand
+
+
+def run(costs, supply, demand, method):
+    start = time.perf_counter()
+    allocation = INITIAL_METHODS[method](costs, list(supply), list(demand))
+    initial_time = time.perf_counter() - start
+    initial_cost = float(np.sum(allocation * costs))
+    iterations = potential_method(costs, allocation)
+    total_time = time.perf_counter() - start
+    return initial_cost, initial_time, iterations, total_time, float(np.sum(allocation * costs))
+
+
+def main(sizes):
+    print(f"{'m x n':>11} | {'метод':>10} | {'нач. стоимость':>14} | {'нач. план, с':>12} | "
+          f"{'итер.':>6} | {'всего, с':>9} | {'оптимум':>12}")
+    print("-" * 94)
+    for m, n in sizes:
+        costs, supply, demand = random_transport(m, n)
+        for method in INITIAL_METHODS:
+            initial_cost, initial_time, iterations, total_time, final_cost = run(costs, supply, demand, method)
+            print(f"{m:>5} x {n:<5}| {method:>10} | {initial_cost:14.1f} | {initial_time:12.3f} | "
+                  f"{iterations:6d} | {total_time:9.3f} | {final_cost:12.1f}")
+
+
+def random_lanes(m, n, density, seed=0, max_cost=100):
+    # Разреженная матрица стоимостей; спрос немного меньше запасов — задача открытая
+    rng = np.random.default_rng(seed)
+    lanes = sp.random(m, n, density=density, random_state=seed, format="csr")
+    lanes.data = rng.integers(1, max_cost, lanes.nnz).astype(float)
+    supply = rng.uniform(1.0, 100.0, m)
+    demand = rng.uniform(1.0, 100.0, n)
+    demand *= 0.9 * supply.sum() / demand.sum()
+    return lanes, supply, demand
+
+
+def sparse_main(cases):
+    print(f"{'m x n':>11} | {'дуг':>8} | {'итер.':>6} | {'время, с':>9} | {'стоимость':>12} | статус")
+    print("-" * 70)
+    for m, n, density in cases:
+        lanes, supply, demand = random_lanes(m, n, density)
+        flows, result = sparse_transport(lanes, supply, demand)
+        print(f"{m:>5} x {n:<5}| {lanes.nnz:8d} | {result.nit:6d} | {result.time:9.3f} | "
+              f"{result.cost:12.1f} | {result.message}")
+
+
+if __name__ == "__main__":
+    if "--sparse" in sys.argv:
+        sparse_main([(1000, 1000, 0.1), (1000, 1000, 1.0), (2000, 2000, 0.25), (5000, 5000, 0.04)])
+    elif len(sys.argv) > 1:
+        m = int(sys.argv[1])
+        n = int(sys.argv[2]) if len(sys.argv) > 2 else m
+        main([(m, n)])
+    else:
+        main([(50, 50), (200, 300), (500, 500)])
@@ -0,0 +1,16 @@
+"""Методы оптимизации и теории принятия решений из лабораторных работ.
+
+Подпакеты: one_dim (Lab_1), multidim (Lab_2), constrained (Lab_4), lp (Lab_6),
+transport (Lab_7).
+Решатели доступны по виду задачи и имени через реестр:
+
+    import decision_theory as dt
+    dt.names("lp")
+    result = dt.solve("lp", "revised_simplex", c, A_ub=A, b_ub=b)
+
+Импорт пакета ничего тяжёлого не загружает; matplotlib и tabulate нужны
+только для графиков и таблиц (python -m decision_theory ... --plot / --table).
+"""
+from .registry import KINDS, SIGNATURES, get, names, register, solve
+
+__version__ = "0.1.0"
@@ -0,0 +1,19 @@
+"""Ленивые реэкспорты подпакетов (PEP 562).
+
+Имя из exports импортируется из своего модуля при первом обращении, поэтому
+import decision_theory.lp не загружает scipy, пока решатель не нужен.
+"""
+import importlib
+
+
+def lazy_exports(package, exports):
+    # exports: имя -> модуль внутри package; возвращает (__getattr__, __dir__, __all__)
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        return getattr(importlib.import_module(f".{exports[name]}", package), name)
+
+    def __dir__():
+        return sorted(exports)
+
+    return __getattr__, __dir__, sorted(exports)
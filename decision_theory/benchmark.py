@@ -0,0 +1,265 @@
+"""Сравнение всех решателей реестра на воспроизводимых случайных задачах.
+
+Для каждого вида задач, каждого решателя реестра и каждой задачи набора
+(generators.py, фиксированные seed) замеряются:
+  * время — все repeats запусков, медиана и минимум (входные данные
+    строятся заново перед каждым запуском, вне замера);
+  * пиковая память — tracemalloc в отдельном запуске;
+  * итерации и вычисления функции — если решатель их сообщает;
+  * значение цели и ошибка, если решатель не справился; у точных решателей
+    (ЛП, транспортная задача) значение сверяется с лучшим среди решений со
+    статусом «оптимум» — расхождение отмечается в mismatch ("value"), а
+    статус не «оптимум» — отдельно ("status").
+Результаты пишутся в JSON (--output). С --baseline сравниваются с
+сохранённым ранее файлом: регрессия — минимальное время больше базового
+на tolerance процентов и не меньше чем на MIN_SLOWDOWN секунд, или ошибка
+(расхождение) там, где в базовом файле её не было. При регрессиях код
+возврата 1.
+
+Запуск:  python -m decision_theory.benchmark [--suite quick|full] [--kind lp] [--solver revised_simplex]
+             [--repeats 3] [--output results.json] [--baseline baseline.json] [--tolerance 20]
+             [--min-slowdown 5]
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable
+
+from . import generators, registry
+
+MIN_SLOWDOWN = 5e-3  # Замедление меньше этого (с) — шум замера, а не регрессия
+EXACT_KINDS = ("lp", "transport")  # Решатели находят глобальный оптимум — значения цели должны совпасть
+AGREEMENT_TOL = 1e-6  # Относительный допуск совпадения значений цели
+MISMATCH = {"value": "значение цели расходится с другими решателями",
+            "status": "решатель не нашёл оптимум"}
+
+
+@dataclass
+class Case:
+    kind: str
+    name: str
+    setup: Callable  # () -> (args, kwargs): свежие входные данные решателя
+    metrics: Callable  # результат решателя -> dict(fun, iterations, evaluations)
+    params: dict = field(default_factory=dict)
+
+
+def _tuple_metrics(result):
+    # Одномерные и многомерные методы: (x, f(x), итерации, траектория, вычислений)
+    return dict(fun=float(result[1]), iterations=int(result[2]), evaluations=int(result[4]))
+
+
+def _lp_metrics(result):
+    return dict(fun=float(result.fun), iterations=int(result.nit), evaluations=None, status=int(result.status))
+
+
+def _constrained_metrics(result):
+    return dict(fun=float(result.fun), iterations=int(result.inner_iterations),
+                evaluations=int(result.evaluations), status=0 if result.success else 1)
+
+
+def one_dim_case(function, a, b, eps=1e-8):
+    from .one_dim.functions import FUNCTIONS
+
+    func, derivative, second = FUNCTIONS[function]
+    return Case("one_dim", f"{function} [{a}, {b}]",
+                lambda: ((func, a, b, eps), dict(derivative=derivative, second_derivative=second)),
+                _tuple_metrics, dict(function=function, a=a, b=b, eps=eps))
+
+
+def multidim_case(function, n, seed=0, max_iter=5000):
+    def setup():
+        objective, x0 = generators.test_function(function, n, seed)
+        return (x0, objective), dict(max_iter=max_iter)
+
+    return Case("multidim", f"{function} n={n}", setup, _tuple_metrics,
+                dict(function=function, n=n, seed=seed, max_iter=max_iter))
+
+
+def lp_case(m, n, density=1.0, seed=0):
+    problem = generators.random_lp(m, n, density, seed)
+    return Case("lp", f"random {m}x{n} d={density:g}", lambda: ((), problem), _lp_metrics,
+                dict(m=m, n=n, density=density, seed=seed))
+
+
+def transport_case(m, n, density=1.0, seed=0):
+    from .transport.potentials import plan_cost
+
+    costs, supply, demand = generators.random_transport(m, n, density, seed)
+
+    def metrics(allocation):
+        return dict(fun=plan_cost(costs, allocation), iterations=None, evaluations=None)
+
+    return Case("transport", f"random {m}x{n} d={density:g}", lambda: ((costs, supply, demand), {}), metrics,
+                dict(m=m, n=n, density=density, seed=seed))
+
+
+def constrained_case(n, m, seed=0):
+    def setup():
+        objective, constraints, x0 = generators.random_constrained(n, m, seed)
+        return (x0, objective, constraints), {}
+
+    return Case("constrained", f"projection n={n} m={m}", setup, _constrained_metrics,
+                dict(n=n, m=m, seed=seed))
+
+
+def suite(name):
+    """Задачи набора: quick — секунды на всё, full — крупные задачи."""
+    full = name == "full"
+    cases = [one_dim_case("lab1", 0.1, 1.0), one_dim_case("quartic", 0.5, 2.0)]
+    cases += [multidim_case("rosenbrock", 2), multidim_case("rosenbrock", 10),
+              multidim_case("rastrigin", 20), multidim_case("quadratic", 50)]
+    cases += [lp_case(50, 80), lp_case(300, 500, 0.02)]
+    cases += [transport_case(20, 30), transport_case(60, 80, 0.2)]
+    cases += [constrained_case(10, 20)]
+    if full:
+        cases += [multidim_case("rosenbrock", 100), multidim_case("quadratic", 100)]
+        cases += [lp_case(200, 300), lp_case(1000, 1500, 0.005)]
+        cases += [transport_case(100, 150), transport_case(300, 400, 0.05)]
+        cases += [constrained_case(30, 60)]
+    return cases
+
+
+def run_case(case, solver_name, repeats=3):
+    """Запись результатов одного решателя на одной задаче (dict для JSON)."""
+    solver = registry.get(case.kind, solver_name)
+    record = dict(kind=case.kind, solver=solver_name, case=case.name, params=case.params, error=None,
+                  mismatch=False)
+    times = []
+    try:
+        for _ in range(repeats):
+            args, kwargs = case.setup()
+            start = time.perf_counter()
+            result = solver(*args, **kwargs)
+            times.append(time.perf_counter() - start)
+        record.update(case.metrics(result))
+        args, kwargs = case.setup()
+        tracemalloc.start()
+        try:
+            solver(*args, **kwargs)
+            record["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    except Exception as error:  # Сбой решателя — тоже результат сравнения
+        record["error"] = f"{type(error).__name__}: {error}"
+    record["times"] = times
+    record["time"] = statistics.median(times) if times else None
+    record["best"] = min(times) if times else None
+    return record
+
+
+def run(cases, kinds=None, solvers=None, repeats=3, progress=None):
+    records = []
+    for case in cases:
+        if kinds and case.kind not in kinds:
+            continue
+        first = len(records)
+        for name in registry.names(case.kind):
+            if solvers and name not in solvers:
+                continue
+            records.append(run_case(case, name, repeats))
+        _check_agreement(records[first:])
+        if progress is not None:
+            for record in records[first:]:
+                progress(record)
+    return records
+
+
+def _check_agreement(records):
+    # Значения цели точных решателей одной задачи сверяются с наименьшим среди
+    # оптимальных (status 0); задачи набора имеют оптимум, так что другой статус
+    # (лимит итераций, неограниченность) — расхождение своего вида
+    solved = [r for r in records if r["kind"] in EXACT_KINDS and not r["error"]]
+    optimal = [r for r in solved if r.get("status", 0) == 0]
+    for record in solved:
+        record["mismatch"] = "status" if record.get("status", 0) != 0 else False
+    if not optimal:
+        return
+    best = min(r["fun"] for r in optimal)
+    for record in optimal:
+        record["mismatch"] = "value" if record["fun"] - best > AGREEMENT_TOL * (1 + abs(best)) else False
+
+
+def _key(record):
+    return record["kind"], record["solver"], record["case"]
+
+
+def compare(records, baseline, tolerance=20.0, min_slowdown=MIN_SLOWDOWN):
+    """Регрессии относительно baseline (список записей): [(запись, базовая запись, причина)]."""
+    base = {_key(record): record for record in baseline}
+    regressions = []
+    for record in records:
+        old = base.get(_key(record))
+        if old is None:
+            continue
+        if record["error"] and not old["error"]:
+            regressions.append((record, old, "ошибка"))
+        elif record["mismatch"] and not old.get("mismatch"):
+            regressions.append((record, old, MISMATCH[record["mismatch"]]))
+        elif record["best"] is not None and old["best"] is not None \
+                and record["best"] > old["best"] * (1 + tolerance / 100) \
+                and record["best"] - old["best"] >= min_slowdown:
+            regressions.append((record, old, f"медленнее в {record['best'] / old['best']:.2f} раза"))
+    return regressions
+
+
+def environment():
+    import numpy
+    import scipy
+
+    return dict(python=platform.python_version(), platform=platform.platform(), numpy=numpy.__version__,
+                scipy=scipy.__version__, timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"))
+
+
+def _print_record(record):
+    if record["error"]:
+        print(f"{record['kind']:>11} | {record['solver']:>26} | {record['case']:>24} | {record['error']}")
+        return
+    memory = record["peak_memory"] / 2 ** 20
+    iterations = "-" if record["iterations"] is None else record["iterations"]
+    evaluations = "-" if record["evaluations"] is None else record["evaluations"]
+    print(f"{record['kind']:>11} | {record['solver']:>26} | {record['case']:>24} | {1000 * record['time']:10.2f} | "
+          f"{memory:8.2f} | {iterations:>7} | {evaluations:>7} | {record['fun']:.6g}"
+          + (f"  <- {MISMATCH[record['mismatch']]}" if record["mismatch"] else ""))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m decision_theory.benchmark",
+                                     description="Сравнение решателей реестра на случайных задачах.")
+    parser.add_argument("--suite", choices=("quick", "full"), default="quick")
+    parser.add_argument("--kind", action="append", choices=list(registry.KINDS), help="вид задач (можно несколько)")
+    parser.add_argument("--solver", action="append", help="имя решателя (можно несколько)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="JSON-файл результатов")
+    parser.add_argument("--baseline", help="JSON-файл прошлых результатов для сравнения")
+    parser.add_argument("--tolerance", type=float, default=20.0, help="допустимое замедление, %%")
+    parser.add_argument("--min-slowdown", type=float, default=1000 * MIN_SLOWDOWN,
+                        help="замедление меньше этого (мс) не считается регрессией")
+    args = parser.parse_args(argv)
+
+    print(f"{'вид':>11} | {'решатель':>26} | {'задача':>24} | {'время, мс':>10} | {'пик, МБ':>8} | "
+          f"{'итер.':>7} | {'выч.':>7} | f")
+    print("-" * 125)
+    records = run(suite(args.suite), args.kind, args.solver, args.repeats, progress=_print_record)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(dict(environment=environment(), suite=args.suite, repeats=args.repeats, results=records),
+                      file, ensure_ascii=False, indent=1)
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)["results"]
+    regressions = compare(records, baseline, args.tolerance, args.min_slowdown / 1000)
+    for record, old, reason in regressions:
+        print(f"РЕГРЕССИЯ {'/'.join(_key(record))}: {reason} "
+              f"({1000 * (old['best'] or 0):.2f} -> {1000 * (record['best'] or 0):.2f} мс)", file=sys.stderr)
+    print(f"\nСравнение с {args.baseline}: регрессий {len(regressions)} (допуск {args.tolerance:g}%).")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,313 @@
+"""Командная строка: python -m decision_theory (или decision-theory после установки).
+
+    decision-theory list [вид]
+    decision-theory one_dim brent --function lab1 --interval 0.1 1
+    decision-theory multidim lbfgs --function rosenbrock --x0 -1.2 1 --plot path.png
+    decision-theory lp revised_simplex problem.json --table
+    decision-theory lp interior_point problem.mps --output solution.csv
+    decision-theory transport network_simplex problem.json
+    decision-theory transport network_simplex costs.npy --supply s.csv --demand d.csv --output plan.npz
+
+Функция задаётся встроенным именем или как модуль:атрибут (производные —
+--derivative / --second-derivative). Задачи ЛП и транспортные задачи —
+JSON-файлы (или "-" для stdin):
+    ЛП: {"c": [...], "A_ub": [[...]], "b_ub": [...], "A_eq": ..., "b_eq": ..., "bounds": [[0, null], ...]}
+    транспортная: {"costs": [[...]], "supply": [...], "demand": [...]}, null в costs — маршрута нет.
+Задача ЛП может быть файлом свободного формата MPS (.mps), а транспортная —
+матрицей стоимостей .npy / .npz / .csv с --supply и --demand
+(transport/loaders.py; --sparse — CSV в разреженную матрицу). --output
+сохраняет решение: ЛП — CSV (lp/mps.py), транспортная — план .npy / .npz / .csv.
+Ответ печатается в JSON; --table и --plot подгружают tabulate и matplotlib
+только при запросе. --trace FILE пишет события итераций строками JSON ("-" —
+в stderr), --profile печатает в stderr итерации и время по этапам решателя,
+--cprofile — 20 самых дорогих функций по cProfile (observers.py).
+"""
+import argparse
+import importlib
+import json
+import sys
+
+from . import registry
+
+MULTIDIM_FUNCTIONS = ("rosenbrock", "himmelblau", "rastrigin")
+
+
+def _load(spec):
+    module, _, attr = spec.partition(":")
+    if not attr:
+        raise SystemExit(f"Ожидается модуль:атрибут, получено {spec!r}.")
+    return getattr(importlib.import_module(module), attr)
+
+
+def _read_json(path):
+    if path == "-":
+        return json.load(sys.stdin)
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _number(value):
+    value = float(value)
+    return value if value == value and abs(value) != float("inf") else None
+
+
+def _numbers(values):
+    return [_number(v) for v in values]
+
+
+def _print_table(rows, headers):
+    from tabulate import tabulate
+
+    print(tabulate(rows, headers=headers, floatfmt=".6g"))
+
+
+def _observer(args):
+    # Приёмники событий по --trace, --profile, --cprofile; None — решатель без наблюдателя
+    from .observers import JSONLinesObserver, Observers, PhaseProfile, ProfileObserver
+
+    sinks = []
+    if args.trace:
+        sinks.append(JSONLinesObserver(sys.stderr if args.trace == "-" else args.trace))
+    if args.profile:
+        sinks.append(PhaseProfile())
+    if args.cprofile:
+        return ProfileObserver(*sinks)
+    return Observers(*sinks) if sinks else None
+
+
+def _report(observer):
+    from .observers import JSONLinesObserver, PhaseProfile, ProfileObserver
+
+    for sink in observer.observers:
+        if isinstance(sink, PhaseProfile):
+            print(sink.report(), file=sys.stderr)
+        elif isinstance(sink, JSONLinesObserver):
+            sink.close()
+    if isinstance(observer, ProfileObserver):
+        observer.print_stats(20, stream=sys.stderr)
+
+
+def _plot_one_dim(func, a, b, trajectory, filename):
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    x = np.linspace(a, b, 400)
+    points = np.asarray(trajectory.points(), dtype=float).ravel()
+    fig = Figure(figsize=(8, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(x, [func(t) for t in x], label="f(x)")
+    ax.plot(points, [func(t) for t in points], "o-", ms=3, alpha=0.7, label="итерации")
+    ax.set_xlabel("x")
+    ax.legend()
+    fig.savefig(filename, dpi=120)
+
+
+def _plot_multidim(factory, trajectory, filename):
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    points = np.asarray(trajectory.points(), dtype=float)
+    low, high = points.min(axis=0), points.max(axis=0)
+    margin = np.maximum(0.25 * (high - low), 0.5)
+    xs = np.linspace(low[0] - margin[0], high[0] + margin[0], 200)
+    ys = np.linspace(low[1] - margin[1], high[1] + margin[1], 200)
+    X, Y = np.meshgrid(xs, ys)
+    # Отдельная целевая функция, чтобы сетка не попала в счётчики решения
+    Z = factory().batch(np.column_stack([X.ravel(), Y.ravel()])).reshape(X.shape)
+    fig = Figure(figsize=(8, 7))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.contour(X, Y, np.log1p(Z - Z.min()), levels=30, cmap="viridis")
+    ax.plot(points[:, 0], points[:, 1], "o-", color="red", ms=3, label="траектория")
+    ax.set_xlabel("x1")
+    ax.set_ylabel("x2")
+    ax.legend()
+    fig.savefig(filename, dpi=120)
+
+
+def _one_dim(args):
+    from .one_dim.functions import FUNCTIONS
+    from .trajectory import ArraySink
+
+    if args.function in FUNCTIONS:
+        func, derivative, second_derivative = FUNCTIONS[args.function]
+    else:
+        func, derivative, second_derivative = _load(args.function), None, None
+    derivative = _load(args.derivative) if args.derivative else derivative
+    second_derivative = _load(args.second_derivative) if args.second_derivative else second_derivative
+    a, b = args.interval
+    trajectory = ArraySink()
+    x, value, iterations, _, evaluations = registry.solve(
+        "one_dim", args.method, func, a, b, args.eps, derivative=derivative,
+        second_derivative=second_derivative, trajectory=trajectory, observer=args.observer)
+    result = {"x": _number(x) if x is not None else None, "fun": _number(value) if value is not None else None,
+              "nit": iterations, "evaluations": evaluations}
+    if args.table:
+        _print_table([[args.method, result["x"], result["fun"], iterations, evaluations]],
+                     ["метод", "x*", "f(x*)", "итерации", "вычислений"])
+    if args.plot:
+        _plot_one_dim(func, a, b, trajectory, args.plot)
+    return result
+
+
+def _multidim(args):
+    import numpy as np
+
+    from .multidim import functions
+    from .multidim.objective import Objective
+    from .trajectory import ArraySink
+
+    if args.function in MULTIDIM_FUNCTIONS:
+        factory = getattr(functions, f"{args.function}_objective")
+    else:
+        func = _load(args.function)
+
+        def factory():
+            return Objective(func)
+    objective = factory()
+    trajectory = ArraySink()
+    x, value, iterations, _, _ = registry.solve(
+        "multidim", args.method, np.array(args.x0, dtype=float), objective,
+        max_iter=args.max_iter, epsilon=args.eps, trajectory=trajectory, observer=args.observer)
+    result = {"x": _numbers(x), "fun": _number(value), "nit": iterations,
+              "evaluations": objective.evaluations, "gradient_evaluations": objective.gradient_evaluations}
+    if args.table:
+        _print_table([[f"x{i + 1}", v] for i, v in enumerate(result["x"])], ["переменная", "значение"])
+    if args.plot:
+        if len(args.x0) != 2:
+            raise SystemExit("График строится только для двух переменных.")
+        _plot_multidim(factory, trajectory, args.plot)
+    return result
+
+
+def _lp(args):
+    mps = None
+    if args.problem.lower().endswith(".mps"):
+        from .lp.mps import read_mps
+
+        mps = read_mps(args.problem)
+        problem = mps.linprog_args()
+    else:
+        problem = _read_json(args.problem)
+    if "bounds" in problem and problem["bounds"] is not None:
+        problem["bounds"] = [tuple(b) if b is not None else (0, None) for b in problem["bounds"]]
+    lp = registry.solve("lp", args.method, **problem, observer=args.observer)
+    result = {"status": lp.status, "message": lp.message, "x": _numbers(lp.x),
+              "fun": _number(lp.fun if mps is None else mps.objective(lp)), "nit": lp.nit}
+    if args.output:
+        from .lp.mps import write_solution
+
+        write_solution(args.output, lp, mps)
+    if lp.presolve is not None:
+        result["presolve"] = {"original": list(lp.presolve.original), "reduced": list(lp.presolve.reduced),
+                              "removed": lp.presolve.removed, "time": lp.presolve.time}
+    if args.table:
+        _print_table([[f"x{i + 1}", v] for i, v in enumerate(result["x"])], ["переменная", "значение"])
+    return result
+
+
+def _transport(args):
+    import numpy as np
+    import scipy.sparse as sp
+
+    if args.problem.lower().endswith(".json") or args.problem == "-":
+        problem = _read_json(args.problem)
+        costs = np.array([[np.inf if c is None else c for c in row] for row in problem["costs"]], dtype=float)
+        supply, demand = problem["supply"], problem["demand"]
+    else:
+        from .transport.loaders import load_transport
+
+        if not (args.supply and args.demand):
+            raise SystemExit("Для матрицы стоимостей из файла нужны --supply и --demand.")
+        costs, supply, demand = load_transport(args.problem, args.supply, args.demand, sparse=args.sparse)
+    from .transport.potentials import plan_cost
+
+    allocation = registry.solve("transport", args.method, costs, supply, demand, observer=args.observer)
+    result = {"cost": plan_cost(costs, allocation)}
+    if args.output:
+        from .transport.loaders import write_allocation
+
+        write_allocation(args.output, allocation)  # Разреженный план пишется без плотной копии
+    if not args.output or args.table:
+        # Для JSON и таблицы нужен плотный план
+        allocation = allocation.toarray() if sp.issparse(allocation) else np.asarray(allocation, dtype=float)
+    if not args.output:
+        result = {"allocation": allocation.tolist(), **result}
+    if args.table:
+        _print_table([[f"A{i + 1}", *row] for i, row in enumerate(allocation)],
+                     ["", *(f"B{j + 1}" for j in range(allocation.shape[1]))])
+    return result
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog="decision-theory", description="Решатели лабораторных работ.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    listing = commands.add_parser("list", help="решатели в реестре")
+    listing.add_argument("kind", nargs="?", choices=list(registry.KINDS))
+
+    one_dim = commands.add_parser("one_dim", help="одномерная минимизация на отрезке")
+    one_dim.add_argument("method")
+    one_dim.add_argument("--function", default="lab1", help="lab1, quartic или модуль:атрибут")
+    one_dim.add_argument("--derivative", help="модуль:атрибут")
+    one_dim.add_argument("--second-derivative", help="модуль:атрибут")
+    one_dim.add_argument("--interval", nargs=2, type=float, default=(0.1, 1.0), metavar=("A", "B"))
+    one_dim.add_argument("--eps", type=float, default=1e-6)
+
+    multidim = commands.add_parser("multidim", help="многомерная безусловная минимизация")
+    multidim.add_argument("method")
+    multidim.add_argument("--function", default="rosenbrock", help=f"{', '.join(MULTIDIM_FUNCTIONS)} "
+                                                                   "или модуль:атрибут")
+    multidim.add_argument("--x0", nargs="+", type=float, default=[-1.2, 1.0])
+    multidim.add_argument("--eps", type=float, default=1e-6)
+    multidim.add_argument("--max-iter", type=int)
+
+    lp = commands.add_parser("lp", help="задача линейного программирования из JSON")
+    lp.add_argument("method")
+    lp.add_argument("problem", help="JSON-файл, - или файл MPS (.mps)")
+
+    transport = commands.add_parser("transport", help="транспортная задача из JSON")
+    transport.add_argument("method")
+    transport.add_argument("problem", help="JSON-файл, - или матрица стоимостей .npy / .npz / .csv")
+    transport.add_argument("--supply", help="запасы (.npy или текст) для матрицы стоимостей из файла")
+    transport.add_argument("--demand", help="потребности (.npy или текст)")
+    transport.add_argument("--sparse", action="store_true", help="CSV стоимостей в разреженную матрицу")
+
+    for command in (one_dim, multidim, lp, transport):
+        command.add_argument("--table", action="store_true", help="таблица ответа (нужен tabulate)")
+        command.add_argument("--trace", metavar="FILE", help="события итераций в JSON lines (- — stderr)")
+        command.add_argument("--profile", action="store_true", help="итерации и время по этапам (в stderr)")
+        command.add_argument("--cprofile", action="store_true", help="профиль cProfile решения (в stderr)")
+    for command in (lp, transport):
+        command.add_argument("--output", metavar="FILE", help="сохранить решение (транспортная задача — "
+                                                              "без плана в JSON ответа)")
+    for command in (one_dim, multidim):
+        command.add_argument("--plot", metavar="FILE", help="сохранить график (нужен matplotlib)")
+    return parser
+
+
+COMMANDS = {"one_dim": _one_dim, "multidim": _multidim, "lp": _lp, "transport": _transport}
+
+
+def main(argv=None):
+    args = _parser().parse_args(argv)
+    try:
+        if args.command == "list":
+            kinds = [args.kind] if args.kind else list(registry.KINDS)
+            for kind in kinds:
+                print(f"{kind}: {', '.join(registry.names(kind))}")
+                print(f"    {registry.SIGNATURES[kind]}")
+            return 0
+        args.observer = _observer(args)
+        result = COMMANDS[args.command](args)
+    except (ValueError, RuntimeError) as error:
+        print(f"Ошибка: {error}", file=sys.stderr)
+        return 1
+    if args.observer is not None:
+        _report(args.observer)
+    if not args.table:
+        print(json.dumps(result, ensure_ascii=False))
+    return 0
@@ -0,0 +1,68 @@
+"""Холодный старт решения без вывода графиков и таблиц.
+
+Каждая задача решается в новом процессе интерпретатора: замеряется полное
+время процесса (медиана по repeats запускам) и проверяется, что ни
+matplotlib, ни tabulate не импортировались. Для сравнения — пустой запуск
+python и импорт numpy / scipy.sparse.
+
+Запуск:  python -m decision_theory.cold_start [repeats]
+Код возврата 1, если решение без --plot / --table подгрузило лишние модули.
+"""
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY = ("numpy", "scipy", "matplotlib", "tabulate")
+FORBIDDEN = ("matplotlib", "tabulate")
+
+_REPORT = "import sys, json; print(json.dumps([m for m in {heavy!r} if m in sys.modules]))"
+
+SCRIPTS = {
+    "python": "pass",
+    "import numpy": "import numpy",
+    "import scipy.sparse": "import scipy.sparse",
+    "import decision_theory": "import decision_theory",
+    "one_dim brent": (
+        "import decision_theory as dt\n"
+        "from decision_theory.one_dim.functions import lab1\n"
+        "dt.solve('one_dim', 'brent', lab1, 0.1, 1.0)"),
+    "multidim lbfgs": (
+        "import numpy as np, decision_theory as dt\n"
+        "from decision_theory.multidim.functions import rosenbrock_objective\n"
+        "dt.solve('multidim', 'lbfgs', np.array([-1.2, 1.0]), rosenbrock_objective())"),
+    "lp revised_simplex": (
+        "import decision_theory as dt\n"
+        "dt.solve('lp', 'revised_simplex', [-3, -5], A_ub=[[1, 0], [0, 2], [3, 2]], b_ub=[4, 12, 18])"),
+    "transport network_simplex": (
+        "import decision_theory as dt\n"
+        "dt.solve('transport', 'network_simplex', [[4, 8, 1], [2, 5, 6]], [30, 40], [20, 30, 20])"),
+}
+
+
+def measure(script, repeats=5):
+    code = f"{script}\n{_REPORT.format(heavy=HEAVY)}"
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), json.loads(output.splitlines()[-1])
+
+
+def main(repeats=5):
+    print(f"{'запуск':>27} | {'время, мс':>9} | загружены")
+    print("-" * 70)
+    failed = False
+    for title, script in SCRIPTS.items():
+        elapsed, loaded = measure(script, repeats)
+        extra = [m for m in loaded if m in FORBIDDEN]
+        failed |= bool(extra)
+        note = "  <- лишние модули" if extra else ""
+        print(f"{title:>27} | {1000 * elapsed:9.1f} | {', '.join(loaded) or '-'}{note}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
@@ -0,0 +1,10 @@
+"""Условная минимизация методами штрафов (Lab_4)."""
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "Constraints": "penalty",
+    "ConstrainedResult": "penalty",
+    "minimize_constrained": "penalty",
+    "penalized": "penalty",
+    "SOLVERS": "solvers",
+})
@@ -0,0 +1,251 @@
+"""Условная минимизация методами штрафов (Lab_4).
+
+min f(x) при h(x) = 0, g(x) <= 0 сводится к последовательности безусловных
+задач min F_k(x), которые решает любой минимизатор из multidim.minimizers:
+    exterior — внешний штраф f + mu/2 (||h||^2 + ||max(g, 0)||^2), mu растёт;
+    barrier — логарифмический барьер f - mu sum log(-g) + ||h||^2 / (2 mu),
+        mu убывает, начальная точка строго допустима;
+    augmented_lagrangian — модифицированная функция Лагранжа (Пауэлл-Хестенс-
+        Рокафеллар) с обновлением множителей; mu растёт, только если
+        нарушение ограничений убывает медленно.
+Каждая внутренняя задача стартует из решения предыдущей, внутренняя точность
+ужесточается по уровням, а состояние минимизатора переносится: шаг прямого
+поиска — по масштабу последнего сдвига, память L-BFGS — целиком. Число
+внутренних решений ограничено max_outer. observer (observers.py) получает
+на каждом уровне f(x) и сдвиг решения, а итерации внутреннего минимизатора —
+как вложенное решение.
+"""
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from ..multidim.gradient_methods import LBFGSHistory
+from ..multidim.minimizers import MINIMIZERS
+from ..multidim.objective import Objective
+from ..trajectory import ArraySink, TrajectorySink
+
+METHODS = ("exterior", "barrier", "augmented_lagrangian")
+
+# Начальный параметр штрафа по методам
+DEFAULT_MU = {"exterior": 10.0, "barrier": 1.0, "augmented_lagrangian": 10.0}
+
+
+class Constraints:
+    """Ограничения h(x) = 0 и g(x) <= 0; каждая группа — одним векторным вызовом.
+
+    eq(x), ineq(x) — массивы значений всех ограничений группы; eq_jac(x),
+    ineq_jac(x) — матрицы Якоби (m, n); без них — центральные разности
+    значений ограничений (2n точек одним пакетом).
+    vectorized=True — функции принимают и точки по столбцам (n, k), возвращая
+    (m, k): пакет точек (исследующий поиск, разностный градиент) считается
+    одним вызовом. Значения кэшируются по точкам: уровни штрафа и обновление
+    множителей их не пересчитывают. evaluations — число вычисленных точек.
+    """
+
+    def __init__(self, eq=None, ineq=None, eq_jac=None, ineq_jac=None, vectorized=False, maxsize=4096):
+        self.eq = eq
+        self.ineq = ineq
+        self.eq_jac = eq_jac
+        self.ineq_jac = ineq_jac
+        self.vectorized = vectorized
+        self.maxsize = maxsize
+        self.cache = {}
+        self.evaluations = 0
+
+    @staticmethod
+    def _group(func, x, columns=None):
+        if func is None:
+            return np.zeros(0) if columns is None else np.zeros((0, columns))
+        values = np.asarray(func(x), dtype=float)
+        return np.atleast_1d(values) if columns is None else values.reshape(-1, columns)
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        key = tuple(x.tolist())
+        if key not in self.cache:
+            self.evaluations += 1
+            if len(self.cache) >= self.maxsize:
+                self.cache.pop(next(iter(self.cache)))
+            self.cache[key] = (self._group(self.eq, x), self._group(self.ineq, x))
+        return self.cache[key]
+
+    def batch(self, points):
+        # Значения в строках points: (h, g) формы (m_eq, k), (m_ineq, k)
+        points = np.asarray(points, dtype=float)
+        if not self.vectorized:
+            pairs = [self(x) for x in points]
+            return np.array([h for h, _ in pairs]).T.reshape(-1, len(points)), \
+                np.array([g for _, g in pairs]).T.reshape(-1, len(points))
+        self.evaluations += len(points)
+        return self._group(self.eq, points.T, len(points)), self._group(self.ineq, points.T, len(points))
+
+    def jacobians(self, x):
+        x = np.asarray(x, dtype=float)
+        n = x.size
+        if (self.eq is None or self.eq_jac is not None) and (self.ineq is None or self.ineq_jac is not None):
+            eq_jac = np.zeros((0, n)) if self.eq is None else np.atleast_2d(self.eq_jac(x))
+            ineq_jac = np.zeros((0, n)) if self.ineq is None else np.atleast_2d(self.ineq_jac(x))
+            return eq_jac, ineq_jac
+        step = np.finfo(float).eps ** (1 / 3) * np.maximum(1.0, np.abs(x))
+        h, g = self.batch(np.vstack([x + np.diag(step), x - np.diag(step)]))
+        return (h[:, :n] - h[:, n:]) / (2 * step), (g[:, :n] - g[:, n:]) / (2 * step)
+
+
+def violation(h, g):
+    # Наибольшее нарушение ограничений
+    return float(max(np.max(np.abs(h), initial=0.0), np.max(g, initial=0.0)))
+
+
+def _terms(method, h, g, mu, lam, nu):
+    # Штраф и его производные по h и g; h, g — векторы (m,) или столбцы точек (m, k)
+    if method == "exterior":
+        positive = np.maximum(g, 0.0)
+        value = 0.5 * mu * (np.sum(h * h, axis=0) + np.sum(positive * positive, axis=0))
+        return value, mu * h, mu * positive
+    if method == "barrier":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            value = -mu * np.sum(np.log(-g), axis=0) + np.sum(h * h, axis=0) / (2 * mu)
+            return np.where(np.all(g < 0, axis=0), value, np.inf), h / mu, -mu / g
+    shifted = np.maximum(nu + mu * g.T, 0.0).T  # Множители сдвинутых неравенств
+    value = (h.T @ lam + 0.5 * mu * np.sum(h * h, axis=0)
+             + (np.sum(shifted * shifted, axis=0) - nu @ nu) / (2 * mu))
+    return value, (lam + mu * h.T).T, shifted
+
+
+def penalized(objective, constraints, method, mu, lam=None, nu=None):
+    """Objective штрафной функции одного уровня.
+
+    Значения и градиенты f берутся из кэша objective (общего для всех уровней),
+    ограничения — из кэша constraints. Градиент штрафа собирается по правилу
+    цепочки через матрицы Якоби ограничений, поэтому разности не пересекают
+    барьер.
+    """
+    lam = np.zeros(0) if lam is None else lam
+    nu = np.zeros(0) if nu is None else nu
+
+    def func(x):
+        h, g = constraints(x)
+        value = float(_terms(method, h, g, mu, lam, nu)[0])
+        return value if np.isinf(value) else objective(x) + value  # Вне барьера f не вычисляется
+
+    batch_func = None
+    if constraints.vectorized:
+        def batch_func(points):
+            h, g = constraints.batch(points)
+            values = _terms(method, h, g, mu, lam, nu)[0]
+            finite = np.isfinite(values)
+            if np.any(finite):
+                values[finite] += objective.batch(points[finite])
+            return values
+
+    def value_and_grad(x):
+        h, g = constraints(x)
+        value, d_h, d_g = _terms(method, h, g, mu, lam, nu)
+        if np.isinf(value):
+            return np.inf, np.zeros_like(x)
+        f_x, grad = objective.value_and_grad(x)
+        eq_jac, ineq_jac = constraints.jacobians(x)
+        return f_x + float(value), grad + eq_jac.T @ d_h + ineq_jac.T @ d_g
+
+    return Objective(func, value_and_grad=value_and_grad, batch_func=batch_func)
+
+
+@dataclass
+class ConstrainedResult:
+    x: np.ndarray
+    fun: float  # f(x) без штрафа
+    violation: float  # Наибольшее нарушение ограничений
+    success: bool
+    mu: float  # Параметр штрафа последнего уровня
+    outer_iterations: int  # Число внутренних решений (уровней штрафа)
+    inner_iterations: int  # Сумма итераций внутреннего минимизатора
+    evaluations: int  # Вычислений f
+    constraint_evaluations: int  # Вычислений ограничений (точек)
+    eqlin: np.ndarray = field(default_factory=lambda: np.zeros(0))  # Множители при h
+    ineqlin: np.ndarray = field(default_factory=lambda: np.zeros(0))  # Множители при g
+    trajectory: Optional[TrajectorySink] = None  # Решения уровней
+
+
+def minimize_constrained(x0, objective, constraints, method="augmented_lagrangian", inner="lbfgs", mu=None,
+                         growth=10.0, max_outer=20, tol=1e-6, epsilon=1e-6, inner_max_iter=None,
+                         warm_start=True, trajectory=None, observer=None, **inner_options):
+    """Внешний цикл метода штрафов.
+
+    objective — Objective (или функция f(x)), constraints — Constraints;
+    inner — имя минимизатора из multidim.minimizers, inner_options — его
+    параметры. mu на каждом уровне умножается на growth (барьер — делится).
+    Останов: нарушение не больше tol и сдвиг решения за уровень не больше
+    sqrt(tol) (1 + ||x||), для барьера ещё и mu * число неравенств не больше
+    tol; иначе — после max_outer внутренних решений.
+    warm_start=False — каждый уровень из x0 с исходным состоянием минимизатора.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Неизвестный метод штрафов {method!r}, допустимы: {', '.join(METHODS)}.")
+    if inner not in MINIMIZERS:
+        raise ValueError(f"Неизвестный минимизатор {inner!r}, допустимы: {', '.join(MINIMIZERS)}.")
+    if not isinstance(objective, Objective):
+        objective = Objective(objective)
+    minimizer = MINIMIZERS[inner]
+    x0 = np.array(x0, dtype=float)
+    x = x0.copy()
+    h, g = constraints(x)
+    if method == "barrier" and np.any(g >= 0):
+        raise ValueError("Барьерному методу нужна строго допустимая начальная точка (g(x0) < 0).")
+    mu = DEFAULT_MU[method] if mu is None else mu
+    lam, nu = np.zeros_like(h), np.zeros_like(g)
+    start_evaluations = objective.evaluations
+    traj = ArraySink() if trajectory is None else trajectory
+    traj.record(x)
+
+    options = dict(inner_options)
+    first_step = options.get("lamb", 0.5)
+    history = LBFGSHistory(x.size, options.pop("memory", 10)) if inner == "lbfgs" and warm_start else None
+
+    if observer is not None:
+        observer.start(method)
+        options["observer"] = observer
+    inner_iterations = 0
+    current = violation(h, g)
+    success = False
+    outer = 0
+    while outer < max_outer:
+        outer += 1
+        inner_epsilon = max(epsilon, 10.0 ** -outer)  # Неточные решения на первых уровнях
+        if history is not None:
+            options["history"] = history
+        level = penalized(objective, constraints, method, mu, lam, nu)
+        x_new, _, iterations, _, _ = minimizer(x if warm_start else x0, level, max_iter=inner_max_iter,
+                                               epsilon=inner_epsilon, **options)
+        inner_iterations += iterations
+        moved = float(np.linalg.norm(x_new - x))
+        x = np.asarray(x_new, dtype=float)
+        traj.record(x)
+        h, g = constraints(x)
+        previous, current = current, violation(h, g)
+        if warm_start and inner in ("hook_jiws", "gradient_const"):
+            # Следующий уровень начинается с шага порядка последнего сдвига решения
+            options["lamb"] = min(first_step, max(moved, 10 * inner_epsilon))
+
+        if observer is not None:
+            observer.event(outer, objective(x), step=moved, phase="outer")
+
+        if method == "augmented_lagrangian":
+            lam = lam + mu * h
+            nu = np.maximum(nu + mu * g, 0.0)
+        # Решение допустимо и перестало смещаться между уровнями
+        success = current <= tol and moved <= np.sqrt(tol) * (1 + np.linalg.norm(x))
+        if method == "barrier":
+            success = success and mu * g.size <= tol
+        if success:
+            break
+        if method == "barrier":
+            mu /= growth
+        elif method == "exterior" or current > 0.25 * previous:
+            mu *= growth
+
+    if observer is not None:
+        observer.finish()
+    return ConstrainedResult(x, objective(x), current, success, mu, outer, inner_iterations,
+                             objective.evaluations - start_evaluations, constraints.evaluations,
+                             lam, nu, traj)
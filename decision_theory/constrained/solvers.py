@@ -0,0 +1,13 @@
+"""Методы штрафов для реестра.
+
+solver(x0, objective, constraints, inner="lbfgs", **options) -> ConstrainedResult
+"""
+from functools import partial
+
+from .penalty import minimize_constrained
+
+SOLVERS = {
+    "exterior_penalty": partial(minimize_constrained, method="exterior"),
+    "log_barrier": partial(minimize_constrained, method="barrier"),
+    "augmented_lagrangian": partial(minimize_constrained, method="augmented_lagrangian"),
+}
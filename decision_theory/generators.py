@@ -0,0 +1,128 @@
+"""Воспроизводимые случайные задачи для сравнения решателей.
+
+Генераторы берут seed и при одинаковых параметрах возвращают одинаковые
+задачи (numpy.random.default_rng). Задачи заведомо разрешимы: у ЛП есть
+допустимая точка и ограниченный оптимум, у транспортной — допустимый план
+по существующим маршрутам, у задачи с ограничениями — строго допустимая
+начальная точка (нужна барьерному методу).
+"""
+import numpy as np
+
+MULTIDIM_FUNCTIONS = ("rosenbrock", "rastrigin", "quadratic")
+
+
+def random_lp(m, n, density=1.0, seed=0):
+    """max c^T x (min -c^T x) при A x <= b, x >= 0 с A, b, c > 0 -> параметры linprog_revised.
+
+    density < 1 — разреженная A (CSR); в каждом столбце есть ненулевой
+    элемент, поэтому оптимум ограничен.
+    """
+    import scipy.sparse as sp
+
+    rng = np.random.default_rng(seed)
+    if density < 1.0:
+        A = sp.random(m, n, density=density, random_state=seed, format="csr")
+        A = A + sp.csr_matrix((np.ones(n), (rng.integers(0, m, n), np.arange(n))), shape=(m, n))
+        A.data = rng.uniform(0.1, 1.0, A.nnz)
+    else:
+        A = rng.uniform(0.1, 1.0, (m, n))
+    return dict(c=-rng.uniform(0.1, 1.0, n), A_ub=A, b_ub=rng.uniform(1.0, 10.0, m))
+
+
+def random_transport(m, n, density=1.0, seed=0):
+    """Закрытая транспортная задача m x n -> (costs, supply, demand).
+
+    density < 1 — доля существующих маршрутов, остальные стоимости np.inf;
+    маршруты плана северо-западного угла есть всегда, так что план существует.
+    """
+    rng = np.random.default_rng(seed)
+    supply = rng.integers(10, 100, m).astype(float)
+    demand = rng.multinomial(int(supply.sum()) - n, np.full(n, 1.0 / n)) + 1.0
+    costs = rng.integers(1, 100, (m, n)).astype(float)
+    if density < 1.0:
+        routes = rng.random((m, n)) < density
+        # Путь северо-западного угла: из клетки (i, j) вниз или вправо по остаткам
+        rest_supply, rest_demand = supply.copy(), demand.copy()
+        i = j = 0
+        while i < m and j < n:
+            routes[i, j] = True
+            shipped = min(rest_supply[i], rest_demand[j])
+            rest_supply[i] -= shipped
+            rest_demand[j] -= shipped
+            if rest_supply[i] <= 0 and i < m - 1:
+                i += 1
+            else:
+                j += 1
+        costs[~routes] = np.inf
+    return costs, supply, demand
+
+
+def _quadratic(n, condition, rng):
+    # f(x) = 1/2 (x - p)^T Q (x - p), собственные числа Q от 1 до condition
+    Q, _ = np.linalg.qr(rng.standard_normal((n, n)))
+    Q = (Q * np.logspace(0, np.log10(condition), n)) @ Q.T
+    p = rng.uniform(-1.0, 1.0, n)
+
+    def func(x):
+        d = (x.T - p).T
+        return 0.5 * np.sum(d * (Q @ d), axis=0)
+
+    def value_and_grad(x):
+        g = Q @ (x - p)
+        return float(0.5 * (x - p) @ g), g
+
+    return func, value_and_grad
+
+
+def test_function(name, n, seed=0, condition=100.0):
+    """Многомерная тестовая функция -> (Objective, x0).
+
+    rosenbrock — расширенная функция Розенброка из точки (-1.2, 1, ...) со
+    сдвигом; rastrigin — старт в области притяжения нуля; quadratic —
+    выпуклая квадратичная с числом обусловленности condition.
+    """
+    from .multidim.functions import (rastrigin, rastrigin_value_and_grad, rosenbrock, rosenbrock_start,
+                                     rosenbrock_value_and_grad)
+    from .multidim.objective import Objective
+
+    rng = np.random.default_rng(seed)
+    if name == "rosenbrock":
+        func, value_and_grad = rosenbrock, rosenbrock_value_and_grad
+        x0 = rosenbrock_start(n) + rng.uniform(-0.1, 0.1, n)
+    elif name == "rastrigin":
+        func, value_and_grad = rastrigin, rastrigin_value_and_grad
+        x0 = rng.uniform(-0.3, 0.3, n)
+    elif name == "quadratic":
+        func, value_and_grad = _quadratic(n, condition, rng)
+        x0 = rng.uniform(-2.0, 2.0, n)
+    else:
+        raise ValueError(f"Неизвестная функция {name!r}, допустимы: {', '.join(MULTIDIM_FUNCTIONS)}.")
+    objective = Objective(func, value_and_grad=value_and_grad,
+                          batch_func=lambda points: func(np.asarray(points, dtype=float).T))
+    return objective, x0
+
+
+def random_constrained(n, m, seed=0):
+    """min ||x - p||^2 при A x <= b -> (Objective, Constraints, x0 = 0).
+
+    b > 0, поэтому x0 = 0 строго допустима; p вне допустимого множества,
+    так что часть ограничений активна в решении.
+    """
+    from .constrained.penalty import Constraints
+    from .multidim.objective import Objective
+
+    rng = np.random.default_rng(seed)
+    A = rng.standard_normal((m, n))
+    b = rng.uniform(0.5, 1.5, m)
+    p = 3.0 * rng.standard_normal(n)
+
+    def func(x):
+        d = (x.T - p).T
+        return np.sum(d * d, axis=0)
+
+    def ineq(x):
+        return ((A @ x).T - b).T
+
+    objective = Objective(func, value_and_grad=lambda x: (float(func(x)), 2 * (x - p)),
+                          batch_func=lambda points: func(np.asarray(points, dtype=float).T))
+    return objective, Constraints(ineq=ineq, ineq_jac=lambda x: A, vectorized=True), np.zeros(n)
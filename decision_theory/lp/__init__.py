@@ -0,0 +1,17 @@
+"""Линейное программирование (Lab_6)."""
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "RevisedSimplex": "revised_simplex",
+    "LPResult": "revised_simplex",
+    "linprog_revised": "revised_simplex",
+    "InteriorPoint": "interior_point",
+    "linprog_interior": "interior_point",
+    "Presolve": "presolve",
+    "linprog_presolved": "presolve",
+    "solve_batch": "batch",
+    "simplex_method": "tableau",
+    "read_mps": "mps",
+    "write_mps": "mps",
+    "write_solution": "mps",
+})
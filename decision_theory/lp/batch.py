@@ -0,0 +1,195 @@
+"""Пакетное решение множества сценариев ЛП с общей матрицей ограничений.
+
+Сценарии отличаются только коэффициентами цели c и/или правыми частями
+b_ub, b_eq. Матрицы A_ub, A_eq (в формате CSR), стопки сценариев и массивы
+результатов размещаются в разделяемой памяти (multiprocessing.shared_memory):
+процессы-исполнители подключаются к ним по имени, не получая копий через
+pickle, и записывают ответы прямо в общие массивы.
+
+Каждый исполнитель держит один RevisedSimplex и решает очередной сценарий
+тёплым стартом (resolve) от базиса предыдущего.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import shared_memory, util
+
+import numpy as np
+import scipy.sparse as sp
+
+from .revised_simplex import RevisedSimplex
+
+
+@dataclass
+class BatchResult:
+    x: np.ndarray  # (k, n) — решения по сценариям
+    fun: np.ndarray  # (k,)
+    status: np.ndarray  # (k,) — коды завершения RevisedSimplex
+    nit: np.ndarray  # (k,)
+    ineqlin: np.ndarray  # (k, m_ub) — двойственные оценки A_ub
+    eqlin: np.ndarray  # (k, m_eq) — двойственные оценки A_eq
+    time: float  # Общее время, с
+
+    @property
+    def scenarios_per_second(self):
+        return self.fun.size / self.time if self.time > 0 else float("inf")
+
+
+def _stack(values, width):
+    # Сценарии: None, общий вектор (width,) или стопка (count, width)
+    if values is None:
+        return np.zeros((1, width))
+    values = np.asarray(values, dtype=float)
+    return values.reshape(-1, width) if values.ndim == 1 else values
+
+
+def _share(arrays, blocks):
+    # Копирует массивы в новые блоки разделяемой памяти.
+    # Возвращает описания для подключения и представления массивов в этих блоках.
+    specs, views = {}, {}
+    for key, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        blocks.append(block)
+        views[key] = np.ndarray(array.shape, array.dtype, buffer=block.buf)
+        views[key][...] = array
+        specs[key] = (block.name, array.shape, array.dtype.str)
+    return specs, views
+
+
+def _attach(specs):
+    blocks, arrays = [], {}
+    for key, (name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays[key] = np.ndarray(shape, dtype, buffer=block.buf)
+    return blocks, arrays
+
+
+def _csr_parts(A, prefix, n):
+    A = sp.csr_matrix((0, n)) if A is None else sp.csr_matrix(A, dtype=float)
+    return {prefix + "_data": A.data, prefix + "_indices": A.indices,
+            prefix + "_indptr": A.indptr}, A.shape
+
+
+# Состояние процесса-исполнителя
+_worker = {}
+
+
+def _init_worker(specs, shapes, bounds, options):
+    blocks, arrays = _attach(specs)
+    _worker.clear()
+    _worker.update(blocks=blocks, arrays=arrays, bounds=bounds, options=options, solver=None)
+    for prefix, shape in shapes.items():
+        _worker[prefix] = sp.csr_matrix((arrays[prefix + "_data"], arrays[prefix + "_indices"],
+                                         arrays[prefix + "_indptr"]), shape=shape, copy=False)
+
+
+def _init_pool_worker(specs, shapes, bounds, options):
+    # В пуле блоки закрываются при завершении процесса-исполнителя (финализаторы
+    # multiprocessing выполняются и там, где atexit не срабатывает)
+    _init_worker(specs, shapes, bounds, options)
+    util.Finalize(None, _release_worker, exitpriority=10)
+
+
+def _scenario(arrays, key, i):
+    stack = arrays[key]
+    return stack[i if stack.shape[0] > 1 else 0]
+
+
+def _solve_chunk(first, last):
+    arrays = _worker["arrays"]
+    for i in range(first, last):
+        c = _scenario(arrays, "C", i)
+        b_ub = _scenario(arrays, "B_ub", i)
+        b_eq = _scenario(arrays, "B_eq", i)
+        solver = _worker["solver"]
+        if solver is None:
+            solver = RevisedSimplex(c, _worker["A_ub"], b_ub, _worker["A_eq"], b_eq,
+                                    _worker["bounds"], **_worker["options"])
+            _worker["solver"] = solver
+            result = solver.solve()
+        else:
+            result = solver.resolve(c=c, b_ub=b_ub, b_eq=b_eq)
+        arrays["X"][i] = result.x
+        arrays["FUN"][i] = result.fun
+        arrays["STATUS"][i] = result.status
+        arrays["NIT"][i] = result.nit
+        arrays["INEQLIN"][i] = result.ineqlin
+        arrays["EQLIN"][i] = result.eqlin
+    return first, last
+
+
+def solve_batch(C, A_ub=None, B_ub=None, A_eq=None, B_eq=None, bounds=None,
+                max_workers=None, chunk_size=None, **options):
+    """Решение k сценариев min c_i^T x при A_ub x <= b_ub_i, A_eq x = b_eq_i.
+
+    C, B_ub, B_eq — стопки (k, n), (k, m_ub), (k, m_eq) или общие для всех
+    сценариев векторы. max_workers=1 — решение в текущем процессе без пула.
+    Остальные параметры передаются в RevisedSimplex.
+    """
+    start = time.perf_counter()
+    C = np.asarray(C, dtype=float)
+    n = C.shape[-1]
+    parts_ub, shape_ub = _csr_parts(A_ub, "A_ub", n)
+    parts_eq, shape_eq = _csr_parts(A_eq, "A_eq", n)
+    C = _stack(C, n)
+    B_ub = _stack(B_ub, shape_ub[0])
+    B_eq = _stack(B_eq, shape_eq[0])
+    count = max(C.shape[0], B_ub.shape[0], B_eq.shape[0])
+    for name, stack in (("C", C), ("B_ub", B_ub), ("B_eq", B_eq)):
+        if stack.shape[0] not in (1, count):
+            raise ValueError(f"Число сценариев в {name} ({stack.shape[0]}) не совпадает с {count}.")
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, count))
+    if chunk_size is None:
+        chunk_size = max(1, -(-count // (4 * max_workers)))
+
+    arrays = dict(parts_ub, **parts_eq, C=C, B_ub=B_ub, B_eq=B_eq,
+                  X=np.zeros((count, n)), FUN=np.zeros(count), STATUS=np.zeros(count, dtype=np.int64),
+                  NIT=np.zeros(count, dtype=np.int64), INEQLIN=np.zeros((count, shape_ub[0])),
+                  EQLIN=np.zeros((count, shape_eq[0])))
+    shapes = {"A_ub": shape_ub, "A_eq": shape_eq}
+    chunks = [(first, min(first + chunk_size, count)) for first in range(0, count, chunk_size)]
+
+    blocks, views = [], {}
+    try:
+        specs, views = _share(arrays, blocks)
+        if max_workers == 1:
+            _init_worker(specs, shapes, bounds, options)
+            try:
+                for first, last in chunks:
+                    _solve_chunk(first, last)
+            finally:
+                _release_worker()
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_pool_worker,
+                                     initargs=(specs, shapes, bounds, options)) as pool:
+                futures = [pool.submit(_solve_chunk, first, last) for first, last in chunks]
+                for future in as_completed(futures):
+                    future.result()
+        result = BatchResult(x=views["X"].copy(), fun=views["FUN"].copy(),
+                             status=views["STATUS"].copy(), nit=views["NIT"].copy(),
+                             ineqlin=views["INEQLIN"].copy(), eqlin=views["EQLIN"].copy(),
+                             time=time.perf_counter() - start)
+    finally:
+        # Блоки удаляются и тогда, когда close() не удался (на буфер остались ссылки)
+        views.clear()
+        for block in blocks:
+            try:
+                block.close()
+            finally:
+                block.unlink()
+    return result
+
+
+def _release_worker():
+    # Отключение от разделяемой памяти в текущем процессе: сначала освобождаются
+    # все ссылки на буферы, иначе close() завершится ошибкой
+    blocks = _worker.get("blocks", [])
+    _worker.clear()
+    for block in blocks:
+        block.close()
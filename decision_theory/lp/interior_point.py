@@ -0,0 +1,443 @@
+"""Прямо-двойственный метод внутренней точки (предиктор-корректор Мехротры).
+
+Постановка и результат те же, что у linprog_revised:
+min c^T x  при  A_ub x <= b_ub,  A_eq x = b_eq,  lb <= x <= ub  ->  LPResult.
+Стандартная форма A x = b, 0 <= x <= u (сдвиг границ, дополнительные
+переменные, масштабирование) строится тем же RevisedSimplex.
+
+На каждой итерации решаются нормальные уравнения (A Θ A^T) dy = r
+разложением Холецкого. Портрет A Θ A^T между итерациями не меняется,
+поэтому символьная часть строится один раз:
+  * "dense" — плотная матрица и scipy.linalg.cho_factor;
+  * "sparse" — портрет A A^T и матрица P, дающая ненулевые элементы
+    A Θ A^T одним произведением P θ; разложение — CHOLMOD (scikit-sparse,
+    если установлен: analyze один раз, далее cholesky_inplace) или SuperLU
+    без выбора ведущих элементов в симметричном режиме с упорядочением,
+    найденным на первой итерации.
+
+Несовместность доказывается сертификатом Фаркаша по двойственным
+переменным, уходящим в бесконечность. Если итерации прервались без
+доказательства (признак неограниченности, срыв разложения даже с
+регуляризацией MAX_REGULARIZATION), задачу решает симплекс-метод —
+исключений и неверных статусов на допустимых входных данных нет.
+
+crossover=True — переход к базисному решению: m самых «внутренних»
+переменных (из частей x+ и x- свободной переменной — лишь одна; при
+хорошей обусловленности — готовый базис; иначе независимые из них
+дополняются единичными столбцами), и RevisedSimplex.solve(basis=...)
+доводит базис до оптимального. Ответ crossover проверяется на
+допустимость и совпадение цели с точкой IPM — при расхождении остаётся
+точка IPM (без basis). Результат содержит basis (basis.indexes — пары (строка,
+столбец) в нумерации симплекс-таблицы), как у симплекс-метода.
+
+observer (observers.py) получает на итерации значение прямой цели и шаг
+alpha по прямым переменным; crossover — вложенное решение "revised_simplex".
+"""
+import time
+
+import numpy as np
+import scipy.linalg as la
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, onenormest, splu
+
+from .revised_simplex import (INFEASIBLE, ITERATION_LIMIT, OPTIMAL, UNBOUNDED, Basis,
+                              RevisedSimplex)
+
+LINEAR_SOLVERS = ("auto", "dense", "sparse")
+
+STEP_FRACTION = 0.995  # Доля шага до границы положительного ортанта
+DENSE_FILL = 0.3  # Доля заполнения множителя, при которой "auto" переходит к плотному разложению
+DENSE_LIMIT = 6000  # Наибольшее число строк для плотного разложения в режиме "auto"
+MAX_REGULARIZATION = 1e-2  # Дальше регуляризация искажает задачу — итерации прекращаются
+MAX_CONDITION = 1e12  # Базис crossover с большим числом обусловленности отвергается
+FEASIBILITY_TOL = 1e-7  # Допуск нарушения ограничений ответа crossover, относительно 1 + |b|
+
+
+class _NormalEquations:
+    """A Θ A^T + δ I с символьной частью, построенной один раз.
+
+    mode "auto": плотное разложение для малых или плотных задач, а также
+    если символьный этап предсказал заполнение больше DENSE_FILL.
+    """
+
+    def __init__(self, A, mode):
+        self.m, self.n = A.shape
+        self.adaptive = mode == "auto"
+        self.dense = mode == "dense" or (self.adaptive and (self.m <= 200 or A.nnz > 0.1 * self.m * self.n))
+        self.cholmod = None
+        self.perm = None
+        self.analyzed = False
+        self.P = None
+        if self.dense:
+            self.A_dense = A.toarray()
+        else:
+            self._build_pattern(sp.csc_matrix(A))
+
+    def _build_pattern(self, A):
+        # Пары (i, j) ненулевых элементов каждого столбца k: M_ij = sum_k A_ik A_jk θ_k
+        m = self.m
+        counts = np.diff(A.indptr)
+        column = np.repeat(np.arange(self.n), counts)
+        pairs = counts[column]
+        first = np.repeat(np.arange(A.nnz), pairs)
+        offsets = np.arange(first.size) - np.repeat(np.cumsum(pairs) - pairs, pairs)
+        second = np.repeat(A.indptr[column], pairs) + offsets
+        rows = np.concatenate([A.indices[first], np.arange(m)])
+        cols = np.concatenate([A.indices[second], np.arange(m)])
+        values = np.concatenate([A.data[first] * A.data[second], np.zeros(m)])  # Диагональ есть всегда
+        owners = np.concatenate([column[first], np.zeros(m, dtype=int)])
+        keys, position = np.unique(rows.astype(np.int64) * m + cols, return_inverse=True)
+        self.P = sp.csr_matrix((values, (position, owners)), shape=(keys.size, self.n))
+        self.P.sum_duplicates()
+        indptr = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys // m, minlength=m), out=indptr[1:])
+        self.rows, self.cols = keys // m, keys % m
+        self.pattern = sp.csr_matrix((np.zeros(keys.size), self.cols, indptr), shape=(m, m))
+        self.diagonal = np.flatnonzero(self.rows == self.cols)
+
+    def factor(self, theta, regularization):
+        if self.P is None:
+            M = (self.A_dense * theta) @ self.A_dense.T
+            M[np.diag_indices_from(M)] += regularization
+            self.cho = la.cho_factor(M, lower=True, check_finite=False)
+            return
+        data = self.P @ theta
+        data[self.diagonal] += regularization
+        if not self.analyzed:
+            self._analyze(data)
+        if self.dense:
+            # Плотная матрица по разреженному портрету (множитель почти плотный)
+            M = np.zeros((self.m, self.m))
+            M[self.rows, self.cols] = data
+            self.cho = la.cho_factor(M, lower=True, check_finite=False)
+        elif self.cholmod is not None:
+            self.cholmod.cholesky_inplace(self._matrix(data))
+        else:
+            try:
+                self.lu = splu(self._matrix(data[self.order]), permc_spec="NATURAL", diag_pivot_thresh=0.0,
+                               options=dict(SymmetricMode=True))
+            except RuntimeError as error:  # Нулевой ведущий элемент
+                raise la.LinAlgError("Матрица нормальных уравнений вырождена.") from error
+            diagonal = self.lu.U.diagonal()
+            if not np.all(np.isfinite(diagonal)) or np.any(diagonal <= 0):
+                raise la.LinAlgError("Матрица нормальных уравнений не положительно определена.")
+
+    def _matrix(self, data):
+        pattern = self.pattern if self.perm is None else self.permuted
+        return sp.csc_matrix((data, pattern.indices, pattern.indptr), shape=(self.m, self.m))
+
+    def _analyze(self, data):
+        # Символьный этап: упорядочение, уменьшающее заполнение, — один раз
+        self.analyzed = True
+        try:
+            from sksparse.cholmod import analyze
+        except ImportError:
+            analyze = None
+        if analyze is not None:
+            self.cholmod = analyze(self._matrix(data))
+            return
+        lu = splu(self._matrix(data), permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0,
+                  options=dict(SymmetricMode=True))
+        if self.adaptive and self.m <= DENSE_LIMIT and lu.L.nnz > DENSE_FILL * self.m * self.m / 2:
+            # Множитель почти плотный — плотное разложение быстрее
+            self.dense = True
+            return
+        perm = np.argsort(lu.perm_c)  # perm_c[j] — новое место столбца j
+        numbered = sp.csr_matrix((np.arange(1, data.size + 1, dtype=float), self.pattern.indices,
+                                  self.pattern.indptr), shape=(self.m, self.m))
+        permuted = numbered[perm][:, perm].tocsc()
+        permuted.sort_indices()
+        self.order = permuted.data.astype(np.int64) - 1
+        self.permuted = permuted
+        self.perm = perm
+
+    def solve(self, r):
+        if self.dense:
+            return la.cho_solve(self.cho, r, check_finite=False)
+        if self.cholmod is not None:
+            return self.cholmod(r)
+        result = np.empty_like(r)
+        result[self.perm] = self.lu.solve(r[self.perm])
+        return result
+
+
+def _max_step(v, dv):
+    # Наибольший шаг alpha <= 1, при котором v + alpha dv >= 0
+    negative = dv < 0
+    if not np.any(negative):
+        return 1.0
+    return min(1.0, float(np.min(-v[negative] / dv[negative])))
+
+
+class InteriorPoint:
+    """Решатель задачи ЛП методом внутренней точки.
+
+    linear_solver — "auto" (плотное разложение для малых, плотных задач и
+    задач с почти плотным множителем), "dense" или "sparse"; tol — точность по
+    относительным невязкам и зазору двойственности; crossover — переход
+    к базисному решению симплекс-методом; observer — приёмник событий итераций.
+    """
+
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                 tol=1e-8, max_iter=100, linear_solver="auto", crossover=False, scale=True, observer=None):
+        if linear_solver not in LINEAR_SOLVERS:
+            raise ValueError(f"Неизвестный способ решения нормальных уравнений {linear_solver!r}, "
+                             f"допустимы: {', '.join(LINEAR_SOLVERS)}.")
+        self.simplex = RevisedSimplex(c, A_ub, b_ub, A_eq, b_eq, bounds, method="two_phase", scale=scale,
+                                      observer=observer)
+        self.tol = tol
+        self.max_iter = max_iter
+        self.linear_solver = linear_solver
+        self.crossover = crossover
+        self.observer = observer
+
+    def _standard_form(self):
+        # Без искусственных столбцов и без переменных с нулевой шириной (они равны нулю)
+        simplex = self.simplex
+        upper = simplex.upper[:simplex.art_start]
+        self.columns = np.flatnonzero(upper > 0)
+        A = simplex.A[:, self.columns]
+        return A.tocsc(), simplex.b, simplex.cost[self.columns], upper[self.columns]
+
+    def solve(self):
+        start = time.perf_counter()
+        A, b, c, u = self._standard_form()
+        m, n = A.shape
+        AT = A.T.tocsr()
+        bounded = np.isfinite(u)
+        ub = u[bounded]
+        normal = _NormalEquations(A, self.linear_solver)
+        regularization = 1e-12
+        b_norm, c_norm, u_norm = 1 + np.linalg.norm(b), 1 + np.linalg.norm(c), 1 + np.linalg.norm(ub)
+
+        # Начальная точка Мехротры: решения наименьшей нормы со сдвигом в положительный ортант
+        regularization = self._factor(normal, np.ones(n), regularization)
+        if regularization is None:
+            return self._fallback(start, 0)
+        x = AT @ normal.solve(b)
+        y = normal.solve(A @ c)
+        z = c - AT @ y
+        x += max(-1.5 * x.min(initial=0.0), 0.0)
+        z += max(-1.5 * z.min(initial=0.0), 0.0)
+        xz = x @ z
+        x += 0.5 * xz / max(z.sum(), 1e-12) + 1e-8
+        z += 0.5 * xz / max(x.sum(), 1e-12) + 1e-8
+        x[bounded] = np.minimum(x[bounded], 0.5 * ub)
+        w = ub - x[bounded]
+        s = z[bounded].copy()
+
+        observer = self.observer
+        if observer is not None:
+            observer.start("interior_point")
+            offset = self.simplex.c @ self.simplex._offset  # Сдвиг цели на нижние границы
+        status = ITERATION_LIMIT
+        breakdown = False
+        nit = 0
+        while nit < self.max_iter:
+            rb = b - A @ x
+            ru = ub - x[bounded] - w
+            ATy = AT @ y
+            rc = c - ATy - z
+            rc[bounded] += s
+            mu = (x @ z + w @ s) / (n + w.size)
+            primal = max(np.linalg.norm(rb) / b_norm, np.linalg.norm(ru) / u_norm)
+            dual = np.linalg.norm(rc) / c_norm
+            primal_obj, dual_obj = c @ x, b @ y - ub @ s
+            gap = abs(primal_obj - dual_obj) / (1 + abs(primal_obj))
+            if primal <= self.tol and dual <= self.tol and gap <= self.tol:
+                status = OPTIMAL
+                break
+            if self._farkas(ATy, y, b, ub, bounded):
+                status = INFEASIBLE
+                break
+            if not np.all(np.isfinite(x)) or np.abs(x).max(initial=0.0) > 1e12 * b_norm:
+                status = UNBOUNDED  # Только признак: статус проверяет симплекс-метод
+                break
+            nit += 1
+
+            theta = z / x
+            theta[bounded] += s / w
+            theta = 1.0 / theta
+            regularization = self._factor(normal, theta, regularization)
+            if regularization is None:
+                breakdown = True  # Численный срыв — статус устанавливает симплекс-метод
+                break
+
+            def direction(rxz, rws):
+                r = rc - rxz / x
+                r[bounded] += (rws - s * ru) / w
+                dy = normal.solve(rb + A @ (theta * r))
+                dx = theta * (AT @ dy - r)
+                dz = (rxz - z * dx) / x
+                dw = ru - dx[bounded]
+                ds = (rws - s * dw) / w
+                return dx, dy, dz, dw, ds
+
+            # Предиктор (аффинное направление) и оценка параметра центрирования
+            dx, dy, dz, dw, ds = direction(-x * z, -w * s)
+            alpha_p = min(_max_step(x, dx), _max_step(w, dw))
+            alpha_d = min(_max_step(z, dz), _max_step(s, ds))
+            mu_aff = ((x + alpha_p * dx) @ (z + alpha_d * dz)
+                      + (w + alpha_p * dw) @ (s + alpha_d * ds)) / (n + w.size)
+            sigma = (mu_aff / mu) ** 3 if mu > 0 else 0.0
+
+            # Корректор
+            dx, dy, dz, dw, ds = direction(sigma * mu - x * z - dx * dz, sigma * mu - w * s - dw * ds)
+            alpha_p = STEP_FRACTION * min(_max_step(x, dx), _max_step(w, dw))
+            alpha_d = STEP_FRACTION * min(_max_step(z, dz), _max_step(s, ds))
+            x += alpha_p * dx
+            w += alpha_p * dw
+            y += alpha_d * dy
+            z += alpha_d * dz
+            s += alpha_d * ds
+            if observer is not None:
+                observer.event(nit, c @ x + offset, step=alpha_p)
+
+        simplex = self.simplex
+        if status == UNBOUNDED or breakdown:
+            result = self._fallback(start, nit)
+            if observer is not None:
+                observer.finish()
+            return result
+        x_std = np.zeros(simplex.N)
+        x_std[self.columns] = x
+        result = simplex._make_result(status, x_std, y, 0)
+        if status == OPTIMAL and self.crossover:
+            vertex = simplex.solve(basis=self._basis(A, x, z, w, s, bounded))
+            # Ответ crossover принимается, только если он оптимален, допустим и не хуже
+            # точки IPM; иначе (вырожденный базис, потеря точности) — точка IPM
+            agrees = vertex.fun <= result.fun + np.sqrt(self.tol) * (1.0 + abs(result.fun))
+            if vertex.status == OPTIMAL and agrees and self._feasible(vertex):
+                result = vertex
+            result.nit_crossover = vertex.nit
+        result.nit = nit
+        result.method = "interior_point"
+        result.time = time.perf_counter() - start
+        if observer is not None:
+            observer.finish()
+        return result
+
+    def _factor(self, normal, theta, regularization):
+        # Разложение с усилением регуляризации при зависимых строках; None — не удалось
+        while regularization <= MAX_REGULARIZATION:
+            try:
+                normal.factor(theta, regularization)
+                return regularization
+            except la.LinAlgError:
+                regularization *= 1e3
+        return None
+
+    def _fallback(self, start, nit):
+        # Метод внутренней точки не доказал ни оптимальность, ни несовместность —
+        # задачу решает симплекс-метод (его статус точен: неограниченность, несовместность)
+        result = self.simplex.solve()
+        result.nit_crossover = result.nit
+        result.nit = nit
+        result.method = "interior_point"
+        result.time = time.perf_counter() - start
+        return result
+
+    def _farkas(self, ATy, y, b, ub, bounded):
+        # Сертификат несовместности A x = b, 0 <= x <= u (лемма Фаркаша): направление y,
+        # для которого g = A^T y <= 0 у переменных без верхней границы и
+        # b^T y > sum max(g_j, 0) u_j, — тогда b^T y = g^T x невозможно ни при каком x.
+        # У несовместной задачи двойственные переменные IPM уходят в бесконечность вдоль такого y
+        norm = np.abs(y).max(initial=0.0)
+        if not np.isfinite(norm) or norm <= 1.0:
+            return False
+        g = ATy / norm
+        g_max = np.abs(g).max(initial=0.0)
+        if np.any(g[~bounded] > self.tol * (1.0 + g_max)):
+            return False
+        margin = b @ (y / norm) - np.maximum(g[bounded], 0.0) @ ub
+        return margin > np.sqrt(self.tol) * (1.0 + np.abs(b).max(initial=0.0))
+
+    def _feasible(self, result):
+        # Допустимость ответа в исходной постановке: неравенства, равенства, границы
+        simplex = self.simplex
+        x = result.x
+        ok = np.all(result.slack >= -FEASIBILITY_TOL * (1.0 + np.abs(simplex.b_ub)))
+        ok &= np.all(np.abs(result.con) <= FEASIBILITY_TOL * (1.0 + np.abs(simplex.b_eq)))
+        scale = FEASIBILITY_TOL * (1.0 + np.abs(x))
+        return bool(ok and np.all(x >= simplex.lb - scale) and np.all(x <= simplex.ub + scale))
+
+    def _basis(self, A, x, z, w, s, bounded):
+        """Базис по решению метода внутренней точки для RevisedSimplex.solve(basis=...)."""
+        simplex = self.simplex
+        m = simplex.m
+        slack = np.full(x.size, np.inf)
+        slack[bounded] = w
+        dual = z.copy()
+        dual[bounded] += s
+        x = self._merge_free(x)
+        # Чем дальше переменная от границ и чем меньше её оценка, тем вероятнее она базисная
+        score = np.minimum(x, slack) / (1.0 + dual)
+        candidates = np.argsort(-score)[:m]
+        candidates = candidates[score[candidates] > np.sqrt(self.tol)]
+        basic = self.columns[candidates]
+        if candidates.size < m or not self._well_conditioned(basic):
+            basic = self._complete(A, candidates)
+
+        at_upper = np.zeros(simplex.N, dtype=bool)
+        finite = np.isfinite(simplex.upper)
+        values = np.zeros(simplex.N)
+        values[self.columns] = x
+        at_upper[finite] = values[finite] > 0.5 * simplex.upper[finite]
+        at_upper[basic] = False
+        return Basis(basic, at_upper)
+
+    def _merge_free(self, x):
+        # Свободная переменная x = x+ - x-: в точке IPM обе части положительны,
+        # а их столбцы противоположны — в базис попадает лишь одна, с |x|
+        T = self.simplex._T.tocsr()
+        split = np.flatnonzero(np.diff(T.indptr) == 2)
+        if not split.size:
+            return x
+        position = np.full(self.simplex.N, -1)
+        position[self.columns] = np.arange(self.columns.size)
+        plus, minus = position[T.indices[T.indptr[split]]], position[T.indices[T.indptr[split] + 1]]
+        x = x.copy()
+        value = x[plus] - x[minus]
+        x[plus], x[minus] = np.maximum(value, 0.0), np.maximum(-value, 0.0)
+        return x
+
+    def _well_conditioned(self, basic):
+        # Невырожденная вершина: ровно m внутренних переменных дают базис сразу, если
+        # матрица базиса хорошо обусловлена (оценка cond_1 = |B|_1 |B^-1|_1); splu
+        # на численно вырожденной матрице не отказывает, поэтому нужна оценка числа обусловленности
+        if not basic.size:
+            return True  # Строк-ограничений нет — пустой базис
+        B = self.simplex.A[:, basic].tocsc()
+        try:
+            lu = splu(B, permc_spec="COLAMD")
+        except RuntimeError:
+            return False
+        inverse = LinearOperator(B.shape, matvec=lu.solve, rmatvec=lambda r: lu.solve(r, trans="T"),
+                                 dtype=float)
+        with np.errstate(all="ignore"):
+            condition = abs(B).sum(axis=0).max() * onenormest(inverse)
+        return bool(np.isfinite(condition) and condition < MAX_CONDITION)
+
+    def _complete(self, A, candidates):
+        # Линейно независимые кандидаты (QR с выбором столбцов), остальные строки
+        # закрываются единичными столбцами: дополнительными или искусственными
+        simplex = self.simplex
+        chosen = np.zeros(0, dtype=int)
+        if candidates.size:
+            _, R, pivots = la.qr(A[:, candidates].toarray(), mode="economic", pivoting=True)
+            diagonal = np.abs(np.diag(R))
+            rank = int(np.sum(diagonal > 1e-9 * diagonal[0]))
+            chosen = candidates[pivots[:rank]]
+        rows = np.arange(simplex.m)
+        if chosen.size:
+            P, _, _ = la.lu(A[:, chosen].toarray())
+            rows = np.setdiff1d(rows, np.argmax(P, axis=0)[:chosen.size])
+        unit = simplex.n_struct + rows
+        artificial = rows >= simplex.n_slack
+        unit[artificial] = simplex.art_start + np.searchsorted(simplex.art_rows, rows[artificial])
+        return np.concatenate([self.columns[chosen], unit])
+
+
+def linprog_interior(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, **options):
+    """Функция-обёртка в стиле scipy.optimize.linprog."""
+    return InteriorPoint(c, A_ub, b_ub, A_eq, b_eq, bounds, **options).solve()
@@ -0,0 +1,287 @@
+"""Чтение и запись задач ЛП в свободном формате MPS, запись решений.
+
+read_mps читает файл построчно: элементы секции COLUMNS дописываются в
+буферы COO (array), из которых один раз строится CSR, так что текст файла
+и списки Python в памяти не держатся. Поддерживаются секции NAME,
+OBJSENSE, ROWS (N, L, G, E), COLUMNS (строки MARKER пропускаются —
+целочисленность не учитывается), RHS, RANGES, BOUNDS (UP, LO, FX, FR, MI,
+PL, BV, LI, UI), ENDATA. Строки-неравенства переводятся в вид A_ub x <= b_ub
+(G — со сменой знака, строка с RANGES — двумя неравенствами), равенства —
+в A_eq x = b_eq.
+
+write_mps записывает задачу в стиле linprog_revised, write_solution —
+LPResult в CSV (раздел, имя, значение).
+"""
+import csv
+from array import array
+from dataclasses import dataclass, field
+
+import numpy as np
+import scipy.sparse as sp
+
+from .revised_simplex import _as_matrix, _as_vector, _normalize_bounds
+
+SECTIONS = ("NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA")
+BOUND_TYPES = ("UP", "LO", "FX", "FR", "MI", "PL", "BV", "LI", "UI")
+_VALUED_BOUNDS = ("UP", "LO", "FX", "LI", "UI")
+
+
+@dataclass
+class MPSProblem:
+    name: str
+    c: np.ndarray  # Коэффициенты цели из файла (для OBJSENSE MAX — максимизируемой)
+    A_ub: sp.csr_matrix
+    b_ub: np.ndarray
+    A_eq: sp.csr_matrix
+    b_eq: np.ndarray
+    bounds: list  # Пары (lb, ub), None — без границы
+    row_names: list  # Строки-ограничения в порядке файла
+    col_names: list
+    maximize: bool = False
+    offset: float = 0.0  # Постоянная цели (RHS строки цели с обратным знаком)
+    # Номера строк файла, давших строки A_ub (знак +1 — L, -1 — G) и A_eq
+    ub_rows: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    ub_signs: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    eq_rows: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+
+    def linprog_args(self):
+        """Параметры linprog_revised / linprog_interior (задача на минимум)."""
+        return dict(c=-self.c if self.maximize else self.c, A_ub=self.A_ub, b_ub=self.b_ub, A_eq=self.A_eq,
+                    b_eq=self.b_eq, bounds=self.bounds)
+
+    def objective(self, result):
+        # Значение цели задачи из файла (со знаком OBJSENSE и постоянной)
+        return (-result.fun if self.maximize else result.fun) + self.offset
+
+    def row_duals(self, result):
+        # Производные значения цели задачи из файла по правым частям её строк
+        duals = np.zeros(len(self.row_names))
+        np.add.at(duals, self.ub_rows, self.ub_signs * result.ineqlin)
+        np.add.at(duals, self.eq_rows, result.eqlin)
+        return -duals if self.maximize else duals
+
+
+def _pairs(tokens, start):
+    # Пары (имя, значение) строки COLUMNS / RHS / RANGES начиная с позиции start
+    return zip(tokens[start::2], map(float, tokens[start + 1::2]))
+
+
+def read_mps(path):
+    """Задача ЛП из файла свободного формата MPS -> MPSProblem."""
+    name = ""
+    maximize = False
+    objective = None
+    rows = {}  # Имя строки -> номер
+    senses = []
+    free_rows = set()  # Дополнительные строки N — не ограничения
+    columns = {}
+    c = array("d")
+    coo_rows, coo_cols, coo_vals = array("q"), array("q"), array("d")
+    rhs = ranges = None
+    offset = 0.0
+    lb = ub = None
+    section = None
+    last_column, j = None, -1
+
+    with open(path, encoding="utf-8") as file:
+        for number, line in enumerate(file, 1):
+            if not line.strip() or line.startswith("*"):
+                continue
+            tokens = line.split()
+            if not line[0].isspace():
+                section = tokens[0].upper()
+                if section == "NAME":
+                    name = " ".join(tokens[1:])
+                elif section == "OBJSENSE" and len(tokens) > 1:
+                    maximize = tokens[1].upper() in ("MAX", "MAXIMIZE")
+                elif section == "COLUMNS":
+                    rhs, ranges = np.zeros(len(senses)), np.full(len(senses), np.nan)
+                elif section == "BOUNDS":
+                    lb, ub = np.zeros(len(columns)), np.full(len(columns), np.inf)
+                elif section == "ENDATA":
+                    break
+                elif section not in SECTIONS:
+                    raise ValueError(f"{path}:{number}: неизвестная секция {tokens[0]!r}.")
+                continue
+
+            if section == "OBJSENSE":
+                maximize = tokens[0].upper() in ("MAX", "MAXIMIZE")
+            elif section == "ROWS":
+                kind, row = tokens[0].upper(), tokens[1]
+                if kind == "N":
+                    if objective is None:
+                        objective = row
+                    else:
+                        free_rows.add(row)
+                elif kind in ("L", "G", "E"):
+                    rows[row] = len(senses)
+                    senses.append(kind)
+                else:
+                    raise ValueError(f"{path}:{number}: неизвестный тип строки {kind!r}.")
+            elif section == "COLUMNS":
+                if len(tokens) > 2 and tokens[1] == "'MARKER'":
+                    continue
+                column = tokens[0]
+                if column != last_column:
+                    last_column = column
+                    j = columns.setdefault(column, len(columns))
+                    if j == len(c):
+                        c.append(0.0)
+                for row, value in _pairs(tokens, 1):
+                    if row == objective:
+                        c[j] += value
+                    elif row in rows:
+                        coo_rows.append(rows[row])
+                        coo_cols.append(j)
+                        coo_vals.append(value)
+                    elif row not in free_rows:
+                        raise ValueError(f"{path}:{number}: неизвестная строка {row!r}.")
+            elif section in ("RHS", "RANGES"):
+                # Имя набора необязательно: при чётном числе полей его нет
+                for row, value in _pairs(tokens, len(tokens) % 2):
+                    if row == objective and section == "RHS":
+                        offset = -value
+                    elif row in rows:
+                        (rhs if section == "RHS" else ranges)[rows[row]] = value
+                    elif row not in free_rows:
+                        raise ValueError(f"{path}:{number}: неизвестная строка {row!r}.")
+            elif section == "BOUNDS":
+                kind = tokens[0].upper()
+                if kind not in BOUND_TYPES:
+                    raise ValueError(f"{path}:{number}: неизвестный тип границы {kind!r}.")
+                valued = kind in _VALUED_BOUNDS
+                column = tokens[-2] if valued else tokens[-1]
+                if column not in columns:
+                    raise ValueError(f"{path}:{number}: неизвестный столбец {column!r}.")
+                k = columns[column]
+                value = float(tokens[-1]) if valued else 0.0
+                if kind in ("UP", "UI"):
+                    ub[k] = value
+                    if value < 0 and lb[k] == 0:
+                        lb[k] = -np.inf  # Отрицательная верхняя граница при нулевой нижней (соглашение MPS)
+                elif kind in ("LO", "LI"):
+                    lb[k] = value
+                elif kind == "FX":
+                    lb[k] = ub[k] = value
+                elif kind == "FR":
+                    lb[k], ub[k] = -np.inf, np.inf
+                elif kind == "MI":
+                    lb[k] = -np.inf
+                elif kind == "PL":
+                    ub[k] = np.inf
+                else:
+                    lb[k], ub[k] = 0.0, 1.0
+            else:
+                raise ValueError(f"{path}:{number}: данные вне секции.")
+
+    if objective is None:
+        raise ValueError(f"{path}: нет строки цели (тип N).")
+    m, n = len(senses), len(columns)
+    if rhs is None:
+        rhs, ranges = np.zeros(m), np.full(m, np.nan)
+    if lb is None:
+        lb, ub = np.zeros(n), np.full(n, np.inf)
+    A = sp.csr_matrix((np.frombuffer(coo_vals, dtype=float),
+                       (np.frombuffer(coo_rows, dtype=np.int64), np.frombuffer(coo_cols, dtype=np.int64))),
+                      shape=(m, n))
+    del coo_rows, coo_cols, coo_vals
+
+    # Границы строк lo <= A x <= hi по типу строки и RANGES
+    senses = np.array(senses)
+    lo = np.where(senses == "L", -np.inf, rhs)
+    hi = np.where(senses == "G", np.inf, rhs)
+    ranged = ~np.isnan(ranges)
+    width = np.abs(ranges)
+    lo = np.where(ranged & ((senses == "L") | ((senses == "E") & (ranges < 0))), rhs - width, lo)
+    hi = np.where(ranged & ((senses == "G") | ((senses == "E") & (ranges > 0))), rhs + width, hi)
+
+    eq_rows = np.flatnonzero(lo == hi)
+    upper_rows = np.flatnonzero(np.isfinite(hi) & (lo != hi))
+    lower_rows = np.flatnonzero(np.isfinite(lo) & (lo != hi))
+    ub_rows = np.concatenate([upper_rows, lower_rows])
+    ub_signs = np.concatenate([np.ones(upper_rows.size), -np.ones(lower_rows.size)])
+    A_ub = (sp.diags(ub_signs) @ A[ub_rows]).tocsr()
+    b_ub = ub_signs * np.concatenate([hi[upper_rows], lo[lower_rows]])
+    bounds = [(None if np.isinf(low) else float(low), None if np.isinf(high) else float(high))
+              for low, high in zip(lb, ub)]
+    row_names = [None] * m
+    for row, i in rows.items():
+        row_names[i] = row
+    return MPSProblem(name=name, c=np.frombuffer(c, dtype=float).copy(), A_ub=A_ub, b_ub=b_ub, A_eq=A[eq_rows],
+                      b_eq=hi[eq_rows], bounds=bounds, row_names=row_names, col_names=list(columns),
+                      maximize=maximize, offset=offset, ub_rows=ub_rows, ub_signs=ub_signs, eq_rows=eq_rows)
+
+
+def _number(value):
+    return repr(float(value))
+
+
+def write_mps(path, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, name="PROBLEM",
+              col_names=None):
+    """Задача min c^T x в стиле linprog_revised -> файл свободного формата MPS.
+
+    Строки: COST (цель), R1.. (A_ub, тип L), E1.. (A_eq, тип E); столбцы —
+    col_names или X1... Матрица выписывается по столбцам из CSC.
+    """
+    c = np.asarray(c, dtype=float).ravel()
+    n = c.size
+    A_ub, A_eq = _as_matrix(A_ub, n), _as_matrix(A_eq, n)
+    b_ub, b_eq = _as_vector(b_ub, A_ub.shape[0]), _as_vector(b_eq, A_eq.shape[0])
+    lb, ub = _normalize_bounds(bounds, n)
+    names = col_names if col_names is not None else [f"X{j + 1}" for j in range(n)]
+    row_names = [f"R{i + 1}" for i in range(A_ub.shape[0])] + [f"E{i + 1}" for i in range(A_eq.shape[0])]
+    A = sp.vstack([A_ub, A_eq]).tocsc()
+    A.sort_indices()
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(f"NAME {name}\nROWS\n N COST\n")
+        file.writelines(f" L {row}\n" for row in row_names[:A_ub.shape[0]])
+        file.writelines(f" E {row}\n" for row in row_names[A_ub.shape[0]:])
+        file.write("COLUMNS\n")
+        for j in range(n):
+            start, end = A.indptr[j], A.indptr[j + 1]
+            lines = [f" {names[j]} {row_names[i]} {_number(v)}\n"
+                     for i, v in zip(A.indices[start:end].tolist(), A.data[start:end].tolist())]
+            if c[j] != 0 or not lines:
+                lines.insert(0, f" {names[j]} COST {_number(c[j])}\n")
+            file.writelines(lines)
+        file.write("RHS\n")
+        rhs = np.concatenate([b_ub, b_eq])
+        file.writelines(f" RHS {row_names[i]} {_number(rhs[i])}\n" for i in np.flatnonzero(rhs))
+        file.write("BOUNDS\n")
+        for j in range(n):
+            if lb[j] == ub[j]:
+                file.write(f" FX BND {names[j]} {_number(lb[j])}\n")
+                continue
+            if np.isinf(lb[j]):
+                file.write(f" {'FR' if np.isinf(ub[j]) else 'MI'} BND {names[j]}\n")
+            elif lb[j] != 0:
+                file.write(f" LO BND {names[j]} {_number(lb[j])}\n")
+            if np.isfinite(ub[j]):
+                file.write(f" UP BND {names[j]} {_number(ub[j])}\n")
+        file.write("ENDATA\n")
+
+
+def write_solution(path, result, problem=None):
+    """LPResult -> CSV со столбцами section, name, value.
+
+    Разделы: status, objective, variable (значения переменных), dual
+    (двойственные оценки строк). С problem (MPSProblem) — имена из файла,
+    значение цели и оценки строк в постановке файла; без него — x1..,
+    ineq1.., eq1.. и значения в постановке linprog.
+    """
+    if problem is not None:
+        col_names, row_names = problem.col_names, problem.row_names
+        fun, duals = problem.objective(result), problem.row_duals(result)
+    else:
+        col_names = [f"x{j + 1}" for j in range(result.x.size)]
+        row_names = [f"ineq{i + 1}" for i in range(result.ineqlin.size)] + \
+            [f"eq{i + 1}" for i in range(result.eqlin.size)]
+        fun, duals = result.fun, np.concatenate([result.ineqlin, result.eqlin])
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(("section", "name", "value"))
+        writer.writerow(("status", result.message, result.status))
+        writer.writerow(("objective", "", _number(fun)))
+        writer.writerows(("variable", column, _number(value)) for column, value in zip(col_names, result.x))
+        writer.writerows(("dual", row, _number(value)) for row, value in zip(row_names, duals))
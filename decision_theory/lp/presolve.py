@@ -0,0 +1,298 @@
+"""Предварительное упрощение задачи ЛП (presolve) и восстановление решения (postsolve).
+
+Задача в той же форме, что у linprog_revised:
+min c^T x  при  A_ub x <= b_ub,  A_eq x = b_eq,  lb <= x <= ub.
+Строки A_ub и A_eq нумеруются подряд (сначала неравенства). Проходы
+повторяются, пока хоть что-то удаляется:
+  * фиксированные переменные (lb = ub) — подстановка в правые части;
+  * пустые строки — проверка 0 <= b (0 = b) и удаление;
+  * строки-синглтоны: a x_j = b фиксирует x_j, a x_j <= b сужает границу x_j;
+  * избыточные неравенства — наибольшая активность строки по границам
+    переменных не больше b (наименьшая больше b — задача несовместна);
+  * доминируемые столбцы вне равенств: c_j >= 0 и столбец неотрицателен —
+    x_j = lb_j; c_j <= 0 и столбец неположителен — x_j = ub_j (пустые
+    столбцы — частный случай). Если нужной границы нет, а c_j != 0, x_j
+    улучшает цель без предела и лишь ослабляет свои строки: столбец и эти
+    строки удаляются, а задача неограничена, если совместен остаток —
+    это проверяет linprog_presolved.
+Каждое удаление записывается в журнал. postsolve проходит журнал в обратном
+порядке: восстанавливает x, невязки и двойственные оценки удалённых строк
+(строке-синглтону достаётся оценка переменной, стоящей на её границе).
+"""
+import time
+from collections import Counter
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+import scipy.sparse as sp
+
+from .revised_simplex import (INFEASIBLE, MESSAGES, OPTIMAL, UNBOUNDED, LPResult, _as_matrix, _as_vector,
+                              _normalize_bounds, linprog_revised)
+
+FEASIBILITY_TOL = 1e-7  # Допуск нарушения строк и границ, относительно 1 + |b|
+
+
+@dataclass
+class Reduction:
+    kind: str  # "fixed", "empty_row", "singleton_eq", "singleton_row", "redundant_row", "dominated_column",
+    # "unbounded_column"
+    row: int = -1  # Номер удалённой строки (A_ub, затем A_eq)
+    column: int = -1  # Номер удалённой или изменённой переменной
+    coef: float = 0.0  # Коэффициент строки-синглтона
+    value: float = 0.0  # Значение фиксированной переменной или новая граница
+
+
+@dataclass
+class PresolveStats:
+    original: tuple  # (строк, столбцов, ненулевых) исходной задачи
+    reduced: tuple  # То же после упрощения
+    removed: dict = field(default_factory=dict)  # Число удалений по видам
+    time: float = 0.0  # Время presolve, с
+
+
+class Presolve:
+    """Упрощение задачи ЛП с обратимым журналом.
+
+    reduced() — параметры упрощённой задачи для любого решателя вида "lp",
+    postsolve(result) — LPResult исходной задачи по решению упрощённой.
+    status — OPTIMAL, если упрощение не обнаружило несовместность (INFEASIBLE);
+    unbounded — найден неограниченный луч: задача неограничена, если
+    совместна упрощённая задача (postsolve тогда возвращает UNBOUNDED).
+    """
+
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None):
+        start = time.perf_counter()
+        self.c = np.asarray(c, dtype=float).ravel()
+        n = self.c.size
+        A_ub = _as_matrix(A_ub, n)
+        A_eq = _as_matrix(A_eq, n)
+        self.m_ub, self.m_eq = A_ub.shape[0], A_eq.shape[0]
+        self.A = sp.vstack([A_ub, A_eq]).tocsr()
+        self.A.eliminate_zeros()
+        self.A_csc = self.A.tocsc()
+        self.b0 = np.concatenate([_as_vector(b_ub, self.m_ub), _as_vector(b_eq, self.m_eq)])
+        self.b = self.b0.copy()  # Правые части за вычетом фиксированных переменных
+        self.lb, self.ub = _normalize_bounds(bounds, n)
+        self.x = np.zeros(n)  # Значения удалённых переменных
+        self.rows = np.ones(self.A.shape[0], dtype=bool)  # Оставшиеся строки
+        self.cols = np.ones(n, dtype=bool)  # Оставшиеся переменные
+        self.log = []
+        self.status = OPTIMAL
+        self.unbounded = False
+        self._run()
+        self.time = time.perf_counter() - start
+
+    # ------------------------------------------------------------------
+    # Проходы упрощения
+    # ------------------------------------------------------------------
+    def _run(self):
+        A = self.A
+        pattern = A.copy()
+        pattern.data[:] = 1.0
+        positive, negative = A.maximum(0).tocsr(), A.minimum(0).tocsr()
+        self._pattern = pattern
+        self._signs = (positive, negative, positive.sign(), -negative.sign())
+        is_ub = np.arange(A.shape[0]) < self.m_ub
+        steps = (self._fixed, self._empty_rows, self._singleton_rows, self._redundant_rows, self._dominated)
+        changed = True
+        while changed and self.status == OPTIMAL:
+            changed = False
+            for step in steps:
+                changed |= step(is_ub)
+                if self.status != OPTIMAL:
+                    return
+
+    def _tolerance(self, rows):
+        return FEASIBILITY_TOL * (1.0 + np.abs(self.b0[rows]))
+
+    def _fix(self, columns, values, kind):
+        # Подстановка x_j = value во все строки
+        self.x[columns] = values
+        self.cols[columns] = False
+        self.b -= self.A_csc[:, columns] @ values
+        self.log.extend(Reduction(kind, column=int(j), value=float(v)) for j, v in zip(columns, values))
+
+    def _fixed(self, is_ub):
+        columns = np.flatnonzero(self.cols & (self.ub - self.lb <= 0))
+        if columns.size:
+            self._fix(columns, self.lb[columns], "fixed")
+        return bool(columns.size)
+
+    def _counts(self):
+        return self._pattern @ self.cols.astype(float)
+
+    def _empty_rows(self, is_ub):
+        rows = np.flatnonzero(self.rows & (self._counts() == 0))
+        if not rows.size:
+            return False
+        b, tol = self.b[rows], self._tolerance(rows)
+        if np.any(np.where(is_ub[rows], b < -tol, np.abs(b) > tol)):
+            self.status = INFEASIBLE
+        self.rows[rows] = False
+        self.log.extend(Reduction("empty_row", row=int(i)) for i in rows)
+        return True
+
+    def _singleton_rows(self, is_ub):
+        rows = np.flatnonzero(self.rows & (self._counts() == 1))
+        A = self.A
+        for i in rows:
+            start, end = A.indptr[i], A.indptr[i + 1]
+            active = self.cols[A.indices[start:end]]
+            if not np.any(active):
+                continue  # Переменную уже зафиксировала другая строка этого прохода
+            j = int(A.indices[start:end][active][0])
+            a = float(A.data[start:end][active][0])
+            value = self.b[i] / a
+            tol = FEASIBILITY_TOL * (1.0 + abs(value))
+            self.rows[i] = False
+            if is_ub[i]:
+                # a x_j <= b: верхняя граница при a > 0, нижняя при a < 0
+                if a > 0 and value < self.ub[j]:
+                    self.ub[j] = value
+                elif a < 0 and value > self.lb[j]:
+                    self.lb[j] = value
+                self.log.append(Reduction("singleton_row", int(i), j, a, value))
+                if self.lb[j] > self.ub[j] + tol:
+                    self.status = INFEASIBLE
+                    return True
+                self.lb[j] = min(self.lb[j], self.ub[j])
+            else:
+                if value < self.lb[j] - tol or value > self.ub[j] + tol:
+                    self.status = INFEASIBLE
+                    return True
+                value = min(max(value, self.lb[j]), self.ub[j])
+                self.log.append(Reduction("singleton_eq", int(i), j, a, value))
+                self.x[j] = value
+                self.cols[j] = False
+                column = slice(self.A_csc.indptr[j], self.A_csc.indptr[j + 1])
+                self.b[self.A_csc.indices[column]] -= self.A_csc.data[column] * value
+        return bool(rows.size)
+
+    def _activity(self):
+        # Наименьшая и наибольшая активность строк по границам оставшихся переменных;
+        # бесконечные слагаемые считаются отдельно
+        positive, negative, positive_pattern, negative_pattern = self._signs
+        lb_finite = self.cols & np.isfinite(self.lb)
+        ub_finite = self.cols & np.isfinite(self.ub)
+        lb = np.where(lb_finite, self.lb, 0.0)
+        ub = np.where(ub_finite, self.ub, 0.0)
+        lb_infinite = (self.cols & ~lb_finite).astype(float)
+        ub_infinite = (self.cols & ~ub_finite).astype(float)
+        low = positive @ lb + negative @ ub
+        high = positive @ ub + negative @ lb
+        low_infinite = positive_pattern @ lb_infinite + negative_pattern @ ub_infinite
+        high_infinite = positive_pattern @ ub_infinite + negative_pattern @ lb_infinite
+        return np.where(low_infinite > 0, -np.inf, low), np.where(high_infinite > 0, np.inf, high)
+
+    def _redundant_rows(self, is_ub):
+        low, high = self._activity()
+        tol = self._tolerance(slice(None))
+        if np.any(self.rows & ((low > self.b + tol) | (~is_ub & (high < self.b - tol)))):
+            self.status = INFEASIBLE
+            return True
+        rows = np.flatnonzero(self.rows & is_ub & (high <= self.b))
+        self.rows[rows] = False
+        self.log.extend(Reduction("redundant_row", row=int(i)) for i in rows)
+        return bool(rows.size)
+
+    def _dominated(self, is_ub):
+        _, _, positive_pattern, negative_pattern = self._signs
+        active_ub = (self.rows & is_ub).astype(float)
+        in_eq = self._pattern.T @ (self.rows & ~is_ub).astype(float) > 0
+        has_positive = positive_pattern.T @ active_ub > 0
+        has_negative = negative_pattern.T @ active_ub > 0
+        c = self.c
+        # Уменьшение x_j не ухудшает цель и не нарушает строк — x_j на нижней границе; и наоборот
+        lower = self.cols & ~in_eq & ~has_negative & (c >= 0)
+        upper = self.cols & ~in_eq & ~has_positive & (c <= 0)
+        ray = (lower & (c > 0) & np.isinf(self.lb)) | (upper & (c < 0) & np.isinf(self.ub))
+        if np.any(ray):
+            # Строки этих столбцов выполнимы при x_j, уходящем в бесконечность, — удаляются вместе с ними
+            columns = np.flatnonzero(ray)
+            rows = np.flatnonzero(self.rows & (self._pattern[:, columns] @ np.ones(columns.size) > 0))
+            self.cols[columns] = False
+            self.rows[rows] = False
+            self.log.extend(Reduction("unbounded_column", column=int(j)) for j in columns)
+            self.log.extend(Reduction("redundant_row", row=int(i)) for i in rows)
+            self.unbounded = True
+            return True
+        to_lower = lower & np.isfinite(self.lb)
+        to_upper = upper & np.isfinite(self.ub) & ~to_lower
+        free = lower & upper & ~to_lower & ~to_upper  # Пустой столбец без цены и границ
+        columns = np.flatnonzero(to_lower | to_upper | free)
+        if columns.size:
+            values = np.where(to_lower, self.lb, np.where(to_upper, self.ub, 0.0))[columns]
+            self._fix(columns, values, "dominated_column")
+        return bool(columns.size)
+
+    # ------------------------------------------------------------------
+    # Упрощённая задача и восстановление решения
+    # ------------------------------------------------------------------
+    @property
+    def stats(self):
+        rows, cols = np.flatnonzero(self.rows), np.flatnonzero(self.cols)
+        nnz = self._pattern[rows][:, cols].nnz
+        return PresolveStats((self.A.shape[0], self.c.size, self.A.nnz), (rows.size, cols.size, nnz),
+                             dict(Counter(r.kind for r in self.log)), self.time)
+
+    def reduced(self):
+        """Параметры упрощённой задачи: c, A_ub, b_ub, A_eq, b_eq, bounds."""
+        cols = np.flatnonzero(self.cols)
+        ub_rows = np.flatnonzero(self.rows[:self.m_ub])
+        eq_rows = self.m_ub + np.flatnonzero(self.rows[self.m_ub:])
+        bounds = [(None if np.isinf(lo) else lo, None if np.isinf(hi) else hi)
+                  for lo, hi in zip(self.lb[cols].tolist(), self.ub[cols].tolist())]
+        return dict(c=self.c[cols], A_ub=self.A[ub_rows][:, cols], b_ub=self.b[ub_rows],
+                    A_eq=self.A[eq_rows][:, cols], b_eq=self.b[eq_rows], bounds=bounds)
+
+    def postsolve(self, result=None):
+        """LPResult исходной задачи по решению упрощённой (result; None — решать нечего)."""
+        x = self.x.copy()
+        y = np.zeros(self.A.shape[0])
+        cols = np.flatnonzero(self.cols)
+        if result is None:
+            result = LPResult(x=np.zeros(0), fun=0.0, status=self.status, message=MESSAGES[self.status], nit=0)
+        else:
+            y[np.flatnonzero(self.rows[:self.m_ub])] = result.ineqlin
+            y[self.m_ub + np.flatnonzero(self.rows[self.m_ub:])] = result.eqlin
+        if result.x.size == cols.size:
+            x[cols] = result.x
+
+        A = self.A_csc
+        for reduction in reversed(self.log):
+            if reduction.kind not in ("singleton_eq", "singleton_row"):
+                continue
+            i, j, a = reduction.row, reduction.column, reduction.coef
+            start, end = A.indptr[j], A.indptr[j + 1]
+            y[i] = 0.0
+            d = self.c[j] - A.data[start:end] @ y[A.indices[start:end]]  # Оценка x_j без этой строки
+            if reduction.kind == "singleton_eq":
+                y[i] = d / a
+            elif abs(x[j] - reduction.value) <= FEASIBILITY_TOL * (1.0 + abs(reduction.value)) and d * a < 0:
+                y[i] = d / a  # x_j на границе этой строки: оценка переходит к строке
+
+        if self.unbounded and result.status == OPTIMAL:
+            result = replace(result, status=UNBOUNDED, message=MESSAGES[UNBOUNDED])
+        A_ub, A_eq = self.A[:self.m_ub], self.A[self.m_ub:]
+        return replace(result, x=x, fun=float(self.c @ x), ineqlin=y[:self.m_ub], eqlin=y[self.m_ub:],
+                       slack=self.b0[:self.m_ub] - A_ub @ x, con=self.b0[self.m_ub:] - A_eq @ x,
+                       basis=None, presolve=self.stats)
+
+
+def linprog_presolved(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, solver=linprog_revised,
+                      **options):
+    """presolve, решение упрощённой задачи решателем solver (linprog_revised,
+    linprog_interior, ...) и postsolve. LPResult.presolve — размеры задачи
+    до и после упрощения; time — общее время. После найденного луча
+    упрощённая задача решается с нулевой целью — только на совместность."""
+    start = time.perf_counter()
+    presolve = Presolve(c, A_ub, b_ub, A_eq, b_eq, bounds)
+    result = None
+    if presolve.status == OPTIMAL and np.any(presolve.cols):
+        problem = presolve.reduced()
+        if presolve.unbounded:
+            problem["c"] = np.zeros_like(problem["c"])
+        result = solver(**problem, **options)
+    result = presolve.postsolve(result)
+    result.time = time.perf_counter() - start
+    return result
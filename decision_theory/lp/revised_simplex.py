@@ -0,0 +1,688 @@
+"""Модифицированный (revised) симплекс-метод на NumPy / scipy.sparse.
+
+Задача:  min c^T x  при  A_ub x <= b_ub,  A_eq x = b_eq,  lb <= x <= ub.
+
+Базисная матрица хранится в виде LU-разложения (scipy.sparse.linalg.splu),
+а между перефакторизациями обновляется в мультипликативной форме
+(product form of the inverse, «eta-файл»). Таблица целиком не строится:
+на каждой итерации решаются две системы с базисом (FTRAN / BTRAN).
+
+Режимы поиска начального базиса:
+  * "two_phase" — двухэтапный метод: на I этапе минимизируется сумма
+    искусственных переменных, верхние границы переменных учитываются
+    неявно (небазисная переменная стоит на нижней или на верхней границе);
+  * "big_m" — метод больших штрафов, как в табличном методе (tableau.py): искусственные
+    переменные штрафуются константой M, верхние границы — отдельные строки.
+    Если задача с штрафом неограничена или в ответе остались искусственные
+    переменные, допустимость проверяется I этапом двухэтапного метода.
+
+Итоговый базис возвращается в LPResult.basis и может служить стартовым для
+повторного решения: после изменения правых частей — двойственным
+симплекс-методом, после изменения коэффициентов цели — прямым (resolve).
+
+observer (observers.py) получает на каждой итерации значение цели этапа,
+шаг theta, входящую и выходящую переменные стандартной формы; этапы —
+"phase1", "phase2", "big_m", "dual" (двойственный метод при resolve).
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+# Коды завершения (совпадают с scipy.optimize.linprog)
+OPTIMAL = 0
+ITERATION_LIMIT = 1
+INFEASIBLE = 2
+UNBOUNDED = 3
+
+MESSAGES = {
+    OPTIMAL: "Оптимальное решение найдено.",
+    ITERATION_LIMIT: "Достигнут предел числа итераций.",
+    INFEASIBLE: "Задача несовместна.",
+    UNBOUNDED: "Целевая функция не ограничена снизу.",
+}
+
+METHODS = ("two_phase", "big_m")
+
+
+@dataclass
+class Basis:
+    """Базис стандартной формы: номера базисных столбцов по строкам и
+    признак «небазисная переменная на верхней границе»."""
+    basic: np.ndarray
+    at_upper: np.ndarray
+
+    @property
+    def indexes(self):
+        # Пары (строка, столбец) в нумерации симплекс-таблицы из tableau.py
+        return [(i + 1, int(j) + 1) for i, j in enumerate(self.basic)]
+
+    def copy(self):
+        return Basis(self.basic.copy(), self.at_upper.copy())
+
+
+@dataclass
+class LPResult:
+    x: np.ndarray  # Значения исходных переменных
+    fun: float  # Значение целевой функции
+    status: int
+    message: str
+    nit: int  # Число итераций (замен базиса и переходов переменной на другую границу)
+    ineqlin: np.ndarray = field(default_factory=lambda: np.zeros(0))  # Двойственные оценки A_ub
+    eqlin: np.ndarray = field(default_factory=lambda: np.zeros(0))  # Двойственные оценки A_eq
+    slack: np.ndarray = field(default_factory=lambda: np.zeros(0))  # b_ub - A_ub x
+    con: np.ndarray = field(default_factory=lambda: np.zeros(0))  # b_eq - A_eq x
+    method: str = "two_phase"
+    nit_phase1: int = 0  # Итерации I этапа (поиск допустимого базиса)
+    time: float = 0.0  # Время решения, с
+    shape: tuple = (0, 0)  # Размер задачи в стандартной форме (строки, столбцы)
+    nit_dual: int = 0  # Итерации двойственного симплекс-метода при повторном решении
+    nit_crossover: int = 0  # Итерации симплекс-метода после метода внутренней точки (crossover)
+    basis: Optional[Basis] = None  # Итоговый базис для тёплого старта
+    presolve: Optional[object] = None  # PresolveStats: размеры задачи до и после presolve
+
+    @property
+    def success(self):
+        return self.status == OPTIMAL
+
+
+def _as_matrix(A, n):
+    if A is None:
+        return sp.csr_matrix((0, n))
+    if sp.issparse(A):
+        return sp.csr_matrix(A, dtype=float)
+    return sp.csr_matrix(np.atleast_2d(np.asarray(A, dtype=float)))
+
+
+def _as_vector(b, m):
+    if b is None:
+        return np.zeros(m)
+    return np.asarray(b, dtype=float).ravel()
+
+
+def _normalize_bounds(bounds, n):
+    # Допустимые формы: None, одна пара (lb, ub) для всех переменных, список пар
+    if bounds is None:
+        bounds = (0, None)
+    if len(bounds) == 2 and not isinstance(bounds[0], (tuple, list)) \
+            and not isinstance(bounds[1], (tuple, list)):
+        bounds = [bounds] * n
+    if len(bounds) != n:
+        raise ValueError("Число границ не совпадает с числом переменных.")
+    lb = np.array([-np.inf if b[0] is None else b[0] for b in bounds], dtype=float)
+    ub = np.array([np.inf if b[1] is None else b[1] for b in bounds], dtype=float)
+    if np.any(lb > ub):
+        raise ValueError("Нижняя граница переменной больше верхней.")
+    return lb, ub
+
+
+def equilibrate(A, passes=4):
+    """Масштабирование строк и столбцов: A' = diag(R) A diag(C).
+
+    Несколько проходов геометрического среднего, затем округление
+    множителей до степеней двойки (масштабирование без ошибок округления).
+    """
+    A = sp.csr_matrix(A)
+    m, n = A.shape
+    R, C = np.ones(m), np.ones(n)
+    if A.nnz == 0:
+        return R, C
+    absA = abs(A)
+    for _ in range(passes):
+        S = sp.diags(R) @ absA @ sp.diags(C)
+        row_max = S.max(axis=1).toarray().ravel()
+        row_min = _nonzero_min(S.tocsr(), axis=1, default=1.0)
+        R /= np.sqrt(np.where(row_max > 0, row_max * row_min, 1.0))
+        S = sp.diags(R) @ absA @ sp.diags(C)
+        col_max = S.max(axis=0).toarray().ravel()
+        col_min = _nonzero_min(S.tocsc(), axis=0, default=1.0)
+        C /= np.sqrt(np.where(col_max > 0, col_max * col_min, 1.0))
+    return np.exp2(np.round(np.log2(R))), np.exp2(np.round(np.log2(C)))
+
+
+def _nonzero_min(S, axis, default):
+    # Минимум модулей ненулевых элементов по строкам (axis=1) или столбцам (axis=0)
+    size = S.shape[0] if axis == 1 else S.shape[1]
+    result = np.full(size, default)
+    counts = np.diff(S.indptr)
+    nonempty = np.flatnonzero(counts)
+    if nonempty.size:
+        result[nonempty] = np.minimum.reduceat(np.abs(S.data), S.indptr[nonempty])
+    return result
+
+
+class _Basis:
+    """LU-разложение базиса B0 и eta-файл обновлений B = B0 E1 E2 ... Ek."""
+
+    def __init__(self, A, basis):
+        self.lu = splu(sp.csc_matrix(A[:, basis]), permc_spec="COLAMD")
+        self.etas = []
+
+    def ftran(self, a):
+        # z = B^{-1} a
+        z = self.lu.solve(a)
+        for r, d in self.etas:
+            zr = z[r] / d[r]
+            z -= zr * d
+            z[r] = zr
+        return z
+
+    def btran(self, c):
+        # y^T = c^T B^{-1}
+        w = np.array(c, dtype=float)
+        for r, d in reversed(self.etas):
+            wr = w[r]
+            w[r] = (wr - (w @ d - wr * d[r])) / d[r]
+        return self.lu.solve(w, trans="T")
+
+    def update(self, r, d):
+        self.etas.append((r, d.copy()))
+
+
+class RevisedSimplex:
+    """Решатель задачи ЛП модифицированным симплекс-методом.
+
+    Ограничения приводятся к виду A x = b, 0 <= x <= u добавлением
+    дополнительных и искусственных переменных. method — "two_phase"
+    (по умолчанию) или "big_m"; scale — масштабировать ли строки и столбцы
+    перед решением; observer — приёмник событий итераций (observers.py).
+    """
+
+    def __init__(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None,
+                 method="two_phase", scale=True, big_m=None, tol=1e-9, max_iter=None,
+                 refactor_every=64, observer=None):
+        if method not in METHODS:
+            raise ValueError(f"Неизвестный метод {method!r}, допустимы: {', '.join(METHODS)}.")
+        self.c = np.asarray(c, dtype=float).ravel()
+        n = self.c.size
+        self.A_ub = _as_matrix(A_ub, n)
+        self.A_eq = _as_matrix(A_eq, n)
+        self.b_ub = _as_vector(b_ub, self.A_ub.shape[0])
+        self.b_eq = _as_vector(b_eq, self.A_eq.shape[0])
+        self.lb, self.ub = _normalize_bounds(bounds, n)
+        self.method = method
+        self.scale = scale
+        self.big_m = big_m
+        self.tol = tol
+        self.max_iter = max_iter
+        self.refactor_every = refactor_every
+        self.observer = observer
+        self.basis = None  # Базис последнего решения
+        self._build_standard_form()
+
+    # ------------------------------------------------------------------
+    # Приведение к стандартной форме
+    # ------------------------------------------------------------------
+    def _build_standard_form(self):
+        n = self.c.size
+        lb, ub = self.lb, self.ub
+        implicit_bounds = self.method == "two_phase"
+
+        # x = offset + T @ x_std, 0 <= x_std <= upper
+        offset = np.zeros(n)
+        rows, cols, vals = [], [], []
+        upper = []
+        ub_rows = []  # (индекс столбца x_std, величина верхней границы) для режима big_m
+        k = 0
+        for j in range(n):
+            if np.isfinite(lb[j]):
+                offset[j] = lb[j]
+                rows.append(j), cols.append(k), vals.append(1.0)
+                width = ub[j] - lb[j]
+                if np.isfinite(width) and not implicit_bounds:
+                    ub_rows.append((k, width))
+                    width = np.inf
+                upper.append(width)
+                k += 1
+            elif np.isfinite(ub[j]):
+                offset[j] = ub[j]
+                rows.append(j), cols.append(k), vals.append(-1.0)
+                upper.append(np.inf)
+                k += 1
+            else:
+                # Свободная переменная: x = x+ - x-
+                rows += [j, j]
+                cols += [k, k + 1]
+                vals += [1.0, -1.0]
+                upper += [np.inf, np.inf]
+                k += 2
+        T = sp.csr_matrix((vals, (rows, cols)), shape=(n, k))
+        self._offset, self._T = offset, T
+
+        m_ub, m_eq = self.A_ub.shape[0], self.A_eq.shape[0]
+        m_bnd = len(ub_rows)
+        if m_bnd:
+            bnd_cols, bnd_rhs = zip(*ub_rows)
+            A_bnd = sp.csr_matrix((np.ones(m_bnd), (np.arange(m_bnd), bnd_cols)), shape=(m_bnd, k))
+        else:
+            bnd_rhs = ()
+            A_bnd = sp.csr_matrix((0, k))
+        self._bnd_rhs = np.asarray(bnd_rhs, dtype=float)
+
+        # Строки-неравенства (включая верхние границы в режиме big_m) получают дополнительные переменные
+        A_le = sp.vstack([self.A_ub @ T, A_bnd]).tocsr()
+        A_e = (self.A_eq @ T).tocsr()
+
+        m_le = A_le.shape[0]
+        m = m_le + A_e.shape[0]
+        A_struct = sp.vstack([A_le, A_e]).tocsr()
+        upper = np.array(upper, dtype=float)
+
+        # Масштабирование: A' = R A C, b' = R b, c' = C c, u' = u / C
+        if self.scale:
+            R, C = equilibrate(A_struct)
+        else:
+            R, C = np.ones(m), np.ones(k)
+        A_struct = sp.diags(R) @ A_struct @ sp.diags(C)
+        upper = upper / C
+        self._row_scale, self._col_scale = R, C
+        b = self._rhs()
+
+        S = sp.vstack([sp.identity(m_le), sp.csr_matrix((m - m_le, m_le))])
+
+        # Искусственная переменная нужна в каждом равенстве и в неравенствах с b < 0
+        need_art = np.ones(m, dtype=bool)
+        need_art[:m_le] = b[:m_le] < 0
+        art_rows = np.flatnonzero(need_art)
+        art_sign = np.where(b[art_rows] < 0, -1.0, 1.0)
+        Art = sp.csr_matrix((art_sign, (art_rows, np.arange(art_rows.size))), shape=(m, art_rows.size))
+
+        self.A = sp.hstack([A_struct, S, Art]).tocsc()
+        self.b = b
+        self.m, self.N = self.A.shape
+        self.n_struct = k
+        self.n_slack = m_le
+        self.m_ub, self.m_eq, self.m_bnd = m_ub, m_eq, m_bnd
+        self.art_start = k + m_le
+        self.art_rows = art_rows
+
+        self.cost = self._costs()
+        self.upper = np.concatenate([upper, np.full(m_le + art_rows.size, np.inf)])
+
+        # Начальный базис: дополнительные переменные, где это возможно, иначе искусственные
+        basis = k + np.arange(m)
+        basis[art_rows] = self.art_start + np.arange(art_rows.size)
+        self._initial_basis = basis
+
+    def _rhs(self):
+        # Правая часть стандартной формы: сдвиг на нижние границы и масштабирование строк
+        b_le = np.concatenate([self.b_ub - self.A_ub @ self._offset, self._bnd_rhs])
+        b_e = self.b_eq - self.A_eq @ self._offset
+        return self._row_scale * np.concatenate([b_le, b_e])
+
+    def _costs(self):
+        c_std = self._col_scale * (self._T.T @ self.c)
+        return np.concatenate([c_std, np.zeros(self.N - self.n_struct)])
+
+    # ------------------------------------------------------------------
+    # Вспомогательные операции
+    # ------------------------------------------------------------------
+    def _column(self, q):
+        a = np.zeros(self.m)
+        start, end = self.A.indptr[q], self.A.indptr[q + 1]
+        a[self.A.indices[start:end]] = self.A.data[start:end]
+        return a
+
+    def _basic_values(self, factor, upper, at_upper):
+        # x_B = B^{-1} (b - A_N x_N), небазисные переменные стоят на границах
+        x_N = np.where(at_upper, upper, 0.0)
+        return factor.ftran(self.b - self.A @ x_N)
+
+    def _observe(self, phase, nit, cost, basis, x_B, upper, at_upper, step, entering, leaving):
+        # Цель этапа; на II этапе — в исходных переменных (со сдвигом на нижние границы)
+        fun = cost[basis] @ x_B + cost[at_upper] @ upper[at_upper]
+        if phase != "phase1":
+            fun += self.c @ self._offset
+        self.observer.event(nit, fun, step=step, entering=entering, leaving=leaving, phase=phase)
+
+    def _iterate(self, cost, basis, at_upper, upper, max_iter, factor=None, phase="phase2"):
+        """Прямой симплекс-метод с неявным учётом границ 0 <= x <= upper.
+
+        basis и at_upper изменяются на месте; phase — этап для observer.
+        Возвращает (статус, x_B, число итераций, разложение базиса).
+        """
+        tol = self.tol
+        A = self.A
+        is_basic = np.zeros(self.N, dtype=bool)
+        is_basic[basis] = True
+        fixed = upper <= tol
+
+        if factor is None:
+            factor = _Basis(A, basis)
+        x_B = self._basic_values(factor, upper, at_upper)
+        nit = 0
+        degenerate = 0
+
+        while True:
+            if nit >= max_iter:
+                return ITERATION_LIMIT, x_B, nit, factor
+
+            # Оценки (приведённые стоимости) d = c - A^T y
+            y = factor.btran(cost[basis])
+            d = cost - A.T @ y
+            # Переменная на нижней границе улучшает цель при d < 0, на верхней — при d > 0
+            gain = np.where(at_upper, d, -d)
+            gain[is_basic | fixed] = 0.0
+
+            candidates = np.flatnonzero(gain > tol)
+            if candidates.size == 0:
+                return OPTIMAL, x_B, nit, factor
+
+            # Правило Данцига; при затянувшемся зацикливании — правило Бленда
+            bland = degenerate > 50
+            q = candidates[0] if bland else candidates[np.argmax(gain[candidates])]
+            direction = -1.0 if at_upper[q] else 1.0
+
+            col = factor.ftran(self._column(q))
+            alpha = direction * col
+            u_B = upper[basis]
+
+            # Отношения: базисная переменная уходит на нижнюю (alpha > 0) или верхнюю (alpha < 0) границу
+            ratios = np.full(self.m, np.inf)
+            down = alpha > tol
+            ratios[down] = x_B[down] / alpha[down]
+            up = (alpha < -tol) & np.isfinite(u_B)
+            ratios[up] = (u_B[up] - x_B[up]) / -alpha[up]
+            theta = ratios.min() if self.m else np.inf
+
+            if upper[q] <= theta:
+                # Переменная переходит на противоположную границу без смены базиса
+                theta = upper[q]
+                if not np.isfinite(theta):
+                    return UNBOUNDED, x_B, nit, factor
+                x_B -= theta * alpha
+                at_upper[q] = not at_upper[q]
+                nit += 1
+                degenerate = 0
+                if self.observer is not None:
+                    self._observe(phase, nit, cost, basis, x_B, upper, at_upper, theta, q, None)
+                continue
+
+            ties = np.flatnonzero(ratios <= theta + tol)
+            if bland:
+                r = ties[np.argmin(basis[ties])]
+            else:
+                r = ties[np.argmax(np.abs(alpha[ties]))]
+            theta = max(ratios[r], 0.0)
+            degenerate = degenerate + 1 if theta <= tol else 0
+
+            leaving = basis[r]
+            x_B -= theta * alpha
+            x_B[r] = theta if direction > 0 else upper[q] - theta
+            at_upper[leaving] = alpha[r] < 0
+            at_upper[q] = False
+            is_basic[leaving] = False
+            is_basic[q] = True
+            basis[r] = q
+            nit += 1
+            if self.observer is not None:
+                self._observe(phase, nit, cost, basis, x_B, upper, at_upper, theta, q, leaving)
+
+            factor.update(r, col)
+            if len(factor.etas) >= self.refactor_every:
+                factor = _Basis(A, basis)
+                x_B = self._basic_values(factor, upper, at_upper)
+
+    def _dual_iterate(self, cost, basis, at_upper, upper, max_iter, factor=None):
+        """Двойственный симплекс-метод: базис двойственно допустим, а базисные
+        переменные могут нарушать границы 0 <= x_B <= upper.
+
+        basis и at_upper изменяются на месте.
+        Возвращает (статус, x_B, число итераций, разложение базиса).
+        """
+        tol = self.tol
+        A = self.A
+        is_basic = np.zeros(self.N, dtype=bool)
+        is_basic[basis] = True
+        fixed = upper <= tol
+
+        if factor is None:
+            factor = _Basis(A, basis)
+        x_B = self._basic_values(factor, upper, at_upper)
+        nit = 0
+
+        while True:
+            if nit >= max_iter:
+                return ITERATION_LIMIT, x_B, nit, factor
+
+            # Покидает базис переменная с наибольшим нарушением границы
+            u_B = upper[basis]
+            below = -x_B
+            above = x_B - u_B
+            violation = np.maximum(below, above) / (1.0 + np.abs(x_B))
+            r = int(np.argmax(violation)) if self.m else 0
+            if not self.m or violation[r] <= tol:
+                return OPTIMAL, x_B, nit, factor
+            to_upper = above[r] > below[r]
+
+            # Строка r матрицы B^{-1} A и оценки d = c - A^T y
+            unit = np.zeros(self.m)
+            unit[r] = 1.0
+            alpha_row = A.T @ factor.btran(unit)
+            d = cost - A.T @ factor.btran(cost[basis])
+
+            # Допустимые входящие: движение x_q от своей границы возвращает x_r к границе
+            signed = alpha_row if to_upper else -alpha_row
+            eligible = np.where(at_upper, signed < -tol, signed > tol) & ~is_basic & ~fixed
+            candidates = np.flatnonzero(eligible)
+            if candidates.size == 0:
+                return INFEASIBLE, x_B, nit, factor
+
+            ratios = np.abs(d[candidates]) / np.abs(alpha_row[candidates])
+            ties = candidates[ratios <= ratios.min() + tol]
+            q = ties[np.argmax(np.abs(alpha_row[ties]))]
+
+            col = factor.ftran(self._column(q))
+            target = u_B[r] if to_upper else 0.0
+            delta = (x_B[r] - target) / col[r]
+
+            leaving = basis[r]
+            x_B -= delta * col
+            x_B[r] = (upper[q] if at_upper[q] else 0.0) + delta
+            at_upper[leaving] = to_upper
+            at_upper[q] = False
+            is_basic[leaving] = False
+            is_basic[q] = True
+            basis[r] = q
+            nit += 1
+            if self.observer is not None:
+                self._observe("dual", nit, cost, basis, x_B, upper, at_upper, abs(delta), q, leaving)
+
+            factor.update(r, col)
+            if len(factor.etas) >= self.refactor_every:
+                factor = _Basis(A, basis)
+                x_B = self._basic_values(factor, upper, at_upper)
+
+    def _max_iter(self):
+        return self.max_iter if self.max_iter is not None else 50 * (self.m + self.N)
+
+    def _infeasible(self, x_std):
+        # Искусственная переменная строки i должна быть нулём с точностью до 1e-7 (1 + |b_i|)
+        return np.any(x_std[self.art_start:] > 1e-7 * (1.0 + np.abs(self.b[self.art_rows])))
+
+    def _working_cost(self):
+        # В режиме big_m искусственные переменные штрафуются константой M
+        cost = self.cost.copy()
+        if self.method == "big_m" and self.art_rows.size:
+            big_m = self.big_m
+            if big_m is None:
+                big_m = 1e4 * max(1.0, np.abs(self.cost).max(initial=0.0))
+            cost[self.art_start:] = big_m
+        return cost
+
+    def _working_upper(self):
+        # После I этапа искусственные переменные зафиксированы в нуле
+        upper = self.upper.copy()
+        if self.method == "two_phase":
+            upper[self.art_start:] = 0.0
+        return upper
+
+    # ------------------------------------------------------------------
+    # Решение
+    # ------------------------------------------------------------------
+    def solve(self, basis=None):
+        """Решение задачи; basis — стартовый базис (например, LPResult.basis другой
+        задачи той же структуры), иначе начальный базис строится заново."""
+        start = time.perf_counter()
+        if basis is not None:
+            return self._solve_from(basis, start)
+        if self.observer is not None:
+            self.observer.start("revised_simplex")
+
+        max_iter = self._max_iter()
+        basis = self._initial_basis.copy()
+        at_upper = np.zeros(self.N, dtype=bool)
+        upper = self.upper.copy()
+        nit_phase1 = 0
+
+        if self.method == "big_m":
+            cost = self._working_cost()
+            status, x_B, nit, factor = self._iterate(cost, basis, at_upper, upper, max_iter, phase="big_m")
+            if self.art_rows.size and (status == UNBOUNDED or status == OPTIMAL and self._infeasible(
+                    self._expand(basis, x_B, upper, at_upper))):
+                # Неограниченность или искусственные переменные в ответе при конечном M
+                # ничего не говорят о допустимости — она проверяется I этапом с нуля
+                nit_big_m = nit
+                basis = self._initial_basis.copy()
+                at_upper[:] = False
+                status, x_B, nit, nit_phase1, factor, upper, cost = self._two_phase(
+                    basis, at_upper, max_iter - nit_big_m)
+                nit += nit_big_m
+        else:
+            status, x_B, nit, nit_phase1, factor, upper, cost = self._two_phase(basis, at_upper, max_iter)
+
+        return self._finish(status, basis, x_B, at_upper, upper, factor, cost, start,
+                            nit=nit, nit_phase1=nit_phase1)
+
+    def _two_phase(self, basis, at_upper, max_iter):
+        # I этап (если есть искусственные переменные) и II этап с исходной целью
+        upper = self.upper.copy()
+        status, nit, nit_phase1, x_B, factor = OPTIMAL, 0, 0, None, None
+        if self.art_rows.size:
+            # I этап: минимизация суммы искусственных переменных
+            cost = np.zeros(self.N)
+            cost[self.art_start:] = 1.0
+            status, x_B, nit_phase1, factor = self._iterate(cost, basis, at_upper, upper, max_iter,
+                                                            phase="phase1")
+            x_std = self._expand(basis, x_B, upper, at_upper)
+            if status == OPTIMAL and self._infeasible(x_std):
+                status = INFEASIBLE
+            # Искусственные переменные фиксируются в нуле и больше не входят в базис
+            upper = self.upper.copy()
+            upper[self.art_start:] = 0.0
+        cost = self.cost
+        if status == OPTIMAL:
+            status, x_B, nit, factor = self._iterate(cost, basis, at_upper, upper, max_iter - nit_phase1)
+        return status, x_B, nit, nit_phase1, factor, upper, cost
+
+    def resolve(self, c=None, b_ub=None, b_eq=None, basis=None):
+        """Повторное решение после изменения цели c и/или правых частей b_ub, b_eq.
+
+        Старт с basis (по умолчанию — базис последнего решения). Новые правые
+        части сохраняют двойственную допустимость базиса — допустимость x_B
+        восстанавливается двойственным симплекс-методом; новые коэффициенты
+        цели сохраняют прямую допустимость — оптимум ищется прямым методом.
+        """
+        start = time.perf_counter()
+        basis = basis if basis is not None else self.basis
+        if b_ub is not None:
+            self.b_ub = _as_vector(b_ub, self.m_ub)
+        if b_eq is not None:
+            self.b_eq = _as_vector(b_eq, self.m_eq)
+        if basis is None:
+            # Базиса для тёплого старта нет — решение с нуля
+            if c is not None:
+                self.c = np.asarray(c, dtype=float).ravel()
+            self._build_standard_form()
+            return self.solve()
+        if b_ub is not None or b_eq is not None:
+            self.b = self._rhs()
+        return self._solve_from(basis, start, c)
+
+    def _solve_from(self, basis, start, c=None):
+        if basis.basic.size != self.m or basis.at_upper.size != self.N:
+            raise ValueError("Базис не соответствует размерности задачи.")
+        if self.observer is not None:
+            self.observer.start("revised_simplex")
+        basic = basis.basic.copy()
+        at_upper = basis.at_upper.copy()
+        upper = self._working_upper()
+        max_iter = self._max_iter()
+        cost = self._working_cost()
+
+        factor = _Basis(self.A, basic)
+        x_B = self._basic_values(factor, upper, at_upper)
+        primal_feasible = np.all(x_B >= -self.tol * (1.0 + np.abs(x_B))) and \
+            np.all(x_B <= upper[basic] + self.tol * (1.0 + np.abs(x_B)))
+        nit_dual = 0
+        status = OPTIMAL
+
+        if not primal_feasible:
+            d = cost - self.A.T @ factor.btran(cost[basic])
+            nonbasic = np.ones(self.N, dtype=bool)
+            nonbasic[basic] = False
+            movable = nonbasic & (upper > self.tol)
+            dual_feasible = not np.any(np.where(at_upper, d, -d)[movable] > self.tol * (1.0 + np.abs(d[movable])))
+            if not dual_feasible:
+                # Базис не допустим ни в прямом, ни в двойственном смысле — решаем с нуля
+                if c is not None:
+                    self.c = np.asarray(c, dtype=float).ravel()
+                self._build_standard_form()
+                result = self.solve()
+                result.time = time.perf_counter() - start
+                if self.observer is not None:
+                    self.observer.finish()
+                return result
+            status, x_B, nit_dual, factor = self._dual_iterate(cost, basic, at_upper, upper, max_iter, factor)
+
+        if c is not None:
+            self.c = np.asarray(c, dtype=float).ravel()
+            self.cost = self._costs()
+            cost = self._working_cost()
+        nit = 0
+        if status == OPTIMAL:
+            status, x_B, nit, factor = self._iterate(cost, basic, at_upper, upper,
+                                                     max_iter - nit_dual, factor)
+        return self._finish(status, basic, x_B, at_upper, upper, factor, cost, start,
+                            nit=nit, nit_dual=nit_dual)
+
+    def _finish(self, status, basis, x_B, at_upper, upper, factor, cost, start,
+                nit=0, nit_phase1=0, nit_dual=0):
+        x_std = self._expand(basis, x_B, upper, at_upper)
+        if status == OPTIMAL and self._infeasible(x_std):
+            status = INFEASIBLE
+        y = factor.btran(cost[basis])
+        result = self._make_result(status, x_std, y, nit + nit_phase1 + nit_dual)
+        result.nit_phase1 = nit_phase1
+        result.nit_dual = nit_dual
+        result.basis = Basis(basis.copy(), at_upper.copy())
+        self.basis = result.basis
+        result.time = time.perf_counter() - start
+        if self.observer is not None:
+            self.observer.finish()
+        return result
+
+    def _expand(self, basis, x_B, upper, at_upper):
+        x_std = np.where(at_upper, upper, 0.0)
+        x_std[basis] = x_B
+        return x_std
+
+    def _make_result(self, status, x_std, y, nit):
+        # Обратное масштабирование: x = C x', y = R y'
+        x = self._offset + self._T @ (self._col_scale * x_std[:self.n_struct])
+        y = self._row_scale * y
+        fun = float(self.c @ x)
+        slack = self.b_ub - self.A_ub @ x
+        con = self.b_eq - self.A_eq @ x
+        m_ub, m_le = self.m_ub, self.n_slack
+        return LPResult(x=x, fun=fun, status=status, message=MESSAGES[status], nit=nit,
+                        ineqlin=y[:m_ub].copy(), eqlin=y[m_le:].copy(), slack=slack, con=con,
+                        method=self.method, shape=(self.m, self.N))
+
+
+def linprog_revised(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, **options):
+    """Функция-обёртка в стиле scipy.optimize.linprog."""
+    return RevisedSimplex(c, A_ub, b_ub, A_eq, b_eq, bounds, **options).solve()
@@ -0,0 +1,19 @@
+"""Решатели задач линейного программирования для реестра.
+
+solver(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, **options) -> LPResult
+(в стиле scipy.optimize.linprog; min c^T x).
+"""
+from functools import partial
+
+from .interior_point import linprog_interior
+from .presolve import linprog_presolved
+from .revised_simplex import linprog_revised
+
+SOLVERS = {
+    "revised_simplex": linprog_revised,
+    "big_m": partial(linprog_revised, method="big_m"),
+    "interior_point": linprog_interior,
+    "interior_point_crossover": partial(linprog_interior, crossover=True),
+    "revised_simplex_presolve": linprog_presolved,
+    "interior_point_presolve": partial(linprog_presolved, solver=linprog_interior),
+}
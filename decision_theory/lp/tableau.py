@@ -0,0 +1,109 @@
+"""Табличный симплекс-метод (Lab_6) на списках Python.
+
+Таблица — список строк: нулевая строка — оценки целевой функции, нулевой
+столбец — правые части. Искусственные переменные штрафуются большим числом M
+(метод больших штрафов); см. Lab_6_Sinplex_method/main.py.
+
+Промежуточные таблицы и замены базиса передаются observer (observers.py):
+table — таблица перед заменой, event — значение Z после неё, entering —
+ведущий столбец, leaving — ведущая строка.
+"""
+from ..observers import ConsoleObserver, format_table
+
+HEADERS = ("Z", "x1", "x2", "s1", "s2", "a1", "a2")  # Столбцы таблицы задачи Lab_6
+
+
+# Функция для поиска ведущего столбца
+def find_leading_column(matrix):
+    temp_matrix = matrix[0].copy()  # Копируем первую строку
+    temp_matrix.pop(0)  # Удаляем первый элемент (это значение целевой функции)
+    lead_column = temp_matrix.index(min(temp_matrix))  # Находим индекс минимального элемента в строке
+    return lead_column + 1  # Возвращаем индекс столбца, добавляя 1 для соответствия индексации в таблице
+
+# Функция для поиска ведущей строки
+def find_leading_row(matrix):
+    lead_column = find_leading_column(matrix)  # Находим ведущий столбец
+    quotients = []  # Список для хранения значений отношения правой части к элементам ведущего столбца
+    for i in range(1, len(matrix)):  # Проходим по строкам (начиная с 1, так как 0 — это строка целевой функции)
+        if matrix[i][lead_column] > 0:  # Если элемент в ведущем столбце положительный
+            quotients.append(matrix[i][0] / matrix[i][lead_column])  # Вычисляем отношение
+        else:
+            quotients.append(1e8)  # Если элемент в ведущем столбце меньше или равен 0, добавляем большое число
+    lead_row = quotients.index(min(quotients))  # Находим строку с минимальным отношением
+    return lead_row + 1  # Возвращаем индекс ведущей строки (с учетом индексации)
+
+# Функция для обновления симплекс-таблицы
+def write_new_table(matrix):
+    lead_row = find_leading_row(matrix)  # Находим ведущую строку
+    lead_column = find_leading_column(matrix)  # Находим ведущий столбец
+    new_matrix = []  # Новая таблица
+    matrix_row = []  # Вспомогательная переменная для строк новой таблицы
+    lead_element = matrix[lead_row][lead_column]  # Ведущий элемент
+    for i in range(len(matrix)):  # Проходим по всем строкам таблицы
+        if i != lead_row:  # Если текущая строка не ведущая
+            for j in range(len(matrix[0])):  # Проходим по всем столбцам
+                if j != lead_column:  # Если текущий столбец не ведущий
+                    matrix_row.append(
+                        matrix[i][j] - (matrix[i][lead_column] * matrix[lead_row][j]) / lead_element  # Обновляем элементы
+                    )
+                else:
+                    matrix_row.append(0)  # В ведущем столбце обнуляем элементы
+        else:
+            for j in range(len(matrix[0])):  # Для ведущей строки
+                matrix_row.append(matrix[i][j] / lead_element)  # Обновляем элементы ведущей строки
+        new_matrix.append(matrix_row.copy())  # Добавляем обновленную строку в новую таблицу
+        matrix_row.clear()  # Очищаем список для следующей строки
+    return new_matrix  # Возвращаем новую таблицу
+
+# Функция для проверки, завершено ли решение симплекс-метода
+def simplex_done(matrix):
+    for i in range(len(matrix[0])):  # Проходим по всем элементам первой строки
+        if matrix[0][i] < 0:  # Если хотя бы один элемент отрицателен
+            return False  # Решение не завершено
+    return True  # Все элементы первой строки неотрицательные — решение завершено
+
+# Функция для проверки, нет ли решений у задачи
+def simplex_unsolving(matrix):
+    for i in range(len(matrix)):  # Проходим по всем строкам таблицы
+        for j in range(len(matrix[i])):  # Проходим по всем столбцам
+            if matrix[i][j] > 0:  # Если хотя бы один элемент положителен
+                return False  # Решений нет
+    return True  # Если все элементы не положительные — решение существует
+
+# Заголовки столбцов: заданные, если их число совпадает с шириной таблицы, иначе Z, x1, x2, ...
+def table_headers(matrix, headers=HEADERS):
+    if headers is not None and len(headers) == len(matrix[0]):
+        return headers
+    return ["Z"] + [f"x{j}" for j in range(1, len(matrix[0]))]
+
+# Функция для печати симплекс-таблицы
+def print_table(matrix, title, headers=HEADERS):
+    print(f"\n{title}")
+    print(format_table(matrix, table_headers(matrix, headers)))
+
+
+# Основной цикл симплекс-метода; verbose без observer — печать таблиц на экран (ConsoleObserver)
+def simplex_method(matrix, verbose=True, observer=None, headers=HEADERS):
+    if observer is None and verbose:
+        observer = ConsoleObserver(events=False)
+    if observer is not None:
+        observer.start("tableau")
+    indexes = []  # Список индексов ведущих строк и столбцов
+    while not(simplex_done(matrix)):  # Пока не найдено оптимальное решение
+        if simplex_unsolving(matrix):  # Если решение невозможно
+            if observer is None:
+                print('Решений у задачи нет.')
+            else:
+                observer.message('Решений у задачи нет.')
+            break
+        if observer is not None:
+            observer.table("Текущая таблица симплекс-метода:", matrix, table_headers(matrix, headers))
+
+        lead_row, lead_column = find_leading_row(matrix), find_leading_column(matrix)
+        indexes.append((lead_row, lead_column))  # Добавляем индексы ведущих строк и столбцов
+        matrix = write_new_table(matrix)  # Обновляем таблицу
+        if observer is not None:
+            observer.event(len(indexes), matrix[0][0], entering=lead_column, leaving=lead_row)
+    if observer is not None:
+        observer.finish()
+    return matrix, indexes
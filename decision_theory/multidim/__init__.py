@@ -0,0 +1,18 @@
+"""Многомерная безусловная минимизация (Lab_2)."""
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "CachedObjective": "objective",
+    "Objective": "objective",
+    "hook_jiws": "direct",
+    "gradient_const": "direct",
+    "steepest_descent": "gradient_methods",
+    "conjugate_gradient": "gradient_methods",
+    "lbfgs": "gradient_methods",
+    "LBFGSHistory": "gradient_methods",
+    "MINIMIZERS": "minimizers",
+    "register_minimizer": "minimizers",
+    "Multistart": "multistart",
+    "cached_surface": "surface",
+    "grid_values": "surface",
+})
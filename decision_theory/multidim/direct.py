@@ -0,0 +1,99 @@
+"""Прямой поиск и градиентный спуск с постоянным шагом (Lab_2).
+
+objective — CachedObjective / Objective (objective.py): значения берутся
+из его LRU-кэша, градиент — через objective.grad. Методы возвращают
+(x, f(x), итерации, траектория, вычислений функции); observer (observers.py)
+получает на итерации значение в текущей точке и длину шага.
+"""
+import numpy as np
+
+from ..trajectory import ArraySink
+
+
+# Исследующий поиск: по каждой координате пробуются x_i + lamb и x_i - lamb
+# (одним векторным вызовом), лучшая из улучшающих точек становится текущей
+def explore(objective, x, f_x, lamb):
+    x = x.copy()
+    for i in range(len(x)):
+        trial = np.array([x, x])
+        trial[0, i] += lamb
+        trial[1, i] -= lamb
+        values = objective.batch(trial)
+        k = int(np.argmin(values))
+        if values[k] < f_x:
+            x, f_x = trial[k], values[k]
+    return x, f_x
+
+
+# Метод Хука-Дживса: исследующий поиск + поиск по образцу x_p = x + alpha * (x - base).
+# Значения берутся из LRU-кэша objective, поэтому повторные точки не пересчитываются
+def hook_jiws(x0, lamb, epsilon, objective, alpha=1, shrink=0.5, max_iter=None, trajectory=None,
+              observer=None):
+    start_evaluations = objective.evaluations
+    base = np.array(x0, dtype=float)
+    f_base = objective(base)
+    iterations = 0
+    traj = ArraySink() if trajectory is None else trajectory  # Траектория точек
+    traj.record(base)
+    if observer is not None:
+        observer.start("hook_jiws")
+    while lamb >= epsilon and (max_iter is None or iterations < max_iter):
+        iterations += 1
+        x, f_x = explore(objective, base, f_base, lamb)
+        if f_x < f_base:
+            # Пока поиск по образцу удачен, базовая точка сдвигается вдоль направления;
+            # каждый сдвиг — итерация, так что max_iter ограничивает и эти шаги
+            while f_x < f_base:
+                pattern = x + alpha * (x - base)
+                base, f_base = x, f_x
+                traj.record(base)
+                if max_iter is not None and iterations >= max_iter:
+                    break
+                iterations += 1
+                x, f_x = explore(objective, pattern, objective(pattern), lamb)
+            phase = "pattern"
+        else:
+            lamb *= shrink
+            phase = "shrink"
+        if observer is not None:
+            observer.event(iterations, f_base, step=lamb, phase=phase)
+    if observer is not None:
+        observer.finish()
+    return base, f_base, iterations, traj, objective.evaluations - start_evaluations
+
+
+# Градиентный спуск с шагом постоянной длины lamb по направлению антиградиента;
+# шаг делится пополам, если значение не уменьшилось. Каждая точка вычисляется один раз
+def gradient_const(x0, lamb, epsilon, objective, max_iter=None, trajectory=None, observer=None):
+    start_evaluations = objective.evaluations
+
+    def step(x, lamb):
+        g = objective.grad(x)
+        norm = np.linalg.norm(g)
+        if norm > 1e-10:  # Предотвращение деления на ноль
+            g = g / norm
+        return x - g * lamb
+
+    xk = np.array(x0, dtype=float)
+    f_k = objective(xk)
+    xk_1 = step(xk, lamb)
+    f_k1 = objective(xk_1)
+    iterations = 1
+    traj = ArraySink() if trajectory is None else trajectory  # Траектория точек
+    traj.record(xk)
+    if observer is not None:
+        observer.start("gradient_const")
+        observer.event(iterations, f_k1, step=lamb)
+    while abs(f_k1 - f_k) >= epsilon and (max_iter is None or iterations < max_iter):
+        iterations += 1
+        xk, f_k = xk_1, f_k1
+        xk_1 = step(xk, lamb)
+        f_k1 = objective(xk_1)
+        if f_k1 >= f_k:
+            lamb /= 2
+        traj.record(xk)
+        if observer is not None:
+            observer.event(iterations, f_k1, step=lamb)
+    if observer is not None:
+        observer.finish()
+    return xk_1, f_k1, iterations, traj, objective.evaluations - start_evaluations
@@ -0,0 +1,73 @@
+"""Стандартные тестовые функции для методов многомерной минимизации.
+
+Функции записаны через numpy: принимают точку или массив точек по столбцам
+и подходят для дуальных чисел (objective.Dual).
+"""
+import numpy as np
+
+from .objective import Objective
+
+
+def rosenbrock(x):
+    # Расширенная функция Розенброка sum 100 (x_{i+1} - x_i^2)^2 + (1 - x_i)^2, минимум в (1, ..., 1)
+    return np.sum(100.0 * (x[1:] - x[:-1] ** 2) ** 2 + (1.0 - x[:-1]) ** 2, axis=0)
+
+
+def rosenbrock_value_and_grad(x):
+    x = np.asarray(x, dtype=float)
+    head, tail = x[:-1], x[1:]
+    diff = tail - head ** 2
+    value = float(np.sum(100.0 * diff ** 2 + (1.0 - head) ** 2))
+    grad = np.zeros_like(x)
+    grad[:-1] = -400.0 * head * diff - 2.0 * (1.0 - head)
+    grad[1:] += 200.0 * diff
+    return value, grad
+
+
+def rosenbrock_batch(points):
+    return rosenbrock(np.asarray(points, dtype=float).T)
+
+
+def rosenbrock_start(n):
+    # Классическая начальная точка (-1.2, 1, -1.2, 1, ...)
+    x0 = np.ones(n)
+    x0[::2] = -1.2
+    return x0
+
+
+def himmelblau(x):
+    # Функция Химмельблау: четыре минимума со значением 0
+    return (x[0] ** 2 + x[1] - 11) ** 2 + (x[0] + x[1] ** 2 - 7) ** 2
+
+
+def himmelblau_value_and_grad(x):
+    x = np.asarray(x, dtype=float)
+    a = x[0] ** 2 + x[1] - 11
+    b = x[0] + x[1] ** 2 - 7
+    return float(a * a + b * b), np.array([4 * x[0] * a + 2 * b, 2 * a + 4 * x[1] * b])
+
+
+def rastrigin(x):
+    # Функция Растригина 10 n + sum x_i^2 - 10 cos(2 pi x_i): минимум 0 в нуле и решётка локальных
+    return np.sum(x ** 2 - 10.0 * np.cos(2 * np.pi * x) + 10.0, axis=0)
+
+
+def rastrigin_value_and_grad(x):
+    x = np.asarray(x, dtype=float)
+    value = float(np.sum(x ** 2 - 10.0 * np.cos(2 * np.pi * x) + 10.0))
+    return value, 2 * x + 20.0 * np.pi * np.sin(2 * np.pi * x)
+
+
+# Фабрики целевых функций со счётчиками (функции модуля — передаются в процессы пула)
+def rosenbrock_objective():
+    return Objective(rosenbrock, value_and_grad=rosenbrock_value_and_grad, batch_func=rosenbrock_batch)
+
+
+def himmelblau_objective():
+    return Objective(himmelblau, value_and_grad=himmelblau_value_and_grad,
+                     batch_func=lambda points: himmelblau(np.asarray(points, dtype=float).T))
+
+
+def rastrigin_objective():
+    return Objective(rastrigin, value_and_grad=rastrigin_value_and_grad,
+                     batch_func=lambda points: rastrigin(np.asarray(points, dtype=float).T))
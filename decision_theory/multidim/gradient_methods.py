@@ -0,0 +1,242 @@
+"""Градиентные методы с одномерным поиском шага.
+
+Наискорейший спуск (шаг по Армихо или по условиям Вольфе), нелинейный метод
+сопряжённых градиентов (Полак-Рибьер+) и L-BFGS с памятью из m пар (s, y) —
+O(m n) вместо плотной матрицы n x n.
+
+Все методы принимают Objective (objective.py) и возвращают то же, что
+hook_jiws и gradient_const: (x, f(x), итерации, траектория, вычислений функции);
+траектория пишется в приёмник trajectory (decision_theory.trajectory, по умолчанию ArraySink).
+Останов — по норме градиента ||g|| < epsilon, а не по разности значений,
+поэтому плато не прерывают спуск раньше времени. observer (observers.py)
+получает на итерации f(x) и длину шага ||x_{k+1} - x_k||.
+"""
+import math
+
+import numpy as np
+
+from ..trajectory import ArraySink
+
+
+def armijo_search(objective, x, f_x, g, d, step=1.0, c1=1e-4, shrink=0.5, max_steps=60):
+    # Дробление шага до достаточного убывания f(x + step d) <= f(x) + c1 step g^T d
+    slope = g @ d
+    for _ in range(max_steps):
+        f_new = objective(x + step * d)
+        if f_new <= f_x + c1 * step * slope:
+            return step, f_new
+        step *= shrink
+    return 0.0, f_x
+
+
+def _cubic_step(a, f_a, slope_a, b, f_b, slope_b):
+    # Минимум кубического интерполянта по значениям и производным в a и b
+    # с защитой: точка должна лежать в средней части отрезка, иначе — середина
+    low, high = min(a, b), max(a, b)
+    if not (math.isfinite(f_a) and math.isfinite(f_b)):
+        return 0.5 * (a + b)  # Точка за барьером (f = inf)
+    d1 = slope_a + slope_b - 3 * (f_a - f_b) / (a - b)
+    discriminant = d1 * d1 - slope_a * slope_b
+    if discriminant >= 0:
+        d2 = math.copysign(math.sqrt(discriminant), b - a)
+        denominator = slope_b - slope_a + 2 * d2
+        if denominator != 0:
+            step = b - (b - a) * (slope_b + d2 - d1) / denominator
+            margin = 0.1 * (high - low)
+            if low + margin <= step <= high - margin:
+                return step
+    return 0.5 * (a + b)
+
+
+def _zoom(objective, x, f_x, slope0, d, lo, hi, c1, c2, max_steps):
+    # Сужение отрезка [lo, hi], содержащего шаг Вольфе; lo всегда даёт достаточное убывание
+    lo_step, f_lo, g_lo, slope_lo = lo
+    hi_step, f_hi, slope_hi = hi
+    for _ in range(max_steps):
+        step = _cubic_step(lo_step, f_lo, slope_lo, hi_step, f_hi, slope_hi)
+        f_new, g_new = objective.value_and_grad(x + step * d)
+        slope = g_new @ d
+        if f_new > f_x + c1 * step * slope0 or f_new >= f_lo:
+            hi_step, f_hi, slope_hi = step, f_new, slope
+        else:
+            if abs(slope) <= -c2 * slope0:
+                return step, f_new, g_new
+            if slope * (hi_step - lo_step) >= 0:
+                hi_step, f_hi, slope_hi = lo_step, f_lo, slope_lo
+            lo_step, f_lo, g_lo, slope_lo = step, f_new, g_new, slope
+        if abs(hi_step - lo_step) <= 1e-12 * max(1.0, lo_step):
+            break
+    return lo_step, f_lo, g_lo
+
+
+def wolfe_search(objective, x, f_x, g, d, step=1.0, c1=1e-4, c2=0.9, max_steps=40):
+    """Шаг, удовлетворяющий сильным условиям Вольфе (Нокедаль, Райт, алг. 3.5, 3.6).
+
+    Возвращает (step, f(x + step d), g(x + step d)); step = 0 — шаг не найден.
+    """
+    slope0 = g @ d
+    previous = (0.0, f_x, g, slope0)
+    for i in range(max_steps):
+        f_new, g_new = objective.value_and_grad(x + step * d)
+        slope = g_new @ d
+        if f_new > f_x + c1 * step * slope0 or (i > 0 and f_new >= previous[1]):
+            return _zoom(objective, x, f_x, slope0, d, previous, (step, f_new, slope), c1, c2, max_steps)
+        if abs(slope) <= -c2 * slope0:
+            return step, f_new, g_new
+        if slope >= 0:
+            return _zoom(objective, x, f_x, slope0, d, (step, f_new, g_new, slope),
+                         (previous[0], previous[1], previous[3]), c1, c2, max_steps)
+        previous = (step, f_new, g_new, slope)
+        step *= 2  # Условие кривизны не выполнено, функция ещё убывает — шаг увеличивается
+    return previous[:3]
+
+
+def _start(x0, objective, trajectory, observer, name):
+    x = np.array(x0, dtype=float)
+    f_x, g = objective.value_and_grad(x)
+    traj = ArraySink() if trajectory is None else trajectory
+    traj.record(x)
+    if observer is not None:
+        observer.start(name)
+    return x, f_x, g, traj, objective.evaluations
+
+
+def steepest_descent(x0, epsilon, objective, line_search="armijo", max_iter=10000, trajectory=None,
+                     observer=None):
+    # Наискорейший спуск d = -g; первый пробный шаг — 1 / ||g||, далее удвоенный прошлый
+    if line_search not in ("armijo", "wolfe"):
+        raise ValueError(f"Неизвестный одномерный поиск {line_search!r}, допустимы: armijo, wolfe.")
+    x, f_x, g, traj, start_evaluations = _start(x0, objective, trajectory, observer, "steepest_descent")
+    step = 1.0 / max(np.linalg.norm(g), 1e-12)
+    iterations = 0
+    while np.linalg.norm(g) >= epsilon and iterations < max_iter:
+        iterations += 1
+        d = -g
+        if line_search == "armijo":
+            step, f_new = armijo_search(objective, x, f_x, g, d, step)
+            if step == 0:
+                break
+            x = x + step * d
+            f_x, g = objective.value_and_grad(x)
+        else:
+            step, f_x, g_new = wolfe_search(objective, x, f_x, g, d, step)
+            if step == 0:
+                break
+            x, g = x + step * d, g_new
+        traj.record(x)
+        if observer is not None:
+            observer.event(iterations, f_x, step=step * np.linalg.norm(d), phase=line_search)
+        step *= 2
+    if observer is not None:
+        observer.finish()
+    return x, f_x, iterations, traj, objective.evaluations - start_evaluations
+
+
+def conjugate_gradient(x0, epsilon, objective, max_iter=10000, restart=None, trajectory=None, observer=None):
+    # Нелинейные сопряжённые градиенты, beta = max(0, g1^T (g1 - g0) / g0^T g0) (PR+),
+    # шаг по сильным условиям Вольфе с c2 = 0.1; рестарт d = -g каждые restart итераций
+    # (по умолчанию n) и при потере направления спуска
+    x, f_x, g, traj, start_evaluations = _start(x0, objective, trajectory, observer, "conjugate_gradient")
+    if restart is None:
+        restart = x.size
+    d = -g
+    step = 1.0 / max(np.linalg.norm(g), 1e-12)
+    iterations = 0
+    while np.linalg.norm(g) >= epsilon and iterations < max_iter:
+        iterations += 1
+        f_prev = f_x
+        step, f_x, g_new = wolfe_search(objective, x, f_x, g, d, step, c2=0.1)
+        if step == 0:
+            break
+        x = x + step * d
+        traj.record(x)
+        if observer is not None:
+            observer.event(iterations, f_x, step=step * np.linalg.norm(d))
+        beta = max(0.0, g_new @ (g_new - g) / (g @ g))
+        if iterations % restart == 0:
+            beta = 0.0
+        d = -g_new + beta * d
+        if g_new @ d >= 0:
+            d = -g_new
+        # Начальный шаг следующего поиска: минимум квадратичной модели при прошлом
+        # убывании f, не больше 1 (Нокедаль, Райт, (3.60))
+        slope = g_new @ d
+        step = min(1.0, 1.01 * 2 * (f_x - f_prev) / slope) if slope < 0 else 1.0
+        g = g_new
+    if observer is not None:
+        observer.finish()
+    return x, f_x, iterations, traj, objective.evaluations - start_evaluations
+
+
+class LBFGSHistory:
+    """Память L-BFGS: последние memory пар (s, y) в кольцевом буфере.
+
+    Передаётся в lbfgs(history=...), чтобы следующий запуск (тёплый старт,
+    например на следующем уровне штрафа) продолжил с накопленной кривизной.
+    """
+
+    def __init__(self, n, memory=10):
+        self.s = np.zeros((memory, n))
+        self.y = np.zeros((memory, n))
+        self.rho = np.zeros(memory)
+        self.stored = 0
+        self.newest = -1
+
+    @property
+    def memory(self):
+        return len(self.rho)
+
+    def clear(self):
+        self.stored = 0
+
+    def push(self, s, y):
+        # Пара сохраняется, только если оставляет H положительно определённой
+        if s @ y > 1e-12 * np.linalg.norm(s) * np.linalg.norm(y):
+            self.newest = (self.newest + 1) % self.memory
+            self.s[self.newest], self.y[self.newest], self.rho[self.newest] = s, y, 1.0 / (s @ y)
+            self.stored = min(self.stored + 1, self.memory)
+
+    def direction(self, g):
+        # Двухцикловая рекурсия: -H g
+        q = g.copy()
+        alpha = np.zeros(self.memory)
+        order = [(self.newest - k) % self.memory for k in range(self.stored)]
+        for k in order:
+            alpha[k] = self.rho[k] * (self.s[k] @ q)
+            q -= alpha[k] * self.y[k]
+        if self.stored:
+            q *= (self.s[self.newest] @ self.y[self.newest]) / (self.y[self.newest] @ self.y[self.newest])
+        else:
+            q /= max(np.linalg.norm(g), 1e-12)  # Первый шаг длины 1
+        for k in reversed(order):
+            q += self.s[k] * (alpha[k] - self.rho[k] * (self.y[k] @ q))
+        return -q
+
+
+def lbfgs(x0, epsilon, objective, memory=10, max_iter=10000, trajectory=None, history=None, observer=None):
+    # L-BFGS: направление -H g по двухцикловой рекурсии из последних memory пар
+    # s = x_{k+1} - x_k, y = g_{k+1} - g_k; начальное приближение H0 = (s^T y / y^T y) I.
+    # history (LBFGSHistory) — память, сохраняемая между запусками
+    x, f_x, g, traj, start_evaluations = _start(x0, objective, trajectory, observer, "lbfgs")
+    if history is None:
+        history = LBFGSHistory(x.size, memory)
+    iterations = 0
+    while np.linalg.norm(g) >= epsilon and iterations < max_iter:
+        iterations += 1
+        d = history.direction(g)
+        step, f_new, g_new = wolfe_search(objective, x, f_x, g, d, 1.0)
+        if step == 0:
+            if not history.stored:
+                break
+            history.clear()  # Сброс памяти и повтор с направлением антиградиента
+            continue
+        s = step * d
+        y = g_new - g
+        x, f_x, g = x + s, f_new, g_new
+        traj.record(x)
+        history.push(s, y)
+        if observer is not None:
+            observer.event(iterations, f_x, step=np.linalg.norm(s))
+    if observer is not None:
+        observer.finish()
+    return x, f_x, iterations, traj, objective.evaluations - start_evaluations
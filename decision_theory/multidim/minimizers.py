@@ -0,0 +1,43 @@
+"""Многомерные минимизаторы с общим интерфейсом (мультистарт, реестр решателей).
+
+minimizer(x0, objective, max_iter=None, epsilon=1e-6, trajectory=None, observer=None, **options)
+    -> (x, f(x), итерации, траектория, вычислений функции)
+objective — Objective (objective.py); options — параметры метода (lamb, memory, ...).
+"""
+from .direct import gradient_const, hook_jiws
+from .gradient_methods import conjugate_gradient, lbfgs, steepest_descent
+
+DEFAULT_MAX_ITER = 10000
+
+
+def _hook_jiws(x0, objective, max_iter=None, lamb=0.5, epsilon=1e-6, trajectory=None, observer=None):
+    return hook_jiws(x0, lamb, epsilon, objective=objective, max_iter=max_iter, trajectory=trajectory,
+                     observer=observer)
+
+
+def _gradient_const(x0, objective, max_iter=None, lamb=0.5, epsilon=1e-6, trajectory=None, observer=None):
+    return gradient_const(x0, lamb, epsilon, objective=objective, max_iter=max_iter, trajectory=trajectory,
+                          observer=observer)
+
+
+def _line_search_method(method):
+    def run(x0, objective, max_iter=None, epsilon=1e-6, **options):
+        return method(x0, epsilon, objective, max_iter=max_iter or DEFAULT_MAX_ITER, **options)
+    return run
+
+
+# Новые регистрируются до создания пула мультистарта, чтобы процессы-исполнители их видели
+MINIMIZERS = {
+    "hook_jiws": _hook_jiws,
+    "gradient_const": _gradient_const,
+    "steepest_descent": _line_search_method(steepest_descent),
+    "conjugate_gradient": _line_search_method(conjugate_gradient),
+    "lbfgs": _line_search_method(lbfgs),
+}
+
+
+def register_minimizer(name, minimizer):
+    MINIMIZERS[name] = minimizer
+
+
+SOLVERS = MINIMIZERS  # Таблица для реестра decision_theory.registry
@@ -0,0 +1,180 @@
+"""Мультистарт: запуск минимизатора из множества начальных точек на пуле процессов.
+
+Начальные точки — латинский гиперкуб или последовательность Соболя в
+прямоугольнике [lower, upper]. Каждый старт выполняется в два этапа:
+короткая проба (probe_iter итераций), после которой старт отсекается, если
+он уже пришёл в окрестность найденного бассейна и выше его минимума, и
+продолжение до сходимости. Результаты выдаются по мере завершения запусков;
+если лучшее значение не улучшается patience запусков подряд, оставшиеся
+старты отменяются.
+
+Целевая функция передаётся фабрикой без аргументов (функцией уровня модуля,
+например functions.himmelblau_objective), минимизатор — именем из MINIMIZERS.
+"""
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.stats import qmc
+
+from ..trajectory import NullSink
+from .minimizers import MINIMIZERS, register_minimizer  # noqa: F401 — часть интерфейса мультистарта
+
+
+def starting_points(count, lower, upper, method="sobol", seed=0):
+    # Квазислучайные начальные точки в прямоугольнике [lower, upper]
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    if method == "sobol":
+        sampler = qmc.Sobol(lower.size, seed=seed)
+    elif method == "lhs":
+        sampler = qmc.LatinHypercube(lower.size, seed=seed)
+    else:
+        raise ValueError(f"Неизвестный способ выбора точек {method!r}, допустимы: sobol, lhs.")
+    return qmc.scale(sampler.random(count), lower, upper)
+
+
+@dataclass
+class StartResult:
+    index: int  # Номер начальной точки
+    x0: np.ndarray
+    x: np.ndarray
+    fun: float
+    iterations: int
+    evaluations: int
+    basin: int  # Номер бассейна в Multistart.basins
+    pruned: bool  # Отсечён после пробы: траектория пришла в уже найденный бассейн
+    time: float
+
+
+@dataclass
+class Basin:
+    x: np.ndarray  # Лучшая найденная точка бассейна
+    fun: float
+    hits: int  # Сколько стартов пришло в бассейн
+
+
+def _run(factory, minimizer, x0, max_iter, options):
+    objective = factory()
+    start = time.perf_counter()
+    # Траектории запусков не нужны — запись выключена
+    x, fun, iterations, _, evaluations = MINIMIZERS[minimizer](x0, objective, max_iter=max_iter,
+                                                               trajectory=NullSink(), **options)
+    return np.asarray(x, dtype=float), float(fun), iterations, evaluations, time.perf_counter() - start
+
+
+class _InlineExecutor:
+    # Выполнение в текущем процессе с интерфейсом пула (max_workers=1)
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+class Multistart:
+    """Мультистарт минимизатора minimizer для целевой функции factory().
+
+    radius — радиус бассейна: концы запусков ближе radius к найденной точке
+    относятся к её бассейну (по умолчанию 1% диагонали прямоугольника).
+    options передаются минимизатору.
+    """
+
+    def __init__(self, factory, minimizer, lower, upper, count=100, method="sobol", seed=0,
+                 probe_iter=10, radius=None, patience=None, tol=1e-8, max_iter=None, **options):
+        if minimizer not in MINIMIZERS:
+            raise ValueError(f"Неизвестный минимизатор {minimizer!r}, допустимы: {', '.join(MINIMIZERS)}.")
+        self.factory = factory
+        self.minimizer = minimizer
+        self.points = starting_points(count, lower, upper, method, seed)
+        diagonal = np.linalg.norm(np.asarray(upper, dtype=float) - np.asarray(lower, dtype=float))
+        self.radius = 0.01 * diagonal if radius is None else radius
+        self.probe_iter = probe_iter
+        self.patience = patience
+        self.tol = tol
+        self.max_iter = max_iter
+        self.options = options
+        self.basins = []
+        self.results = []
+        self.stopped_early = False
+
+    @property
+    def best(self):
+        return min(self.basins, key=lambda basin: basin.fun) if self.basins else None
+
+    def _nearest(self, x):
+        if not self.basins:
+            return -1, np.inf
+        distances = [np.linalg.norm(x - basin.x) for basin in self.basins]
+        k = int(np.argmin(distances))
+        return k, distances[k]
+
+    def _assign(self, x, fun):
+        k, distance = self._nearest(x)
+        if distance <= self.radius:
+            basin = self.basins[k]
+            basin.hits += 1
+            if fun < basin.fun:
+                basin.x, basin.fun = x, fun
+            return k
+        self.basins.append(Basin(x=x, fun=fun, hits=1))
+        return len(self.basins) - 1
+
+    def run(self, max_workers=None):
+        """Генератор StartResult в порядке завершения запусков."""
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        executor = _InlineExecutor() if max_workers == 1 else ProcessPoolExecutor(max_workers=max_workers)
+        in_flight = 2 * max_workers
+        queue = list(range(len(self.points)))[::-1]
+        tasks = {}  # future -> (номер старта, этап, накопленные итерации, вычисления, время)
+        best, since_best = np.inf, 0
+
+        def submit_probe():
+            index = queue.pop()
+            future = executor.submit(_run, self.factory, self.minimizer, self.points[index],
+                                     self.probe_iter, self.options)
+            tasks[future] = (index, "probe", 0, 0, 0.0)
+
+        try:
+            while queue or tasks:
+                while queue and len(tasks) < in_flight:
+                    submit_probe()
+                done, _ = wait(list(tasks), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, stage, iterations, evaluations, elapsed = tasks.pop(future)
+                    x, fun, nit, nfev, seconds = future.result()
+                    iterations, evaluations, elapsed = iterations + nit, evaluations + nfev, elapsed + seconds
+                    if stage == "probe" and nit >= self.probe_iter:
+                        k, distance = self._nearest(x)
+                        if distance > self.radius or fun < self.basins[k].fun:
+                            # Старт ещё не пришёл в известный бассейн — продолжение до сходимости
+                            continuation = executor.submit(_run, self.factory, self.minimizer, x,
+                                                           self.max_iter, self.options)
+                            tasks[continuation] = (index, "full", iterations, evaluations, elapsed)
+                            continue
+                        self.basins[k].hits += 1
+                        result = StartResult(index, self.points[index], x, fun, iterations, evaluations,
+                                             basin=k, pruned=True, time=elapsed)
+                    else:
+                        basin = self._assign(x, fun)
+                        result = StartResult(index, self.points[index], x, fun, iterations, evaluations,
+                                             basin=basin, pruned=False, time=elapsed)
+                    self.results.append(result)
+                    if fun < best - self.tol * (1 + abs(best)):
+                        best, since_best = fun, 0
+                    else:
+                        since_best += 1
+                    yield result
+                if self.patience is not None and since_best >= self.patience:
+                    self.stopped_early = True
+                    queue.clear()
+                    for future in tasks:
+                        future.cancel()
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,270 @@
+"""Целевые функции с кэшем вычисленных точек и счётчиками вычислений.
+
+CachedObjective — значения функции с LRU-кэшем. Objective добавляет градиент:
+совместное вычисление value_and_grad (аналитическое, если задано), иначе
+конечные разности или автоматическое дифференцирование в прямом режиме
+(дуальные числа Dual: функция должна быть записана через numpy, а не math).
+"""
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+GRADIENTS = ("central", "forward", "dual")
+
+
+class CachedObjective:
+    """Целевая функция с ограниченным LRU-кэшем значений.
+
+    func(x) — значение в одной точке; batch_func(points) — значения в строках
+    массива (k, n) одним векторным вызовом (если не задана, точки вычисляются
+    по одной через func). Ключ кэша — координаты точки.
+    Счётчики: calls — запрошено значений, evaluations — вычислено на самом деле.
+    """
+
+    def __init__(self, func, batch_func=None, maxsize=4096):
+        self.func = func
+        self.batch_func = batch_func
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.calls = 0
+        self.evaluations = 0
+
+    @property
+    def hits(self):
+        return self.calls - self.evaluations
+
+    def _remember(self, key, value):
+        if self.maxsize <= 0:
+            return
+        self.cache[key] = value
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+
+    def __call__(self, x):
+        self.calls += 1
+        key = tuple(np.asarray(x, dtype=float).tolist())
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        self.evaluations += 1
+        value = float(self.func(np.array(key)))
+        self._remember(key, value)
+        return value
+
+    def batch(self, points):
+        # Значения в строках points; отсутствующие в кэше точки (без повторов)
+        # вычисляются одним вызовом batch_func
+        points = np.asarray(points, dtype=float)
+        self.calls += len(points)
+        values = np.empty(len(points))
+        missing = {}
+        for k, key in enumerate(map(tuple, points.tolist())):
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                values[k] = self.cache[key]
+            else:
+                missing.setdefault(key, []).append(k)
+        if missing:
+            keys = list(missing)
+            fresh = np.array(keys)
+            if self.batch_func is not None:
+                computed = np.asarray(self.batch_func(fresh), dtype=float)
+            else:
+                computed = np.array([self.func(point) for point in fresh], dtype=float)
+            self.evaluations += len(keys)
+            for key, value in zip(keys, computed.tolist()):
+                values[missing[key]] = value
+                self._remember(key, value)
+        return values
+
+
+def _value(other):
+    return other.value if isinstance(other, Dual) else other
+
+
+class Dual:
+    """Дуальное число value + tangent * eps (eps^2 = 0): tangent — вектор
+    производных по всем переменным, поэтому градиент получается за один проход.
+
+    Методы exp, log, sqrt, sin, cos вызываются numpy для объектов,
+    так что np.exp(Dual) и т. п. работают.
+    """
+
+    __slots__ = ("value", "tangent")
+
+    def __init__(self, value, tangent):
+        self.value = float(value)
+        self.tangent = tangent
+
+    def _chain(self, value, derivative):
+        return Dual(value, derivative * self.tangent)
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.tangent + other.tangent)
+        return Dual(self.value + other, self.tangent)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.tangent - other.tangent)
+        return Dual(self.value - other, self.tangent)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.tangent)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value, self.tangent * other.value + other.tangent * self.value)
+        return Dual(self.value * other, self.tangent * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value / other.value,
+                        (self.tangent * other.value - other.tangent * self.value) / other.value ** 2)
+        return Dual(self.value / other, self.tangent / other)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.value, -other * self.tangent / self.value ** 2)
+
+    def __pow__(self, power):
+        if isinstance(power, Dual):
+            return (self.log() * power).exp()
+        return self._chain(self.value ** power, power * self.value ** (power - 1))
+
+    def __rpow__(self, base):
+        value = base ** self.value
+        return self._chain(value, value * math.log(base))
+
+    def __neg__(self):
+        return Dual(-self.value, -self.tangent)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return self if self.value >= 0 else -self
+
+    def __lt__(self, other):
+        return self.value < _value(other)
+
+    def __le__(self, other):
+        return self.value <= _value(other)
+
+    def __gt__(self, other):
+        return self.value > _value(other)
+
+    def __ge__(self, other):
+        return self.value >= _value(other)
+
+    def exp(self):
+        value = math.exp(self.value)
+        return self._chain(value, value)
+
+    def log(self):
+        return self._chain(math.log(self.value), 1.0 / self.value)
+
+    def sqrt(self):
+        value = math.sqrt(self.value)
+        return self._chain(value, 0.5 / value)
+
+    def sin(self):
+        return self._chain(math.sin(self.value), math.cos(self.value))
+
+    def cos(self):
+        return self._chain(math.cos(self.value), -math.sin(self.value))
+
+    def __repr__(self):
+        return f"Dual({self.value}, {self.tangent})"
+
+
+def dual_value_and_grad(func, x):
+    # Значение и градиент func в x за один проход с дуальными числами
+    x = np.asarray(x, dtype=float)
+    unit = np.eye(x.size)
+    out = func(np.array([Dual(x[i], unit[i]) for i in range(x.size)], dtype=object))
+    if isinstance(out, Dual):
+        return out.value, out.tangent.copy()
+    return float(out), np.zeros(x.size)  # Функция не зависит от x
+
+
+class Objective(CachedObjective):
+    """Целевая функция с градиентом и счётчиками вычислений.
+
+    Источник градиента по приоритету: value_and_grad(x) -> (f, g) — одно
+    совместное вычисление; grad(x) — отдельно к значению из кэша; иначе
+    gradient: "central" / "forward" — конечные разности с шагом step
+    (значения считаются пакетом через batch), "dual" — прямой режим
+    автоматического дифференцирования.
+    gradient_evaluations — число вычислений градиента (совместных, аналитических
+    или проходов Dual); значения функции для разностей учитываются в evaluations.
+    """
+
+    def __init__(self, func, grad=None, value_and_grad=None, batch_func=None,
+                 gradient="central", step=None, maxsize=4096):
+        if gradient not in GRADIENTS:
+            raise ValueError(f"Неизвестный способ вычисления градиента {gradient!r}, "
+                             f"допустимы: {', '.join(GRADIENTS)}.")
+        super().__init__(func, batch_func, maxsize)
+        self.grad_func = grad
+        self.fused = value_and_grad
+        self.gradient = gradient
+        self.step = step
+        self.grad_cache = OrderedDict()
+        self.gradient_evaluations = 0
+
+    def _difference_grad(self, x, value):
+        n = x.size
+        if self.gradient == "forward":
+            h = self.step or math.sqrt(np.finfo(float).eps)
+            h = h * np.maximum(1.0, np.abs(x))
+            values = self.batch(x + np.diag(h))
+            return (values - value) / h
+        h = self.step or np.finfo(float).eps ** (1 / 3)
+        h = h * np.maximum(1.0, np.abs(x))
+        values = self.batch(np.vstack([x + np.diag(h), x - np.diag(h)]))
+        return (values[:n] - values[n:]) / (2 * h)
+
+    def value_and_grad(self, x):
+        x = np.asarray(x, dtype=float)
+        key = tuple(x.tolist())
+        if key in self.grad_cache:
+            self.calls += 1
+            self.grad_cache.move_to_end(key)
+            value, grad = self.grad_cache[key]
+            return value, grad.copy()
+
+        if self.fused is not None:
+            self.calls += 1
+            self.evaluations += 1
+            self.gradient_evaluations += 1
+            value, grad = self.fused(x)
+            value = float(value)
+            self._remember(key, value)
+        elif self.grad_func is not None:
+            value = self(x)
+            self.gradient_evaluations += 1
+            grad = self.grad_func(x)
+        elif self.gradient == "dual":
+            self.calls += 1
+            self.evaluations += 1
+            self.gradient_evaluations += 1
+            value, grad = dual_value_and_grad(self.func, x)
+            self._remember(key, value)
+        else:
+            value = self(x)
+            grad = self._difference_grad(x, value)
+
+        grad = np.asarray(grad, dtype=float)
+        if self.maxsize > 0:
+            self.grad_cache[key] = (value, grad)
+            if len(self.grad_cache) > self.maxsize:
+                self.grad_cache.popitem(last=False)
+        return value, grad.copy()
+
+    def grad(self, x):
+        return self.value_and_grad(x)[1]
@@ -0,0 +1,73 @@
+"""Значения целевой функции на сетке для линий уровня.
+
+grid_values вычисляет func на сетке meshgrid(x, y) векторно, блоками строк
+не больше CHUNK_POINTS точек, так что память ограничена при любой сетке.
+func принимает точки по столбцам: func(np.array([X, Y])) -> массив значений
+(так записана f из Lab_2/Code_lab_2/main.py). cached_surface дополнительно сохраняет сетку
+на диск (.npz) с ключом по функции и параметрам сетки; повторное построение
+графика читает готовый файл.
+"""
+import hashlib
+import inspect
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+CHUNK_POINTS = 1 << 18  # Точек в одном векторном вызове
+CACHE_DIR = Path.home() / ".cache" / "decision_theory" / "surfaces"
+
+
+def grid_values(func, x, y, chunk_points=CHUNK_POINTS):
+    # Z[i, j] = func((x[j], y[i])) — как для plt.contourf(X, Y, Z) с X, Y = meshgrid(x, y)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    Z = np.empty((y.size, x.size))
+    rows = max(1, chunk_points // max(x.size, 1))
+    for start in range(0, y.size, rows):
+        X, Y = np.meshgrid(x, y[start:start + rows])
+        Z[start:start + rows] = func(np.array([X, Y]))
+    return Z
+
+
+def _function_key(func):
+    # Имя и исходный текст функции: изменение кода даёт новый ключ
+    # (глобальные константы, от которых зависит функция, в ключ не входят)
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = getattr(getattr(func, "__code__", None), "co_code", b"").hex()
+    return name + "\n" + source
+
+
+def surface_key(func, x, y):
+    digest = hashlib.sha256(_function_key(func).encode())
+    for axis in (x, y):
+        digest.update(np.ascontiguousarray(axis, dtype=float).tobytes())
+        digest.update(b"|")
+    return digest.hexdigest()[:32]
+
+
+def cached_surface(func, x, y, cache_dir=CACHE_DIR, chunk_points=CHUNK_POINTS):
+    """Z = grid_values(func, x, y) с кэшем на диске; cache_dir=None — без кэша."""
+    if cache_dir is None:
+        return grid_values(func, x, y, chunk_points)
+    path = Path(cache_dir) / f"{surface_key(func, x, y)}.npz"
+    if path.exists():
+        with np.load(path) as stored:
+            return stored["Z"]
+    Z = grid_values(func, x, y, chunk_points)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Атомарная запись: у каждого запуска свой временный файл в той же папке,
+    # так что параллельные запуски не пишут в один файл и не читают недописанный
+    fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=path.stem, suffix=".tmp.npz")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            np.savez(file, Z=Z)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+    return Z
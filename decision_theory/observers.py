@@ -0,0 +1,289 @@
+"""Наблюдатели итераций для решателей всех лабораторных.
+
+Решатель с параметром observer вызывает:
+    observer.start(solver)                  — перед первой итерацией;
+    observer.event(iteration, objective, step=None, entering=None, leaving=None, phase="main")
+                                            — на каждой итерации (замене базиса);
+    observer.table(title, matrix, headers)  — промежуточная таблица (табличный
+                                              симплекс-метод, метод потенциалов);
+    observer.message(text)                  — текстовое сообщение;
+    observer.finish()                       — после последней итерации.
+observer=None (по умолчанию) — решатель не делает ни одного вызова. Приёмники:
+    NullObserver()              — ничего не делает;
+    JSONLinesObserver(file)     — событие на строку JSON, сразу в файл или поток;
+    PhaseProfile()              — итерации и время по (решатель, этап) в памяти;
+    ProfileObserver(a, ...)     — cProfile на время решения, события — в a, ...;
+    ConsoleObserver(every=k)    — строки каждой k-й итерации и таблицы на экран;
+    Observers(a, b, ...)        — несколько приёмников сразу.
+Вложенные решения (внутренний минимизатор метода штрафов, crossover метода
+внутренней точки) отсчитывают время от своего start.
+"""
+import json
+import sys
+import time
+from typing import NamedTuple, Optional
+
+
+class Event(NamedTuple):
+    solver: str
+    phase: str  # Этап: "main", "phase1", "dual", "golden", ...
+    iteration: int
+    objective: Optional[float]  # Значение цели, если решатель его знает
+    step: Optional[float]  # Длина шага, theta, ширина отрезка
+    entering: Optional[int]  # Входящая в базис переменная (клетка — номер i * n + j)
+    leaving: Optional[int]  # Выходящая
+    elapsed_ns: int  # Время с начала решения
+
+
+def _number(value):
+    return None if value is None else float(value)
+
+
+def _index(value):
+    return None if value is None else int(value)
+
+
+class Observer:
+    """Базовый приёмник: ведёт стек вложенных решений и собирает Event для emit."""
+
+    def __init__(self):
+        self._solves = []  # (решатель, момент start в нс)
+
+    def start(self, solver):
+        self._solves.append((solver, time.perf_counter_ns()))
+
+    def finish(self):
+        if self._solves:
+            self._solves.pop()
+
+    @property
+    def depth(self):
+        return len(self._solves)
+
+    def event(self, iteration, objective, step=None, entering=None, leaving=None, phase="main"):
+        solver, started = self._solves[-1] if self._solves else ("", time.perf_counter_ns())
+        self.emit(Event(solver, phase, int(iteration), _number(objective), _number(step), _index(entering),
+                        _index(leaving), time.perf_counter_ns() - started))
+
+    def emit(self, event):
+        pass
+
+    def table(self, title, matrix, headers=None):
+        pass
+
+    def message(self, text):
+        pass
+
+
+class NullObserver(Observer):
+    """Ничего не записывает (и не заводит событий)."""
+
+    def start(self, solver):
+        pass
+
+    def finish(self):
+        pass
+
+    def event(self, iteration, objective, step=None, entering=None, leaving=None, phase="main"):
+        pass
+
+
+class JSONLinesObserver(Observer):
+    """События строками JSON в файл (путь) или открытый текстовый поток.
+
+    Поток сбрасывается после каждого решения верхнего уровня; close() —
+    закрыть файл, открытый по пути.
+    """
+
+    def __init__(self, target):
+        super().__init__()
+        self.own = isinstance(target, (str, bytes)) or hasattr(target, "__fspath__")
+        self.stream = open(target, "w", encoding="utf-8") if self.own else target
+        self.count = 0
+
+    def emit(self, event):
+        self.stream.write(json.dumps(event._asdict(), ensure_ascii=False))
+        self.stream.write("\n")
+        self.count += 1
+
+    def message(self, text):
+        self.stream.write(json.dumps({"message": text}, ensure_ascii=False) + "\n")
+
+    def finish(self):
+        super().finish()
+        if not self.depth:
+            self.stream.flush()
+
+    def close(self):
+        if self.own:
+            self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class PhaseProfile(Observer):
+    """Число итераций и время по (решатель, этап): время от прошлого события
+    относится к этапу текущего; total — полное время решений по решателям."""
+
+    def __init__(self):
+        super().__init__()
+        self.phases = {}  # (решатель, этап) -> [итераций, нс]
+        self.total = {}  # решатель -> [решений, нс]
+        self._previous = []  # Время прошлого события каждого вложенного решения
+
+    def start(self, solver):
+        super().start(solver)
+        self._previous.append(0)
+
+    def emit(self, event):
+        delta = event.elapsed_ns - self._previous[-1] if self._previous else 0
+        if self._previous:
+            self._previous[-1] = event.elapsed_ns
+        entry = self.phases.setdefault((event.solver, event.phase), [0, 0])
+        entry[0] += 1
+        entry[1] += delta
+
+    def finish(self):
+        if self._solves:
+            solver, started = self._solves[-1]
+            entry = self.total.setdefault(solver, [0, 0])
+            entry[0] += 1
+            entry[1] += time.perf_counter_ns() - started
+            self._previous.pop()
+        super().finish()
+
+    def summary(self):
+        return {f"{solver}/{phase}": {"iterations": count, "time_ns": elapsed}
+                for (solver, phase), (count, elapsed) in self.phases.items()}
+
+    def report(self):
+        rows = [[solver, phase, count, elapsed / 1e6] for (solver, phase), (count, elapsed) in self.phases.items()]
+        rows += [[solver, "всего", count, elapsed / 1e6] for solver, (count, elapsed) in self.total.items()]
+        return format_table(rows, ["решатель", "этап", "итераций", "время, мс"])
+
+
+class Observers(Observer):
+    """Передаёт все вызовы нескольким приёмникам."""
+
+    def __init__(self, *observers):
+        super().__init__()
+        self.observers = observers
+
+    def start(self, solver):
+        for observer in self.observers:
+            observer.start(solver)
+
+    def finish(self):
+        for observer in self.observers:
+            observer.finish()
+
+    def event(self, iteration, objective, step=None, entering=None, leaving=None, phase="main"):
+        for observer in self.observers:
+            observer.event(iteration, objective, step, entering, leaving, phase)
+
+    def table(self, title, matrix, headers=None):
+        for observer in self.observers:
+            observer.table(title, matrix, headers)
+
+    def message(self, text):
+        for observer in self.observers:
+            observer.message(text)
+
+
+class ProfileObserver(Observers):
+    """cProfile от start до finish решения верхнего уровня; вызовы передаются
+    приёмникам observers. stats() — pstats.Stats накопленного профиля."""
+
+    def __init__(self, *observers):
+        import cProfile
+
+        super().__init__(*observers)
+        self.profiler = cProfile.Profile()
+        self._depth = 0
+
+    def start(self, solver):
+        if self._depth == 0:
+            self.profiler.enable()
+        self._depth += 1
+        super().start(solver)
+
+    def finish(self):
+        super().finish()
+        self._depth = max(self._depth - 1, 0)
+        if self._depth == 0:
+            self.profiler.disable()
+
+    def stats(self, sort="cumulative", stream=None):
+        import pstats
+
+        return pstats.Stats(self.profiler, stream=stream).sort_stats(sort)
+
+    def print_stats(self, limit=20, sort="cumulative", stream=None):
+        self.stats(sort, stream).print_stats(limit)
+
+
+class ConsoleObserver(Observer):
+    """Таблица итераций на экран: каждая every-я строка; tables — печатать и
+    промежуточные таблицы решателя, events=False — только таблицы и сообщения."""
+
+    def __init__(self, every=1, tables=True, events=True, stream=None):
+        super().__init__()
+        self.every = every
+        self.tables = tables
+        self.events = events
+        self.stream = stream
+
+    def _print(self, text):
+        print(text, file=self.stream or sys.stdout)
+
+    def start(self, solver):
+        super().start(solver)
+        if self.events:
+            self._print(f"{'решатель':>20} | {'этап':>9} | {'итер.':>6} | {'цель':>14} | {'шаг':>10} | "
+                        f"{'вх.':>6} | {'вых.':>6} | {'время, мс':>9}")
+
+    def emit(self, event):
+        if not self.events or event.iteration % self.every:
+            return
+        objective = "-" if event.objective is None else f"{event.objective:.8g}"
+        step = "-" if event.step is None else f"{event.step:.3g}"
+        entering = "-" if event.entering is None else event.entering
+        leaving = "-" if event.leaving is None else event.leaving
+        self._print(f"{event.solver:>20} | {event.phase:>9} | {event.iteration:6d} | {objective:>14} | "
+                    f"{step:>10} | {entering:>6} | {leaving:>6} | {event.elapsed_ns / 1e6:9.3f}")
+
+    def table(self, title, matrix, headers=None):
+        if self.tables:
+            self._print(f"\n{title}")
+            self._print(format_table(matrix, headers))
+
+    def message(self, text):
+        self._print(text)
+
+
+def _cell(value, digits):
+    if isinstance(value, str):
+        return value
+    value = round(float(value), digits)
+    return str(int(value)) if value.is_integer() else str(value)
+
+
+def format_table(matrix, headers=None, digits=4):
+    """Таблица в рамке из строк matrix (числа округляются до digits знаков)."""
+    rows = [[_cell(value, digits) for value in row] for row in matrix]
+    if headers is not None:
+        rows.insert(0, [str(h) for h in headers])
+    columns = max((len(row) for row in rows), default=0)
+    widths = [max((len(row[j]) for row in rows if j < len(row)), default=0) for j in range(columns)]
+    line = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    lines = [line]
+    for k, row in enumerate(rows):
+        lines.append("| " + " | ".join(cell.ljust(w) for cell, w in zip(row, widths)) + " |")
+        if k == 0 and headers is not None:
+            lines.append(line.replace("-", "="))
+    lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,17 @@
+"""Одномерная минимизация (Lab_1)."""
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "golden_section_search": "search",
+    "fibonacci_search": "search",
+    "brent": "search",
+    "tangent_method": "newton",
+    "newton_method": "newton",
+    "CachedFunction": "newton",
+    "safeguarded_newton": "newton",
+    "illinois": "newton",
+    "minimize": "newton",
+    "golden_section_batch": "batched",
+    "tangent_batch": "batched",
+    "newton_batch": "batched",
+})
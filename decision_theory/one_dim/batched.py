@@ -0,0 +1,149 @@
+"""Пакетные варианты одномерных методов из search.py и newton.py.
+
+Каждая функция решает сразу множество независимых задач: a, b (или x0) —
+массивы одной длины, итерация выполняется для всех ещё не сошедшихся задач
+одной векторной операцией numpy, сошедшиеся исключаются из активного набора.
+Функции задачи вызываются как func(x, *args): x — точки активных задач,
+args — массивы параметров (по одному значению на задачу, например столбцы
+таблицы), уже отобранные для тех же задач. Без args — одна функция для всех.
+
+Возвращается (x_min, f(x_min), итерации) — массивы по задачам.
+"""
+import time
+
+import numpy as np
+
+from .newton import newton_method, tangent_method
+from .search import golden_section_search
+
+INV_PHI = (np.sqrt(5) - 1) / 2  # 1 / phi
+
+
+def _prepare(arrays, args):
+    # Массивы задач и параметры, приведённые к общей длине (скаляры размножаются)
+    arrays = [np.asarray(array, dtype=float) for array in arrays]
+    args = [np.asarray(arg) for arg in args]
+    shape = np.broadcast_shapes(*[array.shape for array in arrays + args])
+    arrays = [np.broadcast_to(array, shape).ravel().copy() for array in arrays]
+    args = [np.broadcast_to(arg, shape).ravel() for arg in args]
+    return arrays, args
+
+
+def _args(args, active):
+    return [arg[active] for arg in args]
+
+
+def golden_section_batch(func, a, b, eps=1e-6, args=(), max_iter=200):
+    # Золотое сечение: на итерации одно новое вычисление func на задачу
+    (a, b), args = _prepare((a, b), args)
+    x1 = b - INV_PHI * (b - a)
+    x2 = a + INV_PHI * (b - a)
+    f1 = func(x1, *args)
+    f2 = func(x2, *args)
+    iterations = np.zeros(a.size, dtype=int)
+    active = np.flatnonzero(np.abs(b - a) > eps)
+    for _ in range(max_iter):
+        if not active.size:
+            break
+        left = f1[active] < f2[active]  # Минимум в [a, x2]
+        shrink, grow = active[left], active[~left]
+        b[shrink], x2[shrink], f2[shrink] = x2[shrink], x1[shrink], f1[shrink]
+        x1[shrink] = b[shrink] - INV_PHI * (b[shrink] - a[shrink])
+        a[grow], x1[grow], f1[grow] = x1[grow], x2[grow], f2[grow]
+        x2[grow] = a[grow] + INV_PHI * (b[grow] - a[grow])
+        # Новая точка задачи: x1 для сдвига b, x2 для сдвига a
+        trial = np.where(left, x1[active], x2[active])
+        values = func(trial, *_args(args, active))
+        f1[shrink] = values[left]
+        f2[grow] = values[~left]
+        iterations[active] += 1
+        active = active[np.abs(b[active] - a[active]) > eps]
+    x_min = (a + b) / 2
+    return x_min, func(x_min, *args), iterations
+
+
+def tangent_batch(func, derivative, a, b, eps=1e-6, args=(), max_iter=200):
+    # Метод касательных: пересечение касательных в концах отрезка; [a, b] сужается
+    # к точке, где производная меняет знак
+    (a, b), args = _prepare((a, b), args)
+    xm = np.zeros(a.size)
+    fa, fb = func(a, *args), func(b, *args)
+    da, db = derivative(a, *args), derivative(b, *args)
+    iterations = np.zeros(a.size, dtype=int)
+    active = np.flatnonzero(np.abs(b - a) > eps)
+    for _ in range(max_iter):
+        if not active.size:
+            break
+        act_args = _args(args, active)
+        A, B = a[active], b[active]
+        x = (A * da[active] - B * db[active] - fa[active] + fb[active]) / (da[active] - db[active])
+        xm[active] = x
+        fx, dx = func(x, *act_args), derivative(x, *act_args)
+        rising = dx > 0  # Минимум левее xm — xm становится правым концом
+        to_b, to_a = active[rising], active[~rising]
+        b[to_b], fb[to_b], db[to_b] = x[rising], fx[rising], dx[rising]
+        a[to_a], fa[to_a], da[to_a] = x[~rising], fx[~rising], dx[~rising]
+        iterations[active] += 1
+        active = active[np.abs(b[active] - a[active]) > eps]
+    return xm, func(xm, *args), iterations
+
+
+def newton_batch(derivative, second_derivative, x0, eps=1e-6, args=(), max_iter=100, func=None):
+    # Метод Ньютона для f'(x) = 0; задачи с f''(x) = 0 останавливаются с x = nan.
+    # func нужна только для значения в найденной точке
+    (x,), args = _prepare((x0,), args)
+    iterations = np.zeros(x.size, dtype=int)
+    active = np.arange(x.size)
+    for _ in range(max_iter):
+        if not active.size:
+            break
+        act_args = _args(args, active)
+        d1 = derivative(x[active], *act_args)
+        d2 = second_derivative(x[active], *act_args)
+        iterations[active] += 1
+        failed = d2 == 0
+        x[active[failed]] = np.nan
+        step = np.where(failed, 0.0, d1 / np.where(failed, 1.0, d2))
+        x[active] -= step
+        active = active[~failed & (np.abs(step) >= eps)]
+    values = np.full(x.size, np.nan) if func is None else func(x, *args)
+    return x, values, iterations
+
+
+# Сравнение с поочерёдным решением задач скалярными методами на F(x) = exp(x) + 1/x из Lab_1:
+# python -m decision_theory.one_dim.batched
+if __name__ == "__main__":
+    def F(x):
+        return np.exp(x) + 1 / x
+
+    def F_derivative(x):
+        return np.exp(x) - 1 / x ** 2
+
+    def F_2derivative(x):
+        return np.exp(x) + 2 / x ** 3
+
+    count = 10000
+    rng = np.random.default_rng(0)
+    a = rng.uniform(0.05, 0.5, count)
+    b = rng.uniform(1.0, 3.0, count)
+    x0 = rng.uniform(0.3, 1.2, count)
+    cases = (
+        ("золотое сечение", lambda: golden_section_batch(F, a, b),
+         lambda: [golden_section_search(F, ai, bi)[0] for ai, bi in zip(a, b)]),
+        ("метод касательных", lambda: tangent_batch(F, F_derivative, a, b),
+         lambda: [tangent_method(F, F_derivative, ai, bi)[0] for ai, bi in zip(a, b)]),
+        ("метод Ньютона", lambda: newton_batch(F_derivative, F_2derivative, x0, func=F),
+         lambda: [newton_method(F_derivative, F_2derivative, xi)[0] for xi in x0]),
+    )
+    print(f"{count} задач")
+    print(f"{'метод':>18} | {'пакет, с':>9} | {'по одной, с':>11} | {'макс. итер.':>11} | {'расхождение x':>13}")
+    print("-" * 75)
+    for title, batched, scalar in cases:
+        start = time.perf_counter()
+        x_min, _, iterations = batched()
+        batch_time = time.perf_counter() - start
+        start = time.perf_counter()
+        reference = np.array(scalar(), dtype=float)
+        scalar_time = time.perf_counter() - start
+        print(f"{title:>18} | {batch_time:9.4f} | {scalar_time:11.4f} | {iterations.max():11d} | "
+              f"{np.max(np.abs(x_min - reference)):13.2e}")
@@ -0,0 +1,34 @@
+"""Тестовые функции одномерных задач: (f, f', f'')."""
+import numpy as np
+
+
+# Функция Lab_1: F(x) = exp(x) + 1/x, минимум x* ~ 0.7035 на (0, +inf)
+def lab1(x):
+    return np.exp(x) + 1 / x
+
+
+def lab1_derivative(x):
+    return np.exp(x) - 1 / x ** 2
+
+
+def lab1_second_derivative(x):
+    return np.exp(x) + 2 / x ** 3
+
+
+# Невыпуклая x^4 - 3x^2 + x: два локальных минимума
+def quartic(x):
+    return x ** 4 - 3 * x ** 2 + x
+
+
+def quartic_derivative(x):
+    return 4 * x ** 3 - 6 * x + 1
+
+
+def quartic_second_derivative(x):
+    return 12 * x ** 2 - 6
+
+
+FUNCTIONS = {
+    "lab1": (lab1, lab1_derivative, lab1_second_derivative),
+    "quartic": (quartic, quartic_derivative, quartic_second_derivative),
+}
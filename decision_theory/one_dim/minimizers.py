@@ -0,0 +1,61 @@
+"""Одномерные методы с общим интерфейсом для реестра решателей.
+
+solver(func, a, b, eps=1e-6, derivative=None, second_derivative=None, trajectory=None, observer=None)
+    -> (x, f(x), итерации, траектория, вычислений f, f', f'' всего)
+Методам tangent и illinois нужна f', методам newton и safeguarded_newton — f' и f''.
+"""
+from .newton import CachedFunction, illinois, newton_method, safeguarded_newton, tangent_method
+from .search import brent, fibonacci_search, golden_section_search
+
+
+def _search(method):
+    def run(func, a, b, eps=1e-6, derivative=None, second_derivative=None, trajectory=None,
+            observer=None):
+        return method(func, a, b, eps, trajectory, observer=observer)
+    return run
+
+
+def _cached(func, derivative, second_derivative=None, second=False):
+    # Функция с кэшем значений и производных, чтобы посчитать все вычисления
+    if derivative is None or (second and second_derivative is None):
+        raise ValueError("Методу нужны производные: derivative" + (" и second_derivative." if second else "."))
+    return CachedFunction(func, derivative, second_derivative)
+
+
+def _tangent(func, a, b, eps=1e-6, derivative=None, second_derivative=None, trajectory=None,
+             observer=None):
+    fn = _cached(func, derivative)
+    x, value, iterations, traj = tangent_method(fn.f, fn.d1, a, b, eps, trajectory, observer)
+    return x, value, iterations, traj, fn.total_evaluations
+
+
+def _newton(func, a, b, eps=1e-6, derivative=None, second_derivative=None, trajectory=None,
+            observer=None):
+    # Метод Ньютона без защиты — из середины отрезка
+    fn = _cached(func, derivative, second_derivative, second=True)
+    x, value, iterations, traj = newton_method(fn.d1, fn.d2, (a + b) / 2, eps, trajectory, func=fn.f,
+                                       observer=observer)
+    return x, value, iterations, traj, fn.total_evaluations
+
+
+def _safeguarded_newton(func, a, b, eps=1e-6, derivative=None, second_derivative=None, trajectory=None,
+                        observer=None):
+    fn = _cached(func, derivative, second_derivative, second=True)
+    return safeguarded_newton(fn, a, b, eps=eps, trajectory=trajectory, observer=observer)
+
+
+def _illinois(func, a, b, eps=1e-6, derivative=None, second_derivative=None, trajectory=None,
+              observer=None):
+    fn = _cached(func, derivative)
+    return illinois(fn, a, b, eps=eps, trajectory=trajectory, observer=observer)
+
+
+SOLVERS = {
+    "golden_section": _search(golden_section_search),
+    "fibonacci": _search(fibonacci_search),
+    "brent": _search(brent),
+    "tangent": _tangent,
+    "newton": _newton,
+    "safeguarded_newton": _safeguarded_newton,
+    "illinois": _illinois,
+}
@@ -0,0 +1,235 @@
+"""Одномерные методы с производными: поиск точки f'(x) = 0.
+
+tangent_method (пересечение касательных на отрезке) и newton_method (метод Ньютона
+без защиты) — методы Lab_1; они возвращают (x, f(x), итерации, траектория).
+
+CachedFunction хранит f, f' и f'' в уже вычисленных точках, так что повторные
+обращения к той же точке (условие останова, значение в ответе, концы отрезка)
+не пересчитывают функцию и производные. Методы поддерживают отрезок [a, b],
+на концах которого f' меняет знак, и потому сходятся всегда:
+    safeguarded_newton — шаг Ньютона x - f'/f'', если f'' > 0 и шаг остаётся
+                         внутри отрезка и достаточно уменьшается, иначе деление
+                         отрезка пополам (невыпуклые участки не прерывают поиск);
+    illinois           — метод секущих для f' с сохранением отрезка
+                         (модификация Illinois), f'' не нужна; если один конец
+                         стоит несколько итераций подряд — деление пополам.
+Эти методы возвращают (x, f(x), итерации, траектория, вычислений f, f' и f'' всего).
+observer (observers.py) получает на итерации шаг; значение f — только у
+tangent_method (на концах отрезка оно уже известно).
+"""
+import numpy as np
+
+from ..trajectory import ArraySink
+
+METHODS = ("newton", "illinois")
+
+
+class CachedFunction:
+    """f и её производные df, d2f (если заданы) с кэшем по точкам.
+
+    evaluations — сколько раз вычислены f, f', f'' (по порядку производной).
+    """
+
+    def __init__(self, f, df, d2f=None):
+        self.funcs = (f, df, d2f)
+        self.cache = ({}, {}, {})
+        self.evaluations = [0, 0, 0]
+
+    def _get(self, order, x):
+        x = float(x)
+        cache = self.cache[order]
+        if x not in cache:
+            if self.funcs[order] is None:
+                raise ValueError(f"Производная порядка {order} не задана.")
+            self.evaluations[order] += 1
+            cache[x] = float(self.funcs[order](x))
+        return cache[x]
+
+    def f(self, x):
+        return self._get(0, x)
+
+    def d1(self, x):
+        return self._get(1, x)
+
+    def d2(self, x):
+        return self._get(2, x)
+
+    @property
+    def total_evaluations(self):
+        return sum(self.evaluations)
+
+
+# Метод касательных: значения f и f' в концах отрезка переносятся между итерациями,
+# на итерации f и f' вычисляются один раз — в новой точке xm
+def tangent_method(func, derivative, a, b, eps=1e-6, trajectory=None, observer=None):
+    i = 0
+    xm = 0
+    x_values = ArraySink() if trajectory is None else trajectory
+    fa, fb = func(a), func(b)
+    da, db = derivative(a), derivative(b)
+    if observer is not None:
+        observer.start("tangent")
+
+    while abs(b - a) > eps:
+        xm = (a * da - b * db - fa + fb) / (da - db)
+        x_values.record(xm)
+        fm, dm = func(xm), derivative(xm)
+
+        if dm > 0:
+            b, fb, db = xm, fm, dm
+        else:
+            a, fa, da = xm, fm, dm
+        i += 1
+        if observer is not None:
+            observer.event(i, fm, step=b - a)
+
+    if observer is not None:
+        observer.finish()
+    return xm, func(xm), i, x_values
+
+
+# Метод Ньютона для f'(x) = 0; при f''(x) = 0 возвращает (None, None, итерации, траектория).
+# func нужна только для значения в найденной точке
+def newton_method(derivative, second_derivative, x0, eps=1e-6, trajectory=None, func=None, observer=None):
+    xk = x0
+    iter = 0
+    x_values = ArraySink() if trajectory is None else trajectory
+    x_values.record(xk)
+    if observer is not None:
+        observer.start("newton")
+
+    while True:
+        iter += 1
+        df1 = derivative(xk)
+        d2f1 = second_derivative(xk)
+
+        if d2f1 == 0:
+            if observer is not None:
+                observer.finish()
+            return None, None, iter, x_values
+
+        xk_1 = xk - (df1 / d2f1)
+        x_values.record(xk_1)
+        if observer is not None:
+            observer.event(iter, None, step=abs(xk_1 - xk))
+
+        if abs(xk_1 - xk) < eps:
+            break
+
+        xk = xk_1
+
+    if observer is not None:
+        observer.finish()
+    return xk_1, None if func is None else func(xk_1), iter, x_values
+
+
+def _bracket(fn, a, b):
+    # Проверка отрезка: f'(a) < 0 < f'(b), иначе минимум внутри не гарантирован
+    if a > b:
+        a, b = b, a
+    if fn.d1(a) >= 0 or fn.d1(b) <= 0:
+        raise ValueError(f"Производная должна менять знак с - на + на отрезке [{a}, {b}].")
+    return a, b
+
+
+def safeguarded_newton(fn, a, b, x0=None, eps=1e-6, max_iter=100, trajectory=None, observer=None):
+    a, b = _bracket(fn, a, b)
+    x = (a + b) / 2 if x0 is None else min(max(x0, a), b)
+    traj = ArraySink() if trajectory is None else trajectory
+    traj.record(x)
+    step = previous_step = b - a
+    iterations = 0
+    if observer is not None:
+        observer.start("safeguarded_newton")
+    while iterations < max_iter:
+        iterations += 1
+        g = fn.d1(x)
+        if g == 0:
+            break
+        if g < 0:
+            a = x
+        else:
+            b = x
+        h = fn.d2(x)
+        # Ньютон, только если он уменьшает шаг вдвое по сравнению с позапрошлым
+        # и не выходит за отрезок; иначе — половина отрезка
+        newton_ok = h > 0 and a < x - g / h < b and abs(g / h) < abs(previous_step) / 2
+        previous_step = step
+        step = g / h if newton_ok else x - (a + b) / 2
+        x -= step
+        traj.record(x)
+        if observer is not None:
+            observer.event(iterations, None, step=abs(step), phase="newton" if newton_ok else "bisection")
+        if abs(step) < eps or b - a < eps:
+            break
+    if observer is not None:
+        observer.finish()
+    return x, fn.f(x), iterations, traj, fn.total_evaluations
+
+
+def illinois(fn, a, b, eps=1e-6, max_iter=100, trajectory=None, observer=None):
+    a, b = _bracket(fn, a, b)
+    ga, gb = fn.d1(a), fn.d1(b)
+    traj = ArraySink() if trajectory is None else trajectory
+    side = 0  # Какой конец сдвигался на прошлой итерации: -1 — a, +1 — b
+    repeats = 0  # Сколько итераций подряд сдвигается один и тот же конец
+    x = np.inf
+    iterations = 0
+    if observer is not None:
+        observer.start("illinois")
+    while iterations < max_iter:
+        iterations += 1
+        x_prev = x
+        if repeats < 3:
+            x = (a * gb - b * ga) / (gb - ga)  # Нуль секущей через (a, f'(a)) и (b, f'(b))
+        else:
+            x = (a + b) / 2  # Секущая не сдвигает второй конец — деление пополам
+        g = fn.d1(x)
+        traj.record(x)
+        if observer is not None:
+            observer.event(iterations, None, step=b - a, phase="secant" if repeats < 3 else "bisection")
+        if g == 0:
+            break
+        moved = 1 if g > 0 else -1
+        repeats = repeats + 1 if moved == side else 0
+        if g > 0:
+            b, gb = x, g
+            if side == 1:
+                ga /= 2  # Конец a застрял — его значение уменьшается вдвое
+        else:
+            a, ga = x, g
+            if side == -1:
+                gb /= 2
+        side = moved
+        if b - a < eps or x == x_prev:
+            break
+    if observer is not None:
+        observer.finish()
+    return x, fn.f(x), iterations, traj, fn.total_evaluations
+
+
+def minimize(fn, a, b, x0=None, method=None, eps=1e-6, max_iter=100, trajectory=None, observer=None):
+    """Минимум на [a, b]; method=None — Ньютон, если задана f'', иначе Illinois."""
+    if method is None:
+        method = "newton" if fn.funcs[2] is not None else "illinois"
+    if method == "newton":
+        return safeguarded_newton(fn, a, b, x0, eps, max_iter, trajectory, observer)
+    if method == "illinois":
+        return illinois(fn, a, b, eps, max_iter, trajectory, observer)
+    raise ValueError(f"Неизвестный метод {method!r}, допустимы: {', '.join(METHODS)}.")
+
+
+# Сравнение на F(x) = exp(x) + 1/x и на невыпуклой f(x) = x^4 - 3 x^2 + x
+if __name__ == "__main__":
+    problems = (
+        ("exp(x) + 1/x", lambda x: np.exp(x) + 1 / x, lambda x: np.exp(x) - 1 / x ** 2,
+         lambda x: np.exp(x) + 2 / x ** 3, 0.1, 2.0),
+        ("x^4 - 3x^2 + x", lambda x: x ** 4 - 3 * x ** 2 + x, lambda x: 4 * x ** 3 - 6 * x + 1,
+         lambda x: 12 * x ** 2 - 6, -2.0, 1.5),
+    )
+    for title, f, df, d2f, a, b in problems:
+        for method in METHODS:
+            fn = CachedFunction(f, df, d2f)
+            x, value, iterations, _, total = minimize(fn, a, b, method=method, eps=1e-10)
+            print(f"{title:>15} | {method:>8} | x = {x:.12f} | f = {value:.12f} | итераций {iterations:3d} | "
+                  f"f, f', f'': {fn.evaluations}")
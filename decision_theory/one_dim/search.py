@@ -0,0 +1,159 @@
+"""Одномерный поиск минимума без производных на отрезке [a, b].
+
+Методы золотого сечения и Фибоначчи выполняют одно вычисление func на итерации,
+метод Брента — параболическую интерполяцию с запасным шагом золотого сечения.
+Возвращают (x_min, f(x_min), итерации, траектория, вычислений func).
+observer (observers.py) получает на итерации лучшее значение и длину отрезка.
+"""
+import math
+
+import numpy as np
+
+from ..trajectory import ArraySink
+
+INV_PHI = (math.sqrt(5) - 1) / 2  # 1 / phi = 0.6180339887...
+
+
+# Метод золотого сечения. Отношение точное, поэтому внутренняя точка, оставшаяся
+# в новом отрезке, совпадает с одной из новых пробных точек и её значение
+# переносится: одно вычисление func на итерацию.
+# Возвращает (x_min, f(x_min), итерации, траектория, вычислений func)
+def golden_section_search(func, a, b, eps=1e-6, trajectory=None, observer=None):
+    iter_count = 0
+    x_values = ArraySink() if trajectory is None else trajectory
+
+    x1 = b - INV_PHI * (b - a)
+    x2 = a + INV_PHI * (b - a)
+    f1, f2 = func(x1), func(x2)
+    evaluations = 2
+    if observer is not None:
+        observer.start("golden_section")
+
+    while abs(b - a) > eps:
+        if f1 < f2:
+            b, x2, f2 = x2, x1, f1
+            x1 = b - INV_PHI * (b - a)
+            f1 = func(x1)
+        else:
+            a, x1, f1 = x1, x2, f2
+            x2 = a + INV_PHI * (b - a)
+            f2 = func(x2)
+        evaluations += 1
+
+        x_values.record((a + b) / 2)
+        iter_count += 1
+        if observer is not None:
+            observer.event(iter_count, min(f1, f2), step=b - a)
+
+    if observer is not None:
+        observer.finish()
+    x_min = (a + b) / 2
+    return x_min, func(x_min), iter_count, x_values, evaluations + 1
+
+
+# Метод Фибоначчи: точки делят отрезок в отношениях F_{k-2} / F_k и F_{k-1} / F_k,
+# число шагов выбирается заранее так, чтобы итоговый отрезок 2 (b - a) / F_n был не длиннее eps
+def fibonacci_search(func, a, b, eps=1e-6, trajectory=None, observer=None):
+    x_values = ArraySink() if trajectory is None else trajectory
+    fib = [1, 1, 2]
+    while fib[-1] < 2 * (b - a) / eps:
+        fib.append(fib[-1] + fib[-2])
+    n = len(fib) - 1
+
+    x1 = a + fib[n - 2] / fib[n] * (b - a)
+    x2 = a + fib[n - 1] / fib[n] * (b - a)
+    f1, f2 = func(x1), func(x2)
+    evaluations = 2
+    iter_count = 0
+    if observer is not None:
+        observer.start("fibonacci")
+
+    # На шаге k = 3 обе точки совпали бы с серединой — он не выполняется
+    for k in range(n, 3, -1):
+        if f1 < f2:
+            b, x2, f2 = x2, x1, f1
+            x1 = a + fib[k - 3] / fib[k - 1] * (b - a)
+            f1 = func(x1)
+        else:
+            a, x1, f1 = x1, x2, f2
+            x2 = a + fib[k - 2] / fib[k - 1] * (b - a)
+            f2 = func(x2)
+        evaluations += 1
+
+        x_values.record((a + b) / 2)
+        iter_count += 1
+        if observer is not None:
+            observer.event(iter_count, min(f1, f2), step=b - a)
+
+    if observer is not None:
+        observer.finish()
+    x_min = (a + b) / 2
+    return x_min, func(x_min), iter_count, x_values, evaluations + 1
+
+
+# Метод Брента: параболическая интерполяция по трём лучшим точкам, а если парабола
+# даёт шаг вне отрезка или медленно сходится — шаг золотого сечения
+def brent(func, a, b, eps=1e-6, trajectory=None, max_iter=500, observer=None):
+    x_values = ArraySink() if trajectory is None else trajectory
+    golden = 1 - INV_PHI
+    x = w = v = a + golden * (b - a)  # Лучшая, вторая и предыдущая вторая точки
+    fx = fw = fv = func(x)
+    evaluations = 1
+    d = e = 0.0  # Последний шаг и позапрошлый
+    iter_count = 0
+    if observer is not None:
+        observer.start("brent")
+
+    while iter_count < max_iter:
+        middle = (a + b) / 2
+        tol = math.sqrt(np.finfo(float).eps) * abs(x) + eps / 4
+        if abs(x - middle) <= 2 * tol - (b - a) / 2:
+            break
+        iter_count += 1
+
+        parabolic = False
+        if abs(e) > tol:
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            # Шаг параболы принимается, если он внутри отрезка и меньше половины позапрошлого
+            if abs(p) < abs(q * e / 2) and q * (a - x) < p < q * (b - x):
+                e, d = d, p / q
+                parabolic = True
+                if (x + d) - a < 2 * tol or b - (x + d) < 2 * tol:
+                    d = tol if middle >= x else -tol
+        if not parabolic:
+            e = (a - x) if x >= middle else (b - x)
+            d = golden * e
+
+        u = x + d if abs(d) >= tol else x + (tol if d > 0 else -tol)
+        fu = func(u)
+        evaluations += 1
+
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, fv, w, fw, x, fx = w, fw, x, fx, u, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, fv, w, fw = w, fw, u, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+
+        x_values.record(x)
+        if observer is not None:
+            observer.event(iter_count, fx, step=abs(d), phase="parabolic" if parabolic else "golden")
+
+    if observer is not None:
+        observer.finish()
+    return x, fx, iter_count, x_values, evaluations
@@ -0,0 +1,53 @@
+"""Реестр решателей по видам задач.
+
+Таблица решателей каждого вида лежит в модуле своего подпакета и
+импортируется только при обращении к этому виду: одномерные методы
+загружают лишь numpy, ЛП и транспортная задача — ещё и scipy.
+Общий интерфейс решателей вида описан в SIGNATURES; все решатели
+принимают ещё observer — приёмник событий итераций (observers.py).
+"""
+import importlib
+
+KINDS = {
+    "one_dim": "decision_theory.one_dim.minimizers",
+    "multidim": "decision_theory.multidim.minimizers",
+    "lp": "decision_theory.lp.solvers",
+    "transport": "decision_theory.transport.solvers",
+    "constrained": "decision_theory.constrained.solvers",
+}
+
+SIGNATURES = {
+    "one_dim": "(func, a, b, eps=1e-6, derivative=None, second_derivative=None, trajectory=None, observer=None)"
+               " -> (x, f(x), итерации, траектория, вычислений)",
+    "multidim": "(x0, objective, max_iter=None, epsilon=1e-6, trajectory=None, observer=None, **options)"
+                " -> (x, f(x), итерации, траектория, вычислений)",
+    "lp": "(c, A_ub=None, b_ub=None, A_eq=None, b_eq=None, bounds=None, **options) -> LPResult",
+    "transport": "(costs, supply, demand, **options) -> матрица перевозок (numpy или csr)",
+    "constrained": "(x0, objective, constraints, inner='lbfgs', **options) -> ConstrainedResult",
+}
+
+
+def solvers(kind):
+    if kind not in KINDS:
+        raise ValueError(f"Неизвестный вид задач {kind!r}, допустимы: {', '.join(KINDS)}.")
+    return importlib.import_module(KINDS[kind]).SOLVERS
+
+
+def names(kind):
+    return sorted(solvers(kind))
+
+
+def get(kind, name):
+    table = solvers(kind)
+    if name not in table:
+        raise ValueError(f"Неизвестный решатель {name!r} для {kind}, допустимы: {', '.join(sorted(table))}.")
+    return table[name]
+
+
+def register(kind, name, solver):
+    # Решатель с интерфейсом SIGNATURES[kind]; для мультистарта регистрировать до создания пула
+    solvers(kind)[name] = solver
+
+
+def solve(kind, name, *args, **options):
+    return get(kind, name)(*args, **options)
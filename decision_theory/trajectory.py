@@ -0,0 +1,121 @@
+"""Приёмники траектории для методов оптимизации всех лабораторных.
+
+Метод вызывает sink.record(x) на каждой итерации; что сохранить, решает приёмник:
+    NullSink()                    — ничего (только счётчик итераций);
+    ArraySink(every=k)            — каждая k-я точка в заранее выделенном массиве,
+                                    при заполнении массив удваивается;
+    ArraySink(filename="t.npy")   — то же в файле .npy через memmap (размер фиксирован,
+                                    лишние точки отбрасываются и считаются в dropped);
+    RingSink(size, every=k)       — последние size сохранённых точек.
+Точки копируются в готовый буфер, поэтому при выключенной или прореженной записи
+итерация не выделяет память. Приёмник ведёт себя как массив точек (np.asarray,
+len, индексация), так что графики строятся прямо по нему.
+"""
+import numpy as np
+
+
+class TrajectorySink:
+    """Базовый приёмник: every — сохранять каждую every-ю точку (первая сохраняется всегда)."""
+
+    def __init__(self, every=1):
+        if every < 1:
+            raise ValueError("every должно быть не меньше 1.")
+        self.every = every
+        self.seen = 0  # Сколько точек передано в record
+
+    def record(self, x):
+        if self.seen % self.every == 0:
+            self._store(x)
+        self.seen += 1
+
+    def _store(self, x):
+        pass
+
+    def points(self):
+        return np.empty(0)
+
+    def __array__(self, dtype=None, copy=None):
+        points = self.points()
+        return points if dtype is None else points.astype(dtype)
+
+    def __len__(self):
+        return len(self.points())
+
+    def __getitem__(self, index):
+        return self.points()[index]
+
+    def __iter__(self):
+        return iter(self.points())
+
+
+class NullSink(TrajectorySink):
+    """Запись выключена."""
+
+
+class _BufferSink(TrajectorySink):
+    # Общий буфер (capacity, *форма точки), выделяемый при первой записи
+    def __init__(self, capacity, every=1):
+        super().__init__(every)
+        self.capacity = capacity
+        self.buffer = None
+        self.size = 0
+
+    def _allocate(self, shape):
+        return np.empty((self.capacity,) + shape)
+
+    def _ensure(self, x):
+        if self.buffer is None:
+            self.buffer = self._allocate(np.shape(x))
+
+
+class ArraySink(_BufferSink):
+    """Полная (или прореженная) запись в массив numpy либо в memmap-файл .npy."""
+
+    def __init__(self, capacity=1024, every=1, filename=None):
+        super().__init__(capacity, every)
+        self.filename = filename
+        self.dropped = 0
+
+    def _allocate(self, shape):
+        if self.filename is None:
+            return super()._allocate(shape)
+        return np.lib.format.open_memmap(self.filename, mode="w+", dtype=float, shape=(self.capacity,) + shape)
+
+    def _store(self, x):
+        self._ensure(x)
+        if self.size == len(self.buffer):
+            if self.filename is not None:
+                self.dropped += 1
+                return
+            grown = np.empty((2 * len(self.buffer),) + self.buffer.shape[1:])
+            grown[:self.size] = self.buffer
+            self.buffer = grown
+        self.buffer[self.size] = x
+        self.size += 1
+
+    def points(self):
+        return np.empty(0) if self.buffer is None else self.buffer[:self.size]
+
+    def flush(self):
+        if isinstance(self.buffer, np.memmap):
+            self.buffer.flush()
+
+
+class RingSink(_BufferSink):
+    """Кольцевой буфер последних size сохранённых точек."""
+
+    def __init__(self, size, every=1):
+        super().__init__(size, every)
+
+    def _store(self, x):
+        self._ensure(x)
+        self.buffer[self.size % self.capacity] = x
+        self.size += 1
+
+    def points(self):
+        if self.buffer is None:
+            return np.empty(0)
+        if self.size <= self.capacity:
+            return self.buffer[:self.size]
+        start = self.size % self.capacity
+        return np.concatenate([self.buffer[start:], self.buffer[:start]])
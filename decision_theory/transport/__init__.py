@@ -0,0 +1,15 @@
+"""Транспортная задача и потоки минимальной стоимости (Lab_7)."""
+from .._lazy import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    "transportation_problem_solver": "potentials",
+    "potential_method": "potentials",
+    "min_cost_flow": "network_simplex",
+    "sparse_transport": "network_simplex",
+    "assignment": "network_simplex",
+    "read_costs": "loaders",
+    "read_vector": "loaders",
+    "load_transport": "loaders",
+    "csv_to_npy": "loaders",
+    "write_allocation": "loaders",
+})
@@ -0,0 +1,183 @@
+"""Начальные опорные планы транспортной задачи, учитывающие стоимости.
+
+Все методы принимают матрицу стоимостей costs (m x n) и списки supply,
+demand (изменяются на месте, как в northwest_corner_method) и возвращают
+матрицу распределения m x n.
+"""
+import heapq
+
+import numpy as np
+
+
+def least_cost_method(costs, supply, demand):
+    # Метод минимального элемента: клетки в порядке возрастания стоимости
+    rows, cols = costs.shape
+    allocation = np.zeros((rows, cols))
+    row_open = [s > 0 for s in supply]
+    col_open = [d > 0 for d in demand]
+    remaining = sum(row_open) + sum(col_open)
+
+    for cell in np.argsort(costs, axis=None, kind="stable"):
+        i, j = divmod(int(cell), cols)
+        if not (row_open[i] and col_open[j]):
+            continue
+        amount = min(supply[i], demand[j])
+        allocation[i, j] = amount
+        supply[i] -= amount
+        demand[j] -= amount
+        if supply[i] == 0:
+            row_open[i] = False
+            remaining -= 1
+        if demand[j] == 0:
+            col_open[j] = False
+            remaining -= 1
+        if remaining <= 0:
+            break
+
+    return allocation
+
+
+def vogel_approximation_method(costs, supply, demand):
+    # Метод Фогеля. Штраф строки (столбца) — разность двух наименьших стоимостей
+    # среди открытых столбцов (строк). Для каждой линии хранится порядок клеток по
+    # возрастанию стоимости и два указателя на первые открытые клетки; при закрытии
+    # линии пересчитываются только штрафы линий, указатели которых на неё смотрели.
+    # Линия с наибольшим штрафом берётся из кучи с ленивым удалением устаревших записей.
+    rows, cols = costs.shape
+    allocation = np.zeros((rows, cols))
+    amounts = [list(supply), list(demand)]  # side 0 — строки, side 1 — столбцы
+    is_open = [[a > 0 for a in amounts[0]], [a > 0 for a in amounts[1]]]
+    order = [np.argsort(costs, axis=1, kind="stable").astype(np.int32),
+             np.argsort(costs.T, axis=1, kind="stable").astype(np.int32)]
+    cost_of = [costs, costs.T]
+    size = [cols, rows]
+    first = [[0] * rows, [0] * cols]  # Позиции в order первых двух открытых клеток линии
+    second = [[0] * rows, [0] * cols]
+    watchers = [[set() for _ in range(rows)], [set() for _ in range(cols)]]  # Кто смотрит на линию
+    version = [[0] * rows, [0] * cols]
+    heap = []
+
+    def next_open(side, line, position):
+        other_open = is_open[1 - side]
+        line_order = order[side][line]
+        while position < size[side] and not other_open[line_order[position]]:
+            position += 1
+        return position
+
+    def penalty(side, line):
+        line_order = order[side][line]
+        p1, p2 = first[side][line], second[side][line]
+        if p1 >= size[side]:
+            return None
+        c1 = cost_of[side][line, line_order[p1]]
+        if p2 >= size[side]:
+            return c1  # Осталась одна открытая клетка
+        return cost_of[side][line, line_order[p2]] - c1
+
+    def refresh(side, line):
+        # Продвинуть указатели линии на открытые клетки, обновить наблюдателей и кучу
+        line_order = order[side][line]
+        for position in (first[side][line], second[side][line]):
+            if position < size[side]:
+                watchers[1 - side][line_order[position]].discard(line)
+        p1 = next_open(side, line, first[side][line])
+        p2 = next_open(side, line, max(second[side][line], p1 + 1))
+        first[side][line], second[side][line] = p1, p2
+        for position in (p1, p2):
+            if position < size[side]:
+                watchers[1 - side][line_order[position]].add(line)
+        version[side][line] += 1
+        value = penalty(side, line)
+        if value is not None:
+            heapq.heappush(heap, (-value, side, line, version[side][line]))
+
+    for side, count in ((0, rows), (1, cols)):
+        for line in range(count):
+            second[side][line] = 1
+            if is_open[side][line]:
+                refresh(side, line)
+
+    def close(side, line):
+        is_open[side][line] = False
+        version[side][line] += 1
+        for other in list(watchers[side][line]):
+            if is_open[1 - side][other]:
+                refresh(1 - side, other)
+
+    while heap:
+        _, side, line, stamp = heapq.heappop(heap)
+        if not is_open[side][line] or stamp != version[side][line]:
+            continue
+        other = int(order[side][line][first[side][line]])
+        i, j = (line, other) if side == 0 else (other, line)
+        amount = min(amounts[0][i], amounts[1][j])
+        allocation[i, j] = amount
+        amounts[0][i] -= amount
+        amounts[1][j] -= amount
+        if amounts[0][i] == 0:
+            close(0, i)
+        if amounts[1][j] == 0:
+            close(1, j)
+
+    supply[:] = amounts[0]
+    demand[:] = amounts[1]
+    return allocation
+
+
+def russell_method(costs, supply, demand):
+    # Метод Рассела: u_i, v_j — наибольшие стоимости в открытых строке и столбце,
+    # выбирается открытая клетка с наименьшей оценкой c_ij - u_i - v_j.
+    # Матрица оценок и минимумы по строкам обновляются только там, где изменились u, v
+    rows, cols = costs.shape
+    allocation = np.zeros((rows, cols))
+    row_open = np.array([s > 0 for s in supply])
+    col_open = np.array([d > 0 for d in demand])
+    is_open = row_open[:, None] & col_open[None, :]
+    u = np.where(is_open, costs, -np.inf).max(axis=1)
+    v = np.where(is_open, costs, -np.inf).max(axis=0)
+    delta = np.where(is_open, costs - u[:, None] - v[None, :], np.inf)
+    row_best = delta.argmin(axis=1)
+    row_min = delta[np.arange(rows), row_best]
+
+    while True:
+        i = int(np.argmin(row_min))
+        if not np.isfinite(row_min[i]):
+            break
+        j = int(row_best[i])
+
+        amount = min(supply[i], demand[j])
+        allocation[i, j] = amount
+        supply[i] -= amount
+        demand[j] -= amount
+        dirty = np.zeros(rows, dtype=bool)
+        if supply[i] == 0:
+            row_open[i] = False
+            delta[i] = np.inf
+            row_min[i] = np.inf
+            # Наибольшие стоимости столбцов, достигавшиеся в закрытой строке, уменьшаются
+            open_rows = np.flatnonzero(row_open)
+            open_cols = np.flatnonzero(col_open)
+            stale = open_cols[costs[i, open_cols] >= v[open_cols]]
+            if stale.size and open_rows.size:
+                v[stale] = costs[np.ix_(open_rows, stale)].max(axis=0)
+                delta[np.ix_(open_rows, stale)] = costs[np.ix_(open_rows, stale)] - u[open_rows, None] - v[stale]
+                dirty |= np.isin(row_best, stale)
+        if demand[j] == 0:
+            col_open[j] = False
+            delta[:, j] = np.inf
+            dirty |= row_best == j
+            open_rows = np.flatnonzero(row_open)
+            open_cols = np.flatnonzero(col_open)
+            stale = open_rows[costs[open_rows, j] >= u[open_rows]]
+            if stale.size and open_cols.size:
+                u[stale] = costs[np.ix_(stale, open_cols)].max(axis=1)
+                delta[np.ix_(stale, open_cols)] = costs[np.ix_(stale, open_cols)] - u[stale, None] - v[open_cols]
+                dirty[stale] = True
+
+        dirty &= row_open
+        if dirty.any():
+            update = np.flatnonzero(dirty)
+            row_best[update] = delta[update].argmin(axis=1)
+            row_min[update] = delta[update, row_best[update]]
+
+    return allocation
@@ -0,0 +1,137 @@
+"""Загрузка транспортных задач из файлов и запись планов перевозок.
+
+Стоимости:
+    .npy — np.load с mmap_mode="r": матрица отображается в память только
+           для чтения и не копируется (решатели её не изменяют);
+    .npz — разреженная матрица scipy.sparse (save_npz), хранимые элементы —
+           существующие маршруты;
+    .csv / .txt — построчное чтение: плотная матрица заполняется на месте
+           (первый проход считает строки), пустая ячейка — маршрута нет
+           (np.inf); sparse=True — только заданные ячейки, сразу в
+           буферы CSR (индексы столбцов, значения, начала строк).
+csv_to_npy переписывает CSV в .npy построчно через open_memmap, так что
+большая матрица ни разу не оказывается в памяти целиком.
+Запасы и потребности — .npy или текст (через запятую и/или по строкам).
+"""
+from array import array
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def _rows(path, delimiter):
+    # Строки CSV как массивы float; пустая ячейка — np.inf
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip() or line.startswith("#"):
+                continue
+            fields = line.rstrip("\r\n").split(delimiter)
+            try:
+                yield np.array(fields, dtype=float)
+            except ValueError:
+                yield np.array([float(value) if value.strip() else np.inf for value in fields])
+
+
+def _shape(path, delimiter):
+    # Первый проход: число строк и столбцов (по первой строке)
+    rows, cols = 0, None
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip() or line.startswith("#"):
+                continue
+            if cols is None:
+                cols = line.count(delimiter) + 1
+            rows += 1
+    return rows, cols or 0
+
+
+def _fill(target, path, delimiter):
+    rows, cols = target.shape
+    for i, row in enumerate(_rows(path, delimiter)):
+        if row.size != cols:
+            raise ValueError(f"{path}: в строке {i + 1} {row.size} значений вместо {cols}.")
+        target[i] = row
+    return target
+
+
+def read_costs(path, sparse=False, mmap=True, delimiter=","):
+    """Матрица стоимостей m x n из .npy, .npz или CSV.
+
+    .npy с mmap=True — отображение только для чтения (np.memmap);
+    CSV с sparse=True — csr_matrix из заданных ячеек, иначе плотный массив
+    с np.inf на месте пустых ячеек.
+    """
+    path = str(path)
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r" if mmap else None)
+    if path.endswith(".npz"):
+        return sp.load_npz(path).tocsr()
+    if not sparse:
+        return _fill(np.empty(_shape(path, delimiter)), path, delimiter)
+
+    indptr, indices, values = array("q", [0]), array("i"), array("d")
+    width = None
+    for i, row in enumerate(_rows(path, delimiter)):
+        width = row.size if width is None else width
+        if row.size != width:
+            raise ValueError(f"{path}: в строке {i + 1} {row.size} значений вместо {width}.")
+        present = np.flatnonzero(np.isfinite(row))
+        indices.frombytes(present.astype(np.int32).tobytes())
+        values.frombytes(row[present].tobytes())
+        indptr.append(len(values))
+    # Буферы передаются в csr_matrix без копирования
+    return sp.csr_matrix((np.frombuffer(values, dtype=float), np.frombuffer(indices, dtype=np.int32),
+                          np.frombuffer(indptr, dtype=np.int64)), shape=(len(indptr) - 1, width or 0))
+
+
+def csv_to_npy(csv_path, npy_path, delimiter=","):
+    """CSV стоимостей -> .npy построчно (для последующего read_costs с mmap). Возвращает (m, n)."""
+    shape = _shape(str(csv_path), delimiter)
+    target = np.lib.format.open_memmap(str(npy_path), mode="w+", dtype=float, shape=shape)
+    _fill(target, str(csv_path), delimiter)
+    target.flush()
+    del target
+    return shape
+
+
+def read_vector(path, delimiter=","):
+    """Запасы или потребности из .npy или текста (значения через запятую и/или по строкам)."""
+    path = str(path)
+    if path.endswith(".npy"):
+        return np.load(path).astype(float).ravel()
+    with open(path, encoding="utf-8") as file:
+        text = " ".join(line for line in file if not line.startswith("#"))
+    return np.array(text.replace(delimiter, " ").split(), dtype=float)
+
+
+def load_transport(costs_path, supply_path, demand_path, sparse=False, mmap=True, delimiter=","):
+    """(costs, supply, demand) для решателей транспортной задачи."""
+    costs = read_costs(costs_path, sparse, mmap, delimiter)
+    supply, demand = read_vector(supply_path, delimiter), read_vector(demand_path, delimiter)
+    if costs.shape != (supply.size, demand.size):
+        raise ValueError(f"Матрица стоимостей {costs.shape[0]} x {costs.shape[1]} не согласована с "
+                         f"{supply.size} запасами и {demand.size} потребностями.")
+    return costs, supply, demand
+
+
+def write_allocation(path, allocation, delimiter=","):
+    """План перевозок в файл.
+
+    .npy — плотная матрица; .npz — разреженная (save_npz); CSV — плотная
+    матрица построчно, а разреженная — тройками row,col,flow ненулевых перевозок.
+    """
+    path = str(path)
+    if path.endswith(".npz"):
+        sp.save_npz(path, sp.csr_matrix(allocation))
+        return
+    if path.endswith(".npy"):
+        np.save(path, allocation.toarray() if sp.issparse(allocation) else np.asarray(allocation))
+        return
+    with open(path, "w", encoding="utf-8") as file:
+        if sp.issparse(allocation):
+            coo = allocation.tocoo()
+            file.write(f"row{delimiter}col{delimiter}flow\n")
+            file.writelines(f"{i}{delimiter}{j}{delimiter}{value!r}\n"
+                            for i, j, value in zip(coo.row.tolist(), coo.col.tolist(), coo.data.tolist()))
+        else:
+            np.savetxt(file, np.asarray(allocation), delimiter=delimiter, fmt="%.17g")
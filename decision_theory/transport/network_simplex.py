@@ -0,0 +1,336 @@
+"""Сетевой симплекс-метод для задачи о потоке минимальной стоимости.
+
+Сеть задаётся списком дуг (tail, head, cost[, capacity]) и балансами узлов
+supply (> 0 — запас, < 0 — потребность). Память — O(узлов + дуг): плотные
+матрицы m x n не строятся, поэтому метод подходит для разреженных
+транспортных задач, где существует лишь малая часть маршрутов.
+
+Базис — остовное дерево с искусственным корнем: начальное дерево состоит из
+искусственных дуг «узел — корень» с большой стоимостью. Для дерева хранятся
+родитель, дуга к родителю, глубина, размеры поддеревьев и прямой порядок
+обхода, в котором каждое поддерево — непрерывный отрезок. Поэтому перенос
+поддерева при замене дуги, сдвиг его глубин и потенциалов выполняются
+срезами numpy, а циклом Python проходится только путь смены корня.
+Выходящая дуга выбирается по правилу сильно допустимых деревьев (Каннингем),
+что исключает зацикливание на вырожденных итерациях. Оценки просматриваются
+блоками дуг по кругу.
+
+observer (observers.py) получает на итерации стоимость потока вместе с
+искусственными дугами, величину сдвига потока по циклу и номера входящей и
+выходящей дуг (искусственные — arcs + номер узла).
+"""
+import math
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import scipy.sparse as sp
+
+OPTIMAL = 0
+ITERATION_LIMIT = 1
+INFEASIBLE = 2
+UNBOUNDED = 3
+
+MESSAGES = {
+    OPTIMAL: "Оптимальный поток найден.",
+    ITERATION_LIMIT: "Достигнут предел числа итераций.",
+    INFEASIBLE: "Балансы узлов не удаётся удовлетворить по существующим дугам.",
+    UNBOUNDED: "Стоимость не ограничена снизу (цикл отрицательной стоимости без ограничения пропускной способности).",
+}
+
+
+@dataclass
+class FlowResult:
+    flow: np.ndarray  # (arcs,) — потоки по дугам в порядке задания
+    cost: float
+    potentials: np.ndarray  # (nodes,) — двойственные оценки узлов
+    status: int
+    message: str
+    nit: int
+    time: float
+
+    @property
+    def success(self):
+        return self.status == OPTIMAL
+
+
+def min_cost_flow(tail, head, cost, supply, capacity=None, max_iter=None, block_size=None, tol=1e-9,
+                  observer=None):
+    """Поток минимальной стоимости: min sum cost_k x_k при балансах узлов supply.
+
+    tail, head — номера узлов начала и конца дуг (0..len(supply)-1),
+    capacity — пропускные способности (None — без ограничений).
+    Сумма supply должна быть равна нулю.
+    """
+    start = time.perf_counter()
+    supply = np.asarray(supply, dtype=float)
+    tail = np.asarray(tail, dtype=np.int64)
+    head = np.asarray(head, dtype=np.int64)
+    cost = np.asarray(cost, dtype=float)
+    nodes, arcs = supply.size, tail.size
+    if head.size != arcs or cost.size != arcs:
+        raise ValueError("Массивы tail, head и cost должны иметь одинаковую длину.")
+    if arcs and (min(tail.min(), head.min()) < 0 or max(tail.max(), head.max()) >= nodes):
+        raise ValueError("Номер узла дуги вне диапазона 0..len(supply)-1.")
+    if abs(supply.sum()) > 1e-9 * max(1.0, np.abs(supply).sum()):
+        raise ValueError("Сумма балансов узлов должна быть равна нулю.")
+    capacity = np.full(arcs, np.inf) if capacity is None else np.asarray(capacity, dtype=float)
+    if capacity.size != arcs or (capacity < 0).any():
+        raise ValueError("capacity должен содержать неотрицательное значение для каждой дуги.")
+
+    # Искусственная дуга arcs + k соединяет узел k с корнем в направлении его баланса
+    root = nodes
+    node_ids = np.arange(nodes)
+    source = supply >= 0
+    art_cost = (nodes + 1) * max(1.0, float(np.abs(cost).max()) if arcs else 1.0)
+    all_tail = np.concatenate([tail, np.where(source, node_ids, root)])
+    all_head = np.concatenate([head, np.where(source, root, node_ids)])
+    all_cost = np.concatenate([cost, np.full(nodes, art_cost)])
+    total = arcs + nodes
+    limit = tol * (1.0 + np.abs(all_cost))
+
+    # Состояние дуги: 0 — базисная, 1 — на нижней границе, -1 — на верхней
+    state = np.ones(total, dtype=np.int8)
+    state[arcs:] = 0
+    pi = np.zeros(nodes + 1)
+    pi[:nodes] = np.where(source, -art_cost, art_cost)
+
+    # Поиндексный доступ в цикле итераций быстрее через списки Python
+    tails, heads = all_tail.tolist(), all_head.tolist()
+    cap = capacity.tolist() + [math.inf] * nodes
+    flow = [0.0] * arcs + np.abs(supply).tolist()
+    # Дерево: родитель и дуга к нему, глубина, размер поддерева и прямой (preorder)
+    # порядок обхода order с позициями pos — поддерево узла занимает в order отрезок
+    parent = [root] * nodes + [-1]
+    pred = list(range(arcs, total)) + [-1]
+    depth = np.ones(nodes + 1, dtype=np.int64)
+    depth[root] = 0
+    size = [1] * nodes + [nodes + 1]
+    order = np.concatenate([[root], node_ids]).astype(np.int64)
+    pos = np.empty(nodes + 1, dtype=np.int64)
+    pos[order] = np.arange(nodes + 1)
+
+    if max_iter is None:
+        max_iter = 50 * total + 1000
+    if block_size is None:
+        block_size = max(1024, 16 * int(math.sqrt(total)))
+    starts = list(range(0, total, block_size))
+    current = 0
+    status = OPTIMAL
+    nit = 0
+    if observer is not None:
+        observer.start("network_simplex")
+        objective = art_cost * float(np.abs(supply).sum())
+    while True:
+        entering = -1
+        for _ in range(len(starts)):
+            first_arc = starts[current]
+            current = (current + 1) % len(starts)
+            block = slice(first_arc, first_arc + block_size)
+            violation = state[block] * (all_cost[block] + pi[all_tail[block]] - pi[all_head[block]])
+            k = int(np.argmin(violation))
+            if violation[k] < -limit[first_arc + k]:
+                entering = first_arc + k
+                break
+        if entering < 0:
+            break
+        if nit >= max_iter:
+            status = ITERATION_LIMIT
+            break
+        nit += 1
+
+        # Цикл: от join вниз к first, по входящей дуге к second, от second вверх к join
+        direction = int(state[entering])
+        first, second = (tails[entering], heads[entering]) if direction == 1 else (heads[entering], tails[entering])
+        a, b = first, second
+        while a != b:
+            if depth[a] >= depth[b]:
+                a = parent[a]
+            else:
+                b = parent[b]
+        join = a
+
+        delta = cap[entering]
+        leaving_node, side = -1, 0
+        node = first
+        while node != join:
+            arc = pred[node]
+            d = cap[arc] - flow[arc] if heads[arc] == node else flow[arc]
+            if d < delta:
+                delta, leaving_node, side = d, node, 1
+            node = parent[node]
+        node = second
+        while node != join:
+            arc = pred[node]
+            d = cap[arc] - flow[arc] if tails[arc] == node else flow[arc]
+            if d <= delta:
+                delta, leaving_node, side = d, node, 2
+            node = parent[node]
+        if delta == math.inf:
+            status = UNBOUNDED
+            break
+
+        if delta > 0:
+            flow[entering] += direction * delta
+            node = first
+            while node != join:
+                arc = pred[node]
+                flow[arc] += delta if heads[arc] == node else -delta
+                node = parent[node]
+            node = second
+            while node != join:
+                arc = pred[node]
+                flow[arc] += delta if tails[arc] == node else -delta
+                node = parent[node]
+
+        if observer is not None:
+            # Стоимость меняется на delta * приведённую стоимость цикла
+            objective += direction * delta * (all_cost[entering] + pi[tails[entering]] - pi[heads[entering]])
+            observer.event(nit, objective, step=delta, entering=entering,
+                           leaving=None if side == 0 else pred[leaving_node])
+
+        if side == 0:
+            state[entering] = -direction  # Дуга перешла на другую границу, дерево не меняется
+            continue
+
+        leaving = pred[leaving_node]
+        at_lower = flow[leaving] <= 0.5 * cap[leaving]
+        state[leaving] = 1 if at_lower else -1
+        flow[leaving] = 0.0 if at_lower else cap[leaving]  # Снимаем погрешность округления
+        state[entering] = 0
+
+        # Отрезанное поддерево S (корень leaving_node) перевешивается за входящую дугу
+        # с новым корнем inner. Стебель inner = w_0, w_1, ..., w_k = leaving_node меняет
+        # направление; остальные узлы S сохраняют родителей.
+        inner, outer = (first, second) if side == 1 else (second, first)
+        stem = [inner]
+        while stem[-1] != leaving_node:
+            stem.append(parent[stem[-1]])
+        sizes = [size[w] for w in stem]
+        places = pos[stem].tolist()
+        total_size = sizes[-1]
+        head_pos = places[-1]
+
+        # Новый прямой порядок S: поддерево w_0, затем для каждого w_i — его поддерево
+        # без ветви w_{i-1}; глубины кусков сдвигаются на base + 2i
+        parts = [order[places[0]:places[0] + sizes[0]]]
+        for i in range(1, len(stem)):
+            lower, upper = places[i - 1], places[i]
+            parts.append(order[upper:lower])
+            parts.append(order[lower + sizes[i - 1]:upper + sizes[i]])
+        moved = np.concatenate(parts)
+        base = int(depth[outer]) + 1 - int(depth[inner])
+        lengths = np.diff(sizes, prepend=0)
+        depth[moved] += np.repeat(base + 2 * np.arange(len(stem)), lengths)
+
+        # Размеры меняются только на путях до join: выше него уход и приход S взаимно гасятся
+        node = parent[leaving_node]
+        while node != join:
+            size[node] -= total_size
+            node = parent[node]
+        node = outer
+        while node != join:
+            size[node] += total_size
+            node = parent[node]
+        for i in range(len(stem) - 1, 0, -1):
+            parent[stem[i]], pred[stem[i]] = stem[i - 1], pred[stem[i - 1]]
+            size[stem[i]] = total_size - sizes[i - 1]
+        parent[inner], pred[inner] = outer, entering
+        size[inner] = total_size
+
+        # S вставляется в прямой порядок сразу после outer
+        target = int(pos[outer])
+        if target < head_pos:
+            lo, hi = target + 1, head_pos + total_size
+            order[lo:hi] = np.concatenate([moved, order[lo:head_pos]])
+        else:
+            lo, hi = head_pos, target + 1
+            order[lo:hi] = np.concatenate([order[head_pos + total_size:hi], moved])
+        pos[order[lo:hi]] = np.arange(lo, hi)
+
+        reduced = all_cost[entering] + pi[tails[entering]] - pi[heads[entering]]
+        pi[moved] += reduced if inner == heads[entering] else -reduced
+
+    if status == UNBOUNDED and arcs:
+        # Неограниченность имеет смысл только для допустимой задачи: проверка потоком нулевой стоимости
+        check = min_cost_flow(tail, head, np.zeros(arcs), supply, capacity, max_iter, block_size, tol)
+        if check.status == INFEASIBLE:
+            status = INFEASIBLE
+    if observer is not None:
+        observer.finish()
+    flow = np.array(flow)
+    if status == OPTIMAL and (flow[arcs:] > tol * max(1.0, np.abs(supply).max())).any():
+        status = INFEASIBLE
+    return FlowResult(flow=flow[:arcs], cost=float(cost @ flow[:arcs]), potentials=pi[:nodes] - pi[root],
+                      status=status, message=MESSAGES[status], nit=nit, time=time.perf_counter() - start)
+
+
+def _lanes(lanes):
+    # Маршруты: разреженная матрица m x n (хранимые элементы — существующие маршруты)
+    # или тройка массивов (rows, cols, costs)
+    if sp.issparse(lanes):
+        lanes = lanes.tocoo()
+        return lanes.row.astype(np.int64), lanes.col.astype(np.int64), lanes.data.astype(float)
+    rows, cols, costs = (np.asarray(part) for part in lanes)
+    return rows.astype(np.int64), cols.astype(np.int64), costs.astype(float)
+
+
+def sparse_transport(lanes, supply, demand, capacity=None, **options):
+    """Разреженная транспортная задача сетевым симплекс-методом.
+
+    lanes — матрица стоимостей scipy.sparse (m x n) или тройка (rows, cols, costs);
+    capacity — ограничения перевозок по маршрутам в том же порядке
+    (для матрицы — в порядке элементов tocoo()). Открытая задача дополняется
+    фиктивным узлом, связанным со всеми поставщиками или потребителями.
+    Возвращает матрицу перевозок csr m x n (как transportation_problem_solver,
+    но в разреженном виде) и FlowResult.
+    """
+    rows, cols, costs = _lanes(lanes)
+    supply = np.asarray(supply, dtype=float)
+    demand = np.asarray(demand, dtype=float)
+    m, n = supply.size, demand.size
+    tail, head = rows, m + cols
+    balances = np.concatenate([supply, -demand])
+    difference = supply.sum() - demand.sum()
+    if abs(difference) > 1e-12 * max(supply.sum(), demand.sum(), 1.0):
+        dummy = m + n
+        if difference > 0:
+            tail = np.concatenate([tail, np.arange(m)])
+            head = np.concatenate([head, np.full(m, dummy)])
+        else:
+            tail = np.concatenate([tail, np.full(n, dummy)])
+            head = np.concatenate([head, m + np.arange(n)])
+        extra = tail.size - rows.size
+        costs = np.concatenate([costs, np.zeros(extra)])
+        if capacity is not None:
+            capacity = np.concatenate([np.asarray(capacity, dtype=float), np.full(extra, np.inf)])
+        balances = np.append(balances, -difference)
+
+    result = min_cost_flow(tail, head, costs, balances, capacity=capacity, **options)
+    result.flow = result.flow[:rows.size]
+    result.potentials = result.potentials[:m + n]
+    result.cost = float(costs[:rows.size] @ result.flow)
+    flows = sp.csr_matrix((result.flow, (rows, cols)), shape=(m, n))
+    flows.eliminate_zeros()
+    return flows, result
+
+
+def assignment(lanes, **options):
+    """Задача о назначениях: каждой строке — не более одного столбца и наоборот,
+    назначаются min(m, n) пар. lanes — как в sparse_transport.
+
+    Возвращает массив столбцов, назначенных строкам (-1 — без назначения), и FlowResult.
+    """
+    rows, cols, costs = _lanes(lanes)
+    if sp.issparse(lanes):
+        m, n = lanes.shape
+    else:
+        m, n = int(rows.max()) + 1, int(cols.max()) + 1
+    supply = np.ones(m)
+    demand = np.ones(n)
+    flows, result = sparse_transport((rows, cols, costs), supply, demand, **options)
+    flows = flows.tocoo()
+    col_of_row = np.full(m, -1)
+    chosen = flows.data > 0.5
+    col_of_row[flows.row[chosen]] = flows.col[chosen]
+    return col_of_row, result
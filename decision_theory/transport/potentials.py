@@ -0,0 +1,392 @@
+"""Транспортная задача методом потенциалов (Lab_7).
+
+Начальный опорный план — северо-западный угол или методы из initial_solutions.py,
+затем метод потенциалов на остовном дереве базисных клеток. observer
+(observers.py) получает на каждой замене базиса стоимость плана, theta и
+номера входящей и выходящей клеток (i * n + j), а transportation_problem_solver
+передаёт ему ещё таблицы распределения; verbose=True без observer — печать
+таблиц на экран (ConsoleObserver).
+
+Маршрута нет (стоимость np.inf) — клетке назначается штраф M (метод
+большого M): цикл плана проходит не больше 2 min(m, n) клеток, поэтому при
+M больше суммы стольких наибольших стоимостей оптимум обходит такие клетки,
+если допустимый план вообще существует, а иначе остаётся перевозка по
+несуществующему маршруту — тогда ValueError.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+from ..observers import ConsoleObserver
+from .initial_solutions import least_cost_method, russell_method, vogel_approximation_method
+
+PRICING_CELLS = 65536  # Размер блока строк при частичном просмотре оценок (клеток за шаг)
+DEGENERATE_LIMIT = 50  # После стольких вырожденных замен подряд — правило Бланда
+
+def northwest_corner_method(supply, demand):
+    rows, cols = len(supply), len(demand)
+    allocation = np.zeros((rows, cols))
+
+    i, j = 0, 0
+    while i < rows and j < cols:
+        allocation[i, j] = min(supply[i], demand[j])
+        supply[i] -= allocation[i, j]
+        demand[j] -= allocation[i, j]
+
+        # Если исчерпаны и запас, и спрос, сдвигаемся сразу по обоим индексам;
+        # недостающая нулевая базисная клетка добавляется в complete_basis
+        exhausted_row = supply[i] == 0
+        exhausted_col = demand[j] == 0
+        if exhausted_row:
+            i += 1
+        if exhausted_col:
+            j += 1
+
+    return allocation
+
+# Методы построения начального опорного плана: (costs, supply, demand) -> allocation
+INITIAL_METHODS = {
+    "northwest": lambda costs, supply, demand: northwest_corner_method(supply, demand),
+    "least_cost": least_cost_method,
+    "vogel": vogel_approximation_method,
+    "russell": russell_method,
+}
+
+INITIAL_METHOD_TITLES = {
+    "northwest": "метода северо-западного угла",
+    "least_cost": "метода минимального элемента",
+    "vogel": "метода Фогеля",
+    "russell": "метода Рассела",
+}
+
+
+def forbid_routes(costs):
+    # Стоимости с штрафом M вместо np.inf и маска отсутствующих маршрутов (None, если все есть)
+    finite = np.isfinite(costs)
+    if finite.all():
+        return costs, None
+    largest = np.abs(costs[finite]).max() if finite.any() else 0.0
+    penalty = 2 * (min(costs.shape) + 1) * largest + 1.0  # +1 — фиктивный пункт балансировки
+    return np.where(finite, costs, penalty), ~finite
+
+
+def balance(costs, supply, demand):
+    # Открытая задача приводится к закрытой: при избытке запасов добавляется
+    # фиктивный потребитель, при избытке спроса — фиктивный поставщик с нулевыми стоимостями
+    total_supply, total_demand = sum(supply), sum(demand)
+    difference = total_supply - total_demand
+    if abs(difference) <= 1e-12 * max(total_supply, total_demand, 1.0):
+        return costs, supply, demand
+    rows, cols = costs.shape
+    if difference > 0:
+        return np.hstack([costs, np.zeros((rows, 1))]), supply, demand + [difference]
+    return np.vstack([costs, np.zeros((1, cols))]), supply + [-difference], demand
+
+
+def complete_basis(costs, allocation):
+    # Базисные клетки опорного плана: положительные клетки дополняются нулевыми
+    # (epsilon-клетками) до остовного дерева из m + n - 1 ребра.
+    # Компоненты связности ведутся системой непересекающихся множеств
+    rows, cols = allocation.shape
+    root = list(range(rows + cols))
+
+    def find(node):
+        while root[node] != node:
+            root[node] = root[root[node]]
+            node = root[node]
+        return node
+
+    basic_cells = []
+    for i, j in zip(*np.nonzero(allocation)):
+        a, b = find(i), find(rows + j)
+        if a == b:
+            raise ValueError("План не опорный: положительные клетки образуют цикл.")
+        root[a] = b
+        basic_cells.append((int(i), int(j)))
+
+    # Каждая компонента присоединяется к компоненте строки 0 самой дешёвой клеткой:
+    # по столбцу компоненты, а если столбцов в ней нет (одиночная строка) — по её строке
+    main_rows = np.zeros(rows, dtype=bool)
+    main_cols = np.zeros(cols, dtype=bool)
+    members = {}
+    for node in range(rows + cols):
+        members.setdefault(find(node), []).append(node)
+    main = members.pop(find(0))
+    for node in main:
+        if node < rows:
+            main_rows[node] = True
+        else:
+            main_cols[node - rows] = True
+    pending = sorted(members.values(), key=lambda nodes: nodes[-1] < rows)  # Сначала компоненты со столбцами
+    for nodes in pending:
+        column = next((node - rows for node in nodes if node >= rows), None)
+        if column is not None:
+            candidates = np.flatnonzero(main_rows)
+            i = int(candidates[np.argmin(costs[candidates, column])])
+            basic_cells.append((i, column))
+        else:
+            candidates = np.flatnonzero(main_cols)
+            j = int(candidates[np.argmin(costs[nodes[0], candidates])])
+            basic_cells.append((nodes[0], j))
+        for node in nodes:
+            if node < rows:
+                main_rows[node] = True
+            else:
+                main_cols[node - rows] = True
+    return basic_cells
+
+
+def build_tree(allocation, basic_cells):
+    # Базис — остовное дерево на вершинах-строках 0..m-1 и вершинах-столбцах m..m+n-1;
+    # каждая базисная клетка (i, j) — ребро между вершинами i и m + j
+    rows, cols = allocation.shape
+    adjacency = [set() for _ in range(rows + cols)]
+    is_basic = np.zeros((rows, cols), dtype=bool)
+    for i, j in basic_cells:
+        adjacency[i].add(rows + j)
+        adjacency[rows + j].add(i)
+        is_basic[i, j] = True
+    return adjacency, is_basic
+
+
+def calculate_potentials(costs, adjacency):
+    # Потенциалы u_i + v_j = c_ij на базисных клетках за один обход дерева из вершины 0;
+    # попутно запоминаются родитель и глубина каждой вершины для поиска цикла
+    rows, cols = costs.shape
+    u = [0.0] * rows
+    v = [0.0] * cols
+    parent = [-1] * (rows + cols)
+    depth = [0] * (rows + cols)
+    visited = [False] * (rows + cols)
+    visited[0] = True  # Задаем базовый потенциал u[0] = 0
+    stack = [0]
+    while stack:
+        node = stack.pop()
+        for neighbor in adjacency[node]:
+            if visited[neighbor]:
+                continue
+            visited[neighbor] = True
+            parent[neighbor] = node
+            depth[neighbor] = depth[node] + 1
+            if node < rows:
+                v[neighbor - rows] = costs[node, neighbor - rows] - u[node]
+            else:
+                u[neighbor] = costs[neighbor, node - rows] - v[node - rows]
+            stack.append(neighbor)
+    if not all(visited):
+        raise ValueError("Базисные клетки не образуют остовное дерево.")
+    return np.array(u), np.array(v), parent, depth
+
+
+def update_tree(costs, adjacency, parent, depth, u, v, entering, leaving):
+    # Замена ребра дерева: leaving покидает базис, entering входит.
+    # Меняются только родители и глубины отрезанного поддерева (один его обход
+    # от входящего ребра), а потенциалы поддерева сдвигаются на одну константу
+    rows = costs.shape[0]
+    li, lj = leaving
+    child = li if parent[li] == rows + lj else rows + lj
+    adjacency[li].discard(rows + lj)
+    adjacency[rows + lj].discard(li)
+
+    i, j = entering
+    adjacency[i].add(rows + j)
+    adjacency[rows + j].add(i)
+
+    # Какой конец входящего ребра лежит в отрезанном поддереве
+    node = i
+    while depth[node] > depth[child]:
+        node = parent[node]
+    inner, outer = (i, rows + j) if node == child else (rows + j, i)
+
+    # Сдвиг потенциалов, при котором u_i + v_j = c_ij на входящей клетке
+    shift = costs[i, j] - u[i] - v[j]
+    if inner >= rows:
+        shift = -shift
+
+    parent[inner] = outer
+    subtree = [inner]
+    stack = [inner]
+    while stack:
+        node = stack.pop()
+        up = parent[node]
+        depth[node] = depth[up] + 1
+        for neighbor in adjacency[node]:
+            if neighbor != up:
+                parent[neighbor] = node
+                subtree.append(neighbor)
+                stack.append(neighbor)
+
+    subtree = np.array(subtree)
+    u[subtree[subtree < rows]] += shift
+    v[subtree[subtree >= rows] - rows] -= shift
+
+
+def find_entering_cell(costs, u, v, is_basic, row_slice=slice(None), tol=1e-9, bland=False):
+    # Оценки u_i + v_j - c_ij по блоку строк; входит клетка с наибольшей положительной оценкой,
+    # а при bland=True — первая по порядку клетка с положительной оценкой
+    delta = u[row_slice, None] + v[None, :] - costs[row_slice]
+    delta[is_basic[row_slice]] = 0
+    if bland:
+        positive = (delta > tol * np.maximum(1.0, np.abs(costs[row_slice]))).ravel()
+        if not positive.any():
+            return None
+        i, j = np.unravel_index(np.argmax(positive), delta.shape)
+        return (row_slice.start or 0) + i, j
+    i, j = np.unravel_index(np.argmax(delta), delta.shape)
+    if delta[i, j] <= tol * max(1.0, abs(costs[row_slice][i, j])):
+        return None
+    return (row_slice.start or 0) + i, j
+
+
+def find_cycle(parent, depth, rows, start):
+    # Цикл = входящая клетка + путь в дереве от столбца j до строки i
+    i, j = start
+    a, b = rows + j, i
+    head, tail = [a], [b]
+    while a != b:
+        if depth[a] >= depth[b]:
+            a = parent[a]
+            head.append(a)
+        else:
+            b = parent[b]
+            tail.append(b)
+    path = head + tail[-2::-1]
+    cycle = [(i, j)]
+    for x, y in zip(path, path[1:]):
+        cycle.append((x, y - rows) if x < rows else (y, x - rows))
+    return cycle
+
+
+def adjust_allocation(allocation, cycle):
+    # Сдвиг по циклу на theta; возвращает клетку, покидающую базис, и theta.
+    # Из клеток с равным наименьшим значением уходит первая по порядку (правило Бланда)
+    minus = cycle[1::2]
+    theta = min(allocation[i, j] for i, j in minus)
+    leaving = min(cell for cell in minus if allocation[cell] == theta)
+
+    for k_cell, (i, j) in enumerate(cycle):
+        if k_cell % 2 == 0:
+            allocation[i, j] += theta
+        else:
+            allocation[i, j] -= theta
+    allocation[leaving] = 0.0
+
+    return leaving, theta
+
+
+def plan_cost(costs, allocation):
+    # Стоимость плана по занятым клеткам (у пустых клеток стоимость может быть np.inf);
+    # план и стоимости могут быть scipy.sparse — тогда плотная матрица не строится
+    if not (sp.issparse(allocation) or sp.issparse(costs)):
+        used = allocation != 0
+        return float(np.sum(allocation[used] * costs[used]))
+    if sp.issparse(allocation):
+        flows = allocation.tocoo()
+        used = flows.data != 0
+        rows, cols, flow = flows.row[used], flows.col[used], flows.data[used]
+    else:
+        allocation = np.asarray(allocation, dtype=float)
+        rows, cols = np.nonzero(allocation)
+        flow = allocation[rows, cols]
+    route = np.asarray(costs.tocsr()[rows, cols]).ravel() if sp.issparse(costs) else costs[rows, cols]
+    return float(np.sum(flow * route))
+
+
+def potential_method(costs, allocation, basic_cells=None, max_iter=None, observer=None):
+    # Метод потенциалов от опорного плана allocation (изменяется на месте).
+    # basic_cells — базис из m + n - 1 клеток; по умолчанию строится complete_basis,
+    # так что вырожденный план дополняется нулевыми базисными клетками.
+    # После DEGENERATE_LIMIT вырожденных замен подряд вход и выход выбираются
+    # по правилу Бланда, что исключает зацикливание. Возвращает число итераций
+    rows, cols = costs.shape
+    if basic_cells is None:
+        basic_cells = complete_basis(costs, allocation)
+    if len(basic_cells) != rows + cols - 1:
+        raise ValueError("Базис должен состоять из m + n - 1 клеток.")
+    if max_iter is None:
+        max_iter = 100 * (rows + cols) + 1000
+    adjacency, is_basic = build_tree(allocation, basic_cells)
+    u, v, parent, depth = calculate_potentials(costs, adjacency)
+
+    # Оценки просматриваются блоками строк по кругу; оптимум — когда ни в одном блоке нет положительных
+    block = max(1, min(rows, PRICING_CELLS // cols))
+    starts = list(range(0, rows, block))
+    current = 0
+    iterations = 0
+    degenerate = 0
+    if observer is not None:
+        observer.start("potentials")
+        cost = plan_cost(costs, allocation)
+    while True:
+        bland = degenerate > DEGENERATE_LIMIT
+        if bland:
+            current = 0  # Правилу Бланда нужен просмотр с первой клетки
+        entering_cell = None
+        for _ in range(len(starts)):
+            first = starts[current]
+            current = (current + 1) % len(starts)
+            entering_cell = find_entering_cell(costs, u, v, is_basic, slice(first, first + block), bland=bland)
+            if entering_cell is not None:
+                break
+
+        if entering_cell is None:
+            if observer is not None:
+                observer.finish()
+            return iterations
+        if iterations >= max_iter:
+            raise RuntimeError(f"Метод потенциалов не сошёлся за {max_iter} итераций.")
+
+        cycle = find_cycle(parent, depth, rows, entering_cell)
+        leaving_cell, theta = adjust_allocation(allocation, cycle)
+        if observer is not None:
+            # Стоимость плана убывает на theta * оценку входящей клетки
+            i, j = entering_cell
+            cost -= theta * (u[i] + v[j] - costs[i, j])
+            observer.event(iterations + 1, cost, step=theta, entering=i * cols + j,
+                           leaving=leaving_cell[0] * cols + leaving_cell[1], phase="bland" if bland else "main")
+        update_tree(costs, adjacency, parent, depth, u, v, entering_cell, leaving_cell)
+        is_basic[leaving_cell] = False
+        is_basic[entering_cell] = True
+        iterations += 1
+        degenerate = degenerate + 1 if theta == 0 else 0
+
+
+def transportation_problem_solver(costs, supply, demand, verbose=True, initial_method="northwest", observer=None):
+    if initial_method not in INITIAL_METHODS:
+        raise ValueError(f"Неизвестный метод начального плана {initial_method!r}, "
+                         f"допустимы: {', '.join(INITIAL_METHODS)}.")
+    costs = np.asarray(costs, dtype=float)
+    rows, cols = costs.shape
+    supply = [float(s) for s in supply]
+    demand = [float(d) for d in demand]
+    if min(supply + demand) < 0:
+        raise ValueError("Запасы и потребности должны быть неотрицательными.")
+    original = costs
+    costs, forbidden = forbid_routes(costs)
+    costs, supply, demand = balance(costs, supply, demand)
+    headers = [f"D{j+1}" for j in range(cols)] + ["Фикт."] * (costs.shape[1] - cols)
+    title = INITIAL_METHOD_TITLES[initial_method]
+    if observer is None and verbose:
+        observer = ConsoleObserver(events=False)
+    if observer is not None and costs.shape != (rows, cols):
+        side = "потребитель" if costs.shape[1] > cols else "поставщик"
+        observer.message(f"\nЗадача открытая: добавлен фиктивный {side} с нулевыми стоимостями.")
+
+    allocation = INITIAL_METHODS[initial_method](costs, supply, demand)
+    if observer is not None:
+        observer.table(f"Матрица распределения после {title}:", allocation, headers)
+        observer.message(f"\nСтоимость после {title}: {plan_cost(original, allocation[:rows, :cols])}")
+
+    iterations = potential_method(costs, allocation, observer=observer)
+    if forbidden is not None:
+        tol = 1e-9 * max(max(supply), 1.0)
+        if np.any(allocation[:rows, :cols][forbidden] > tol):
+            raise ValueError("Допустимого плана нет: часть груза можно провезти только по отсутствующим маршрутам.")
+        allocation[:rows, :cols][forbidden] = 0.0
+
+    if observer is not None:
+        observer.table("Матрица распределения после оптимизации:", allocation, headers)
+        observer.message(f"\nСтоимость после оптимизации: {plan_cost(original, allocation[:rows, :cols])}")
+        observer.message(f"Количество итераций метода потенциалов: {iterations}")
+
+    # Перевозки фиктивного пункта — недовезённый груз или неудовлетворённый спрос
+    return allocation[:rows, :cols]
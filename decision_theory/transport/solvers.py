@@ -0,0 +1,44 @@
+"""Решатели транспортной задачи для реестра.
+
+solver(costs, supply, demand, **options) -> матрица перевозок m x n: numpy у
+potentials, csr у network_simplex (dense=True — numpy).
+Открытые задачи балансируются фиктивным пунктом, его перевозки в ответ не входят.
+costs — плотная матрица (np.inf — маршрута нет, в том числе np.memmap из
+loaders.read_costs) или scipy.sparse, где хранимые элементы — маршруты.
+"""
+import numpy as np
+import scipy.sparse as sp
+
+from .network_simplex import sparse_transport
+from .potentials import transportation_problem_solver
+
+
+def potentials(costs, supply, demand, initial_method="northwest", observer=None):
+    # Отсутствующие маршруты (np.inf) метод потенциалов обходит штрафом M
+    if sp.issparse(costs):
+        coo = costs.tocoo()
+        costs = np.full(coo.shape, np.inf)
+        costs[coo.row, coo.col] = coo.data
+    return transportation_problem_solver(costs, supply, demand, verbose=False, initial_method=initial_method,
+                                         observer=observer)
+
+
+def network_simplex(costs, supply, demand, dense=False, **options):
+    # Маршруты — конечные элементы costs (np.inf — маршрута нет) или хранимые элементы разреженной матрицы;
+    # план остаётся разреженным (m + n - 1 перевозок), плотный — только по dense=True
+    if sp.issparse(costs):
+        lanes = costs
+    else:
+        costs = np.asarray(costs, dtype=float)
+        rows, cols = np.nonzero(np.isfinite(costs))
+        lanes = (rows, cols, costs[rows, cols])
+    flows, result = sparse_transport(lanes, supply, demand, **options)
+    if not result.success:
+        raise RuntimeError(result.message)
+    return flows.toarray() if dense else flows
+
+
+SOLVERS = {
+    "potentials": potentials,
+    "network_simplex": network_simplex,
+}